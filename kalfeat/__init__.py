@@ -21,24 +21,35 @@ before any drilling locations. The aim of kalfeat is twofold::
 """
 import os 
 import sys 
+import importlib 
 
 __version__='0.1.0'
 __author__='Kouadio Laurent' 
 
-from . import (  
-    _kalfeatlog, 
-    methods, 
-    tools,
-    decorators, 
-    documentation, 
-    exceptions, 
-    property, 
-    sklearn,
-    typing, 
-    __main__, 
-    
+# The subpackages and modules are loaded on first attribute access e.g. 
+# ``kalfeat.methods`` so that ``import kalfeat`` does not pull the heavy 
+# dependencies (matplotlib, scipy, pandas, GDAL/pyproj) for nothing. 
+_SUBMODULES = ( 
+    '_kalfeatlog', 
+    'methods', 
+    'tools',
+    'decorators', 
+    'documentation', 
+    'exceptions', 
+    'property', 
+    'typing', 
+    '__main__', 
     )
 
+def __getattr__(name): 
+    if name in _SUBMODULES: 
+        return importlib.import_module(f'.{name}', __name__ )
+    raise AttributeError (
+        f'module {__name__!r} has no attribute {name!r}')
+    
+def __dir__(): 
+    return sorted (set (globals()) | set(_SUBMODULES)) 
+
 if __name__ =='__main__' or __package__ is None: 
     sys.path.append( os.path.dirname(os.path.dirname(__file__)))
     sys.path.insert(0, os.path.dirname(__file__))
@@ -1,12 +1,54 @@
-import os 
-import sys 
+import os
+import sys
+import argparse
 
-if __name__ =='__main__' or __package__ is None: 
+if __name__ =='__main__' or __package__ is None:
     sys.path.append( os.path.dirname(os.path.dirname(__file__)))
     sys.path.insert(0, os.path.dirname(__file__))
     __package__ ='watex'
-    # another way to say the sys.path so to force use the relative import: 
+    # another way to say the sys.path so to force use the relative import:
     #   sys.path(os.path.dirname(os.path.dirname(__file__)))
     #   root_folder = r'{}'.format(pathlib.Path(
     #       pathlib.Path(__file__).parent.absolute().parent))
-    
+
+
+def main (argv = None ) -> int :
+    """ Command line entry point ``python -m kalfeat``.
+
+    Manage the on-disk cache of the parsed workbooks::
+
+        python -m kalfeat cache warm data/erp data/ves
+        python -m kalfeat cache info
+        python -m kalfeat cache clear
+    """
+    parser = argparse.ArgumentParser (prog ='kalfeat')
+    subparsers = parser.add_subparsers (dest ='command', required =True )
+    cparser = subparsers.add_parser (
+        'cache', help ='Manage the cache of the parsed workbooks.')
+    cparser.add_argument ('action', choices = ('warm', 'clear', 'info'))
+    cparser.add_argument ('paths', nargs ='*',
+                          help ='Files, directories or glob patterns to warm.')
+    cparser.add_argument ('--cache-dir', default = None,
+                          help ='Cache directory. Default is KALFEAT_CACHE_DIR'
+                          ' or ~/.cache/kalfeat.')
+    args = parser.parse_args (argv )
+
+    from kalfeat.tools import cacheutils
+    if args.action =='warm':
+        if not args.paths:
+            parser.error ('Expect the paths of the workbooks to warm.')
+        files = cacheutils.warm_cache (args.paths, cache_dir = args.cache_dir )
+        print (f'{len(files)} file(s) cached in '
+               f'{cacheutils.get_cache_dir(args.cache_dir)!r}.')
+    elif args.action =='clear':
+        n = cacheutils.clear_cache (args.cache_dir )
+        print (f'{n} entrie(s) removed.')
+    else:
+        for k, v in cacheutils.cache_info (args.cache_dir ).items():
+            print (f'{k:<10}: {v}')
+
+    return 0
+
+
+if __name__ =='__main__':
+    sys.exit (main ())
@@ -24,7 +24,15 @@ class kalfeatlog:
     Field to logs `kalfeat`_ module Files  in order to tracks all 
     exceptions.
     
+    The default configuration is set once, on the first logger request, and 
+    the named loggers are cached so that building many objects does not 
+    configure the logging again. 
+    
     """
+    # whether a configuration has already been loaded 
+    _configured = False 
+    # named loggers already requested 
+    _loggers = {}
     
     @staticmethod
     def load_configure (path2configure =None, OwnloggerBaseConf=False) :
@@ -34,11 +42,18 @@ class kalfeatlog:
         :param configfile: .yml, .ini, .conf, .json, .yaml.
         Its default is the logging.yml located in the same dir as this module.
         It can be modified to use env variables to search for a log config file.
+        
+        The default configuration (no `configfile`) is idempotent: it is 
+        skipped once any configuration has been loaded. A given `configfile` 
+        is always loaded. 
         """
         
         configfile=path2configure
         
         if configfile is None or configfile == "":
+            if kalfeatlog._configured: 
+                return 
+            kalfeatlog._configured = True 
             if OwnloggerBaseConf ==False :
                 logging.basicConfig()
             else :
@@ -62,6 +77,7 @@ class kalfeatlog:
                 with open (yaml_path,"rt") as f :
                     config=yaml.safe_load(f.read())
                 logging.config.dictConfig(config)
+                kalfeatlog._configured = True 
             else :
                 logging.exception(
                     "the config yaml file %s does not exist?", yaml_path)
@@ -69,6 +85,7 @@ class kalfeatlog:
         elif configfile.endswith(".conf") or configfile.endswith(".ini") :
             logging.config.fileConfig(configfile,
                                      disable_existing_loggers=False)
+            kalfeatlog._configured = True 
             
         elif configfile.endswith(".json") :
             pass 
@@ -82,10 +99,14 @@ class kalfeatlog:
         """
         create a named logger (try different)
         :param loggername: the name (key) of the logger object in this Python interpreter.
-        :return:
+        :return: the cached logger; the default configuration is only set 
+            on the first request. 
         """
-        logger =logging.getLogger(loggername)
-        kalfeatlog.load_configure() #set configuration 
+        logger = kalfeatlog._loggers.get(loggername)
+        if logger is None: 
+            kalfeatlog.load_configure() #set configuration once
+            logger = kalfeatlog._loggers[loggername] = logging.getLogger(
+                loggername)
 
         return logger
 
@@ -124,6 +145,7 @@ class kalfeatlog:
             with open (yaml_path,"rt") as f :
                 config=yaml.safe_load(f.read())
             logging.config.dictConfig(config)
+            kalfeatlog._configured = True 
         else :
             logging.exception(
                 "the config yaml file %s does not exist?", yaml_path) 
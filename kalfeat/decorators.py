@@ -14,7 +14,6 @@ import warnings
 import datetime 
 import numpy as np
 # import pandas as pd 
-import  matplotlib.pyplot as plt 
 
 from .typing import (
     Iterable,
@@ -147,11 +146,19 @@ class gdal_data_check(object):
         """
   
         self._func = func
-        if not self._has_checked:
-            self._gdal_data_found = self._check_gdal_data()
-            self._has_checked = True
+        self._raise_error = raise_error 
+        # The probe may run an external program so it is done once per 
+        # process and, for decorated functions, deferred to the first call.
+        if func is None: 
+            self._check()
+
+    def _check(self): 
+        cls = type(self)
+        if not cls._has_checked:
+            cls._gdal_data_found = self._check_gdal_data()
+            cls._has_checked = True
         if not self._gdal_data_found:
-            if(raise_error):
+            if(self._raise_error):
                 raise ImportError(
                     "GDAL  is NOT installed correctly. "
                     f"GDAL wheel can be downloaded from {self._gdal_wheel_resources}"
@@ -169,6 +176,7 @@ class gdal_data_check(object):
                               )
 
     def __call__(self, *args, **kwargs):  # pragma: no cover
+        self._check()
         return self._func(*args, **kwargs)
 
     def _check_gdal_data(self):
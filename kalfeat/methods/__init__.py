@@ -2,6 +2,7 @@
 
 from .dc import (
     ResistivityProfiling ,
-    VerticalSounding
+    VerticalSounding, 
+    ProfileFeatures
 )
 
@@ -14,11 +14,16 @@ from ..documentation import __doc__
 from ..tools.funcutils import (
     repr_callable_obj,
     smart_format,
-    smart_strobj_recognition 
+    smart_strobj_recognition, 
+    collect_sources, 
+    run_in_pool, 
+    aggregate_timings, 
+    StageTimer, 
     )
 from ..tools.coreutils import (
     _assert_station_positions,
     defineConductiveZone, 
+    scanConductiveZones, 
     fill_coordinates, 
     erpSelector, 
     vesSelector,
@@ -31,6 +36,8 @@ from ..tools.exmath import (
     magnitude, 
     sfi,
     ohmicArea, 
+    ves_computation, 
+    batch_ohmic_area, 
     invertVES,
     )
 from ..decorators import refAppender 
@@ -40,7 +47,9 @@ from ..typing import  (
     NDArray, 
     Series , 
     DataFrame, 
-
+    Iterable, 
+    Dict, 
+    Any,
     )
 from ..property import( 
     ElectricalMethods
@@ -85,6 +94,28 @@ class ResistivityProfiling(ElectricalMethods):
         position should be  the position `station` of the lower
         resistivity value in |ERP|. 
     
+    **copy**: bool 
+        If ``False``, fit in zero-copy mode. An already sanitized dataframe 
+        (columns ``station, resistivity, longitude, latitude, easting, 
+        northing`` e.g. from :func:`~kalfeat.tools.coreutils.erpSelector` or 
+        :func:`~kalfeat.tools.coreutils.iter_erp_lines`) is used as is 
+        instead of being deep-copied. The component attributes 
+        (`resistivity_`, `position_`, `lat_`, `lon_`, `east_`, `north_`)
+        are then NumPy views on its columns rather than Series. The given 
+        dataframe is mutated: the `station` column is replaced by the 
+        renumbered positions, the missing `easting`/`northing` or 
+        `longitude`/`latitude` columns are filled from the other pair, and 
+        `resistivity` is overwritten by its concrete values when 
+        `fromlog10` is set. Default is ``True``. 
+    
+    **timings**: bool 
+        Time the stages of :meth:`fit`: the data reading (``read``), the 
+        coordinates computation (``coordinates``), the stations assertion 
+        (``stations``), the conductive zone definition (``zone``) and the 
+        features computation (``features``). The times in seconds are kept 
+        in the `timings_` attribute and logged at the info level. Default 
+        is ``False``. 
+    
     **kws**: dict 
          Additional |ERP| keywords arguments  
          
@@ -108,6 +139,8 @@ class ResistivityProfiling(ElectricalMethods):
                   station: str | None = None,
                   dipole: float = 10.,
                   auto: bool = False, 
+                  copy: bool = True, 
+                  timings: bool = False, 
                   **kws): 
         super().__init__(**kws) 
         
@@ -115,6 +148,8 @@ class ResistivityProfiling(ElectricalMethods):
         self.dipole=dipole
         self.station=station
         self.auto=auto 
+        self.copy=copy 
+        self.timings=timings 
         
         for key in list( kws.keys()): 
             setattr(self, key, kws[key])
@@ -160,21 +195,27 @@ class ResistivityProfiling(ElectricalMethods):
         
         """
         
-        self._logging.info('`Fit` method from {self.__class__.__name__!r}'
-                           ' is triggered ')
+        self._logging.info('`Fit` method from %r is triggered ', 
+                           self.__class__.__name__ )
+        timer = StageTimer (self.timings )
         if isinstance(data, str): 
             if not os.path.isfile (data): 
                 raise TypeError ( f'{data!r} object should be a file,'
                                  f' got {type(data).__name__!r}'
                                  )
 
-        data = erpSelector(data, columns) 
-        self.data_ = copy.deepcopy(data) 
+        data = erpSelector(data, columns, copy = self.copy ) 
+        self.data_ = copy.deepcopy(data) if self.copy else data 
+        # components are kept as Series or as array views in zero-copy mode
+        component = ( lambda c: self.data_[c] ) if self.copy else (
+            lambda c: self.data_[c].to_numpy() )
+        timer.lap ('read')
         
         self.data_, self.utm_zone = fill_coordinates(
             self.data_, utm_zone= self.utm_zone, 
             datum = self.datum , epsg= self.epsg ) 
-        self.resistivity_ = self.data_.resistivity 
+        timer.lap ('coordinates')
+        self.resistivity_ = component ('resistivity') 
         # convert app.rho to the concrete value 
         # if log10 rho are provided.
         if self.fromlog10: 
@@ -186,20 +227,20 @@ class ResistivityProfiling(ElectricalMethods):
                       )
             self.data_['resistivity'] = self.resistivity_
         
-        self._logging.info(f'Retrieving the {self.__class__.__name__!r} '
-                           ' components and recompute the coordinate values...')
+        self._logging.info('Retrieving the %r components and recompute the'
+                           ' coordinate values...', self.__class__.__name__ )
         
-        self.position_ = self.data_.station 
-        self.lat_ = self.data_.latitude  
-        self.lon_= self.data_.longitude 
-        self.east_ = self.data_.easting 
-        self.north_ = self.data_.northing 
+        self.position_ = component ('station') 
+        self.lat_ = component ('latitude')  
+        self.lon_= component ('longitude') 
+        self.east_ = component ('easting') 
+        self.north_ = component ('northing') 
         
         if self.verbose > 7: 
             print(f'Compute {self.__class__.__name__!r} parameter numbers.' )
             
-        self._logging.info(f'Assert the station {self.station!r} if given' 
-                           'or auto-detected otherwise.')
+        self._logging.info('Assert the station %r if given or auto-detected'
+                           ' otherwise.', self.station )
         
         # assert station and use the automatic station detection  
         ##########################################################
@@ -220,14 +261,19 @@ class ResistivityProfiling(ElectricalMethods):
             if self.verbose > 7 : 
                 print("Assert the given station and recomputed the array position."
                       )
-                self._logging.warn(
-                    f'Station value {self.station!r} in the given data '
-                    'should be overwritten...')
+                self._logging.warning(
+                    'Station value %r in the given data should be'
+                    ' overwritten...', self.station )
                 
         # recompute the position and dipolelength 
+        # only the station column is needed; taking the values of the whole 
+        # frame would consolidate it and detach the component views.
         self.position_, self.dipole = _assert_station_positions(
-            df = self.data_, **kws)
+            df = self.data_['station'].to_frame(), **kws)
         self.data_['station'] = self.position_ 
+        if not self.copy: 
+            self.position_ = component ('station')
+        timer.lap ('stations')
         
         ############################################################
         # Define the selected anomaly (conductive_zone )
@@ -250,6 +296,7 @@ class ResistivityProfiling(ElectricalMethods):
                         
                         p = self.position_
             )
+        timer.lap ('zone')
 
         if self.verbose >7 : 
             print('Compute the property values at the station location ' 
@@ -262,7 +309,7 @@ class ResistivityProfiling(ElectricalMethods):
         self.sves_ = f'S{pos:03}' 
         
         self._logging.info ('Loading main params value from the expecting' 
-                            f' drilling location: {self.sves_!r}')
+                            ' drilling location: %r', self.sves_ )
     
         self.sves_lat_ = self.lat_[pos] 
         self.sves_lon_= self.lon_[pos] 
@@ -282,6 +329,9 @@ class ResistivityProfiling(ElectricalMethods):
                          s = ix, 
                          dipolelength= self.dipole
                          )
+        timer.lap ('features')
+        self.timings_ = timer.timings 
+        timer.log (self._logging, self.__class__.__name__ )
         
         if self.verbose > 7 :
             pn = ('type', 'shape', 'magnitude', 'power' , 'sfi')
@@ -290,6 +340,125 @@ class ResistivityProfiling(ElectricalMethods):
 
         return self 
 
+    @classmethod 
+    def fit_many (cls, 
+                  sources: str | Iterable [str | DataFrame], 
+                  n_jobs: int = None, 
+                  columns: str | List [str] = None, 
+                  **kws
+                  ) -> DataFrame : 
+        """ Fit many |ERP| lines at once and collect their features 
+        into a single table.
+        
+        Each line goes through the same pipeline as :meth:`fit` i.e. 
+        :func:`~kalfeat.tools.coreutils.erpSelector`, 
+        :func:`~kalfeat.tools.coreutils.fill_coordinates`, 
+        :func:`~kalfeat.tools.coreutils.defineConductiveZone` and the 
+        features computation. The lines are dispatched over a pool of 
+        processes when `n_jobs` is greater than ``1``. 
+        
+        Parameters 
+        -----------
+        sources: str, iterable 
+            A directory, a glob pattern (e.g. ``'data/erp/l*.xlsx'``) or an 
+            iterable of files, dataframes or ``(name, data)`` pairs such as 
+            the lines streamed from a whole campaign file by 
+            :func:`~kalfeat.tools.coreutils.iter_erp_lines`. The lines are  
+            consumed as they come and are not loaded all at once. 
+            
+        n_jobs: int, 
+            Number of worker processes. ``None`` or ``1`` fits the lines in
+            the current process and ``-1`` uses all the CPUs. 
+            
+        columns: list, 
+            Only necessary if the data are given as arrays. 
+            
+        kws: dict, 
+            Keyword arguments passed to :class:`~.ResistivityProfiling` for 
+            each line, e.g. ``auto=True``, ``dipole=10.``
+            
+        Returns 
+        --------
+        DataFrame 
+            Feature table indexed by the line names. A line which fails to 
+            be fitted does not abort the run; its features are set to 
+            ``NaN`` and the reason is kept in the `error` column. With 
+            ``timings=True``, the stage timings of the lines are aggregated 
+            by :func:`~kalfeat.tools.funcutils.aggregate_timings` into 
+            ``table.attrs['timings']``.
+            
+        Examples
+        ---------
+        >>> from kalfeat.methods import ResistivityProfiling
+        >>> table = ResistivityProfiling.fit_many(
+        ...    'data/erp/l*_gbalo.xlsx', n_jobs =2, auto=True)
+        >>> table [['station', 'type', 'shape', 'sfi', 'error']] 
+        ...                station type shape       sfi error
+            line                                            
+            l10_gbalo.xlsx    S017   PC     C  1.050857  None
+            l11_gbalo.xlsx    S006   PC     V  0.076391  None
+            l2_gbalo.xlsx     S000   EC     C  0.035928  None
+        """
+        tasks = ( (name, src, columns, kws) 
+                 for name, src in collect_sources(sources, lazy =True ) )
+        records = run_in_pool(_fit_erp_line, tasks, n_jobs = n_jobs )
+        
+        table = pd.DataFrame.from_records(
+            records, columns = ('line',) + _ERP_FEATURES + ('error',)
+            ).set_index ('line')
+        if kws.get('timings'): 
+            table.attrs['timings'] = aggregate_timings(
+                r['timings'] for r in records if 'timings' in r )
+            
+        return table 
+        
+    def features (self) -> ProfileFeatures : 
+        """ Return the compact record of the fitted features. 
+        
+        Unlike the fitted object itself, the :class:`ProfileFeatures` record 
+        holds only the predictors and the conductive zone arrays. Keep it 
+        rather than the object when many lines are fitted. 
+        """
+        try: 
+            getattr(self, 'sfi_')
+        except FitError:
+            raise FitError(
+                "Can't call the method 'features' without fitting the"
+                f" {self.__class__.__name__!r} object first.")
+        return ProfileFeatures.from_profiling(self) 
+    
+    def scan (self, k: Optional [int] = 5, **kws ) -> DataFrame : 
+        """ Rank the `k` best drilling candidates along the fitted line. 
+        
+        Every station is framed in its conductive zone and scored at once 
+        by :func:`~kalfeat.tools.coreutils.scanConductiveZones`. The ranked 
+        candidates are also kept in the `candidates_` attribute. 
+        
+        :param k: int - Number of candidates. ``None`` keeps them all. 
+        :param kws: dict - Additional keyword arguments passed to 
+            :func:`~kalfeat.tools.coreutils.scanConductiveZones`. 
+            
+        :Example: 
+            >>> from kalfeat.methods import ResistivityProfiling 
+            >>> robj = ResistivityProfiling(auto=True).fit(
+            ...    'data/erp/l10_gbalo.xlsx')
+            >>> robj.scan (k =2 )
+            ...      station  position  resistivity  magnitude  power shape       sfi
+            ... rank                                                                 
+            ... 1       S017     170.0         80.0      113.0   50.0     C  1.050857
+            ... 2       S008      80.0         95.0       80.0   60.0     K  1.399548
+        """
+        try: 
+            getattr(self, 'resistivity_')
+        except FitError:
+            raise FitError(
+                "Can't call the method 'scan' without fitting the"
+                f" {self.__class__.__name__!r} object first.")
+        self.candidates_ = scanConductiveZones(
+            self.resistivity_, p = self.position_, k = k , **kws )
+        
+        return self.candidates_ 
+    
     def summary(self, keeponlyparams: bool = False) -> DataFrame : 
         """ Summarize the most import parameters for prediction purpose.
         
@@ -354,6 +523,138 @@ class ResistivityProfiling(ElectricalMethods):
             )
 
     
+_ERP_FEATURES = (
+    'station','dipole', 'longitude', 'latitude', 'easting', 'northing', 
+    'sves_resistivity', 'power', 'magnitude', 'shape', 'type', 'sfi'
+    )
+
+class ProfileFeatures : 
+    """ Compact record of the features of a fitted |ERP| line. 
+    
+    It holds only the predictors computed by :meth:`ResistivityProfiling.fit`
+    and the small arrays of the selected conductive zone, without the data, 
+    the logger nor a dynamic `__dict__`. So it is cheap to keep in memory 
+    for a great number of lines and to pickle across processes. 
+    
+    Arguments 
+    ----------
+    **station, dipole, longitude, latitude, easting, northing, 
+    sves_resistivity, power, magnitude, shape, type, sfi**: 
+        Values of the features at the expected drilling location. See 
+        :meth:`ResistivityProfiling.summary`. 
+        
+    **conductive_zone, position_zone**: ndarray 
+        Resistivity values and positions of the selected conductive zone. 
+        
+    Examples
+    --------
+    >>> from kalfeat.methods import ResistivityProfiling, ProfileFeatures 
+    >>> rObj = ResistivityProfiling(auto=True).fit('data/erp/l10_gbalo.xlsx')
+    >>> features = rObj.features() 
+    >>> features 
+    ... ProfileFeatures(station='S017', dipole=10, ..., sfi=1.0508569...)
+    >>> ProfileFeatures.to_frame([features, features])[['station','type']]
+    ...   station type
+        0    S017   PC
+        1    S017   PC
+    """
+    __slots__ = _ERP_FEATURES + ('conductive_zone', 'position_zone') 
+    
+    def __init__(self, **kws ): 
+        for name in self.__slots__: 
+            setattr(self, name, kws.pop(name, None ))
+        if kws: 
+            raise TypeError (f'Unexpected features {smart_format(kws)}.')
+            
+    @classmethod 
+    def from_profiling (cls, robj: ResistivityProfiling ) -> ProfileFeatures: 
+        """ Build the record from a fitted :class:`ResistivityProfiling`."""
+        sfi_ = np.asarray(robj.sfi_, dtype = float ).ravel() 
+        return cls ( 
+            station = robj.sves_, 
+            dipole = robj.dipole, 
+            longitude = float(robj.sves_lon_), 
+            latitude = float(robj.sves_lat_), 
+            easting = float(robj.sves_east_), 
+            northing = float(robj.sves_north_), 
+            sves_resistivity = float(robj.sves_resistivity_), 
+            power = float(robj.power_), 
+            magnitude = float(robj.magnitude_), 
+            shape = robj.shape_, 
+            type = robj.type_, 
+            sfi = float(sfi_[0]) if len(sfi_) else np.nan, 
+            conductive_zone = np.asarray(robj.conductive_zone_), 
+            position_zone = np.asarray(robj.position_zone_), 
+            )
+    
+    def as_dict (self, arrays: bool = True ) -> Dict [str, Any]: 
+        """ Return the features as a dictionnary; without the conductive 
+        zone arrays if `arrays` is ``False``. """
+        names = self.__slots__ if arrays else _ERP_FEATURES 
+        return { name: getattr(self, name) for name in names }
+    
+    @classmethod 
+    def to_frame (cls, 
+                  features: Iterable [ProfileFeatures], 
+                  index: Optional [Iterable] = None, 
+                  arrays: bool = False 
+                  ) -> DataFrame : 
+        """ Concatenate many records into a columnar table. 
+        
+        :param features: iterable of :class:`ProfileFeatures`. 
+        :param index: optional index of the table, e.g. the line names. 
+        :param arrays: bool - Keep the conductive zone arrays as object 
+            columns. 
+        :returns: DataFrame with one row per record. 
+        """
+        features = list(features)
+        names = cls.__slots__ if arrays else _ERP_FEATURES 
+        return pd.DataFrame (
+            { name: [getattr(f, name) for f in features ] for name in names}, 
+            index = index ) 
+    
+    def __getstate__ (self): 
+        return tuple (getattr(self, name) for name in self.__slots__)
+    
+    def __setstate__ (self, state): 
+        for name, value in zip (self.__slots__, state ): 
+            setattr(self, name, value )
+            
+    def __eq__ (self, other ): 
+        if not isinstance (other, ProfileFeatures): 
+            return NotImplemented 
+        return all (np.array_equal(getattr(self, n), getattr(other, n)) 
+                    for n in self.__slots__ )
+    
+    def __repr__ (self): 
+        return '{}({})'.format(self.__class__.__name__, ', '.join (
+            f'{k}={v!r}' for k, v in self.as_dict(arrays = False).items()))
+    
+def _fit_erp_line (task: tuple ) -> Dict [str, Any]: 
+    """ Fit a single |ERP| line and return its feature record. 
+    
+    Module-level worker of :meth:`ResistivityProfiling.fit_many` so it can be 
+    pickled to the process pool. The exception raised while fitting the line 
+    or computing its features is caught and stored in the `error` field.
+    
+    :param task: tuple - ``(name, data, columns, kws)`` 
+    :returns: dict of the line features.
+    """
+    name, data, columns, kws = task 
+    record = dict (line = name, error = None )
+    try : 
+        robj = ResistivityProfiling (**kws).fit(data, columns = columns ) 
+        features = robj.features().as_dict(arrays = False )
+        if robj.timings: 
+            features ['timings'] = robj.timings_ 
+    except Exception as e : 
+        record ['error'] = f'{type(e).__name__}: {e}'
+        return record 
+    
+    record.update (features )
+    return record 
+
+    
 @refAppender(__doc__)    
 class VerticalSounding (ElectricalMethods): 
     """ 
@@ -378,9 +679,9 @@ class VerticalSounding (ElectricalMethods):
         average value. 
         
     **rho0**: float 
-        Value of the starting resistivity model. If ``None``, `rho0` should be
-        the half minumm value of the apparent resistivity  collected. Units is
-        in Ω.m not log10(Ω.m)
+        Value of the starting resistivity model. If ``None``, the resistivity
+        of each layer is read on the sounding curve at twice the depth of its
+        middle. Units is in Ω.m not log10(Ω.m)
         
     **h0**: float 
         Thickness  in meter of the first layers in meters.If ``None``, it 
@@ -389,7 +690,10 @@ class VerticalSounding (ElectricalMethods):
     **strategy**: str 
         Type of inversion scheme. The defaut is Hybrid Monte Carlo (HMC) known
         as ``HMCMC``. Another scheme is Bayesian neural network approach (``BNN``). 
-        
+        The deterministic schemes are the Levenberg-Marquardt damped least 
+        squares of a few layers (``LM``) and the smooth model of many thin 
+        layers (``OCCAM``). See :func:`kalfeat.tools.exmath.invertVES`. 
+
     **vesorder**: int 
         The index to retrieve the resistivity data of a specific sounding point.
         Sometimes the sounding data are composed of the different sounding 
@@ -450,6 +754,24 @@ class VerticalSounding (ElectricalMethods):
         expected fractured zone. Where X is the AB dipole spacing when imaging 
         to the depth and Y is the apparent resistivity computed.
         
+    **integration**: str 
+        Scheme to integrate the pseudo-areas. ``exact`` (default) integrates 
+        the polynomial fitting curves through their antiderivative. ``quad`` 
+        uses the adaptive quadrature of :func:`scipy.integrate.quad`. 
+        
+    **intersection**: str 
+        How the bounds where the basement curve is above the fitting curve 
+        are found. ``sample`` (default) uses a grid of 1000 points while 
+        ``exact`` solves the roots of the difference of both polynomials. 
+        See :func:`kalfeat.tools.exmath.ohmicArea`. 
+        
+    **timings**: bool 
+        Time the stages of :meth:`fit` and :meth:`fit_all`: the data reading 
+        (``read``), the pseudo-areas computation (``ohmic_area``) and, for 
+        :meth:`fit`, the features setting (``features``). The times in 
+        seconds are kept in the `timings_` attribute and logged at the info 
+        level. Default is ``False``. 
+        
     **kws**: dict 
         Additionnal keywords arguments from |VES| data operations. 
         See :func:`kalfeat.tools.exmath.vesDataOperator` for futher details.
@@ -476,11 +798,11 @@ class VerticalSounding (ElectricalMethods):
     >>> vobj = VerticalSounding(fromS= 45, vesorder= 3)
     >>> vobj.fit('data/ves/ves_gbalo.xlsx')
     >>> vobj.ohmic_area_ # in ohm.m^2
-    ... 349.6432550517697
+    ... 350.70152715374024
     >>> vobj.nareas_ # number of areas computed 
     ... 2
     >>> vobj.area1_, vobj.area2_ # value of each area in ohm.m^2 
-    ... (254.28891096053943, 95.35434409123027) 
+    ... (255.1124146458542, 95.58911250788606) 
     >>> vobj.roots_ # different boundaries in pairs 
     ... [array([45.        , 57.55255255]), array([ 96.91691692, 100.        ])]
     >>> data = vesSelector ('data/ves/ves_gbalo.csv', index_rhoa=3)
@@ -488,12 +810,12 @@ class VerticalSounding (ElectricalMethods):
     >>> vObj.fractured_zone_ # AB/2 position from 45 to 100 m depth.
     ... array([ 45.,  50.,  55.,  60.,  70.,  80.,  90., 100.])
     >>> vObj.fractured_zone_resistivity_
-    ...array([57.67588974, 61.21142365, 64.74695755, 68.28249146, 75.35355927,
-           82.42462708, 89.4956949 , 96.56676271])
+    ...array([57.77169632, 61.30723023, 64.84276413, 68.37829804, 75.44936585,
+           82.52043366, 89.59150147, 96.66256929])
     >>> vObj.nareas_ 
     ... 2
     >>> vObj.ohmic_area_
-    ... 349.6432550517697
+    ... 350.70152715374024
     
     """
     
@@ -505,6 +827,9 @@ class VerticalSounding (ElectricalMethods):
                  vesorder: int = None, 
                  typeofop: str = 'mean',
                  objective: Optional[str] = 'coverall',
+                 integration: str = 'exact', 
+                 intersection: str = 'sample', 
+                 timings: bool = False, 
                  **kws) -> None : 
         super().__init__(**kws) 
         
@@ -513,7 +838,10 @@ class VerticalSounding (ElectricalMethods):
         self.vesorder=vesorder 
         self.typeofop=typeofop
         self.objective=objective 
-        self.rho0=rho0, 
+        self.integration=integration 
+        self.intersection=intersection 
+        self.timings=timings 
+        self.rho0=rho0 
         self.h0=h0
         self.strategy = strategy
         
@@ -560,7 +888,11 @@ class VerticalSounding (ElectricalMethods):
         Returns 
         -------
          object: 
-             Useful for chaining methods. 
+             Useful for chaining methods. The memoized stages of the 
+             ohmic-area computation are kept in `computation_` so fitting 
+             the same sounding again, e.g. from another `fromS`, reuses the 
+             reduced and fitted curve. See 
+             :class:`~kalfeat.tools.exmath.VESComputation`. 
              
         .. |VES| replace:: Vertical Electrical Sounding 
 
@@ -581,14 +913,16 @@ class VerticalSounding (ElectricalMethods):
                     ii+1, round(r[ii][0]), round(r[ii][1]), round(v[ii], 3)))
                 print('-'*73)
         
-        self._logging.info (f'`Fit` method from {self.__class__.__name__!r}'
-                           ' is triggered')
+        self._logging.info ('`Fit` method from %r is triggered', 
+                            self.__class__.__name__ )
         
+        timer = StageTimer (self.timings )
         if self.verbose >= 7 : 
             print(f'Range {str(self.vesorder)!r} of resistivity data of the  '
                   'sshould be selected as the main sounding data. ')
         self.data_ = vesSelector(
             data = data, index_rhoa= self.vesorder, **kwd )
+        timer.lap ('read')
         self.max_depth_ = self.data_.AB.max()
         
         if self.fromlog10: 
@@ -610,17 +944,25 @@ class VerticalSounding (ElectricalMethods):
             print("Pseudo-area should be computed from AB/2 ={str(self.fromS)}"
                   f" to {self.max_depth_} meters. "
                   )
-        r = ohmicArea( data = self.data_ , sum = False, ohmSkey = self.fromS,  
-                    objective = self.objective , typeofop = self.typeofop, 
+        # the memoized stages are shared with the next fits of the same 
+        # sounding e.g. from another `fromS` or for another `objective`.
+        self.computation_ = ves_computation(data = self.data_, 
+                                            typeofop = self.typeofop )
+        r = ohmicArea( data = self.computation_ , sum = False, 
+                    ohmSkey = self.fromS, objective = self.objective , 
+                    integration = self.integration, 
+                    intersection = self.intersection 
                     )
-        self._logging.info(f'Populating {self.__class__.__name__!r} property'
-                           ' attributes.')
+        timer.lap ('ohmic_area')
+        self._logging.info('Populating %r property attributes.', 
+                           self.__class__.__name__ )
         oc, gc = r 
         
         ohmS, self.err_, self.roots_ = list(oc) 
         self.nareas_ = len(ohmS) 
         
-        self._logging.info(f'Setting the {self.nareas_} pseudo-areas calculated.')
+        self._logging.info('Setting the %s pseudo-areas calculated.', 
+                           self.nareas_ )
         for ii in range(self.nareas_): 
             self.__setattr__(f"area{ii+1}_", ohmS[ii])
             
@@ -637,11 +979,81 @@ class VerticalSounding (ElectricalMethods):
         self.resistivity_ = self.XY_[:, 1] 
         self.fractured_zone_= self.XYarea_[:, 0] 
         self.fractured_zone_resistivity_ = self.XYarea_[:, 1] 
+        timer.lap ('features')
+        self.timings_ = timer.timings 
+        timer.log (self._logging, self.__class__.__name__ )
         
         if self.verbose > 7 :
             print("The Parameter numbers were successfully computed.") 
         return self 
     
+    def fit_all(self, data: str | DataFrame, **kwd ) -> DataFrame : 
+        """ Compute the ohmic-area of every sounding curve of `data` at once. 
+        
+        Whereas :meth:`fit` keeps only the sounding selected by `vesorder`, 
+        `fit_all` parses the data once and computes the pseudo-areas of all 
+        the resistivity columns ``SE1, ..., SEn`` in a single batched 
+        computation sharing the `AB` axis. See 
+        :func:`~kalfeat.tools.exmath.batch_ohmic_area`. 
+        
+        Parameters 
+        -----------
+        data:  Path-like object, DataFrame
+            Multi-sounding data of the field ``AB/2 | MN/2 | SE1 | ...| SEn``.
+            
+        kwd: dict 
+            Additional keywords arguments passed to 
+            :func:`~kalfeat.tools.coreutils.vesSelector`. 
+            
+        Returns 
+        --------
+        DataFrame indexed by the sounding names with the `ohmic_area`, the 
+        number of areas `nareas` and the integration bounds `roots` in pairs. 
+        The table is also kept in the `soundings_` attribute. 
+        
+        Examples 
+        ---------
+        >>> from kalfeat.methods import VerticalSounding 
+        >>> VerticalSounding(fromS= 45).fit_all('data/ves/ves_gbalo.xlsx')
+        ...           ohmic_area  nareas                                      roots
+            sounding                                                              
+            SE1        14.061734       1                [[45.0, 98.07307307307308]]
+            SE2       147.564915       2  [[45.0, 88.6036036036036], [97.85285285...
+            SE3       563.224103       2  [[45.0, 56.066066066066064], [100.0, 10...
+            SE4       350.701527       2  [[45.0, 57.552552552552555], [96.916916...
+        """
+        self._logging.info ('`Fit_all` method from %r is triggered', 
+                            self.__class__.__name__ )
+        timer = StageTimer (self.timings )
+        self.data_ = vesSelector(data = data, keep_all =True, **kwd )
+        timer.lap ('read')
+        self.max_depth_ = self.data_.AB.max()
+        rhoa = self.data_.iloc[:, 2:]
+        if self.fromlog10: 
+            rhoa = np.power(10, rhoa)
+            
+        if self.fromS >= self.max_depth_ : 
+            raise VESError(
+                " Process of the depth monitoring is aborted! The searching"
+                f" point of param 'fromS'<{self.fromS}m> ' is expected to "
+                 f" be less than the maximum depth <{self.max_depth_}m>.")
+            
+        r = batch_ohmic_area(self.data_.AB, rhoa , ohmSkey = self.fromS, 
+                             typeofop = self.typeofop, 
+                             integration = self.integration, 
+                             intersection = self.intersection )
+        timer.lap ('ohmic_area')
+        self.timings_ = timer.timings 
+        timer.log (self._logging, self.__class__.__name__ )
+        self.soundings_ = pd.DataFrame (
+            {'ohmic_area': [ohmS.sum() for ohmS, *_ in r ], 
+             'nareas': [len(ohmS) for ohmS, *_ in r ], 
+             'roots': [list(roots.reshape(-1, 2)) for *_, roots in r ]
+             }, index = pd.Index(rhoa.columns, name ='sounding')
+            )
+        
+        return self.soundings_ 
+    
     def summary(self, keeponlyparams: bool = False) -> DataFrame : 
         """ Summarize the most import features for prediction purpose.
         
@@ -681,44 +1093,167 @@ class VerticalSounding (ElectricalMethods):
             
         return table_ 
         
-    def invert( self, data: str | DataFrame , strategy=None, **kwd): 
+    def invert( self, data: str | DataFrame = None, strategy=None, **kwd):
         """ Invert1D the |VES| data collected in the exporation area.
-        
-        :param data: Dataframe pandas - contains the depth measurement AB from 
-            current electrodes, the potentials electrodes MN and the collected 
-            apparents resistivities. 
-        
-        :param rho0: float - Value of the starting resistivity model. If ``None``, 
-            `rho0` should be the half minumm value of the apparent resistivity  
-            collected. Units is in Ω.m not log10(Ω.m)
+
+        :param data: Dataframe pandas - contains the depth measurement AB from
+            current electrodes, the potentials electrodes MN and the collected
+            apparents resistivities. If ``None``, the data of the fitted
+            sounding are inverted.
+
+        :param rho0: float - Value of the starting resistivity model. If ``None``,
+            the resistivity of each layer is read on the sounding curve.
+            Units is in Ω.m not log10(Ω.m)
         :param h0: float -  Thickness  in meter of the first layers in meters.
-             If ``None``, it should be the minimum thickess as possible ``1.``m. 
-        
-        :param strategy: str - Type of inversion scheme. The defaut is Hybrid Monte 
+             If ``None``, it should be the minimum thickess as possible ``1.``m.
+
+        :param strategy: str - Type of inversion scheme. The defaut is Hybrid Monte
             Carlo (HMC) known as ``HMCMC``. Another scheme is Bayesian neural network
-            approach (``BNN``). 
-        
-        :param kwd: dict - Additionnal keywords arguments from |VES| data  
-            operations. See :doc:`kalfeat.utils.exmath.vesDataOperator` for futher
-            details.
-        
-        .. |VES| replace: Vertical Electrical Sounding 
-        
+            approach (``BNN``). The deterministic schemes are ``LM`` and
+            ``OCCAM``.
+
+        :param kwd: dict - Additionnal keywords arguments of
+            :func:`kalfeat.tools.exmath.invertVES` e.g. `nlayers` and of the
+            |VES| data operations. See :doc:`kalfeat.utils.exmath.vesDataOperator`
+            for futher details.
+
+        :returns: object with the inverted model: the resistivities
+            `layer_resistivity_`, thicknesses `layer_thickness_` and bottoms
+            `layer_depth_` of the layers, the model `response_`, the final
+            relative misfit `rms_` and its history `misfits_`, the number of
+            iterations `niter_`, `converged_` and the wall-clock times of the
+            iterations `iteration_times_` in seconds. With ``HMCMC``, the
+            model is the posterior median and the posterior quantiles of the
+            layers are kept in `layer_resistivity_quantiles_`,
+            `layer_thickness_quantiles_` and `layer_depth_quantiles_` of
+            shape (len(quantiles_), n_layers) with the `samples_`, the
+            `acceptance_` rate of the chains and their `rhat_` statistic.
+
+        :Example:
+            >>> from kalfeat.methods import VerticalSounding
+            >>> vobj = VerticalSounding(fromS= 45, vesorder= 2).fit(
+            ...    'data/ves/ves_gbalo.xlsx')
+            >>> vobj.invert(strategy ='OCCAM', nlayers =8).layer_resistivity_
+            ... array([1207., 1151., 1111.,  788.,  147.,   38.,   97.,  310.])
+            >>> vobj.invert(strategy ='HMCMC', seed =0, n_jobs =-1 )
+            >>> vobj.layer_depth_quantiles_.round(1) # 5%, 50% and 95%
+            ... array([[ 6.7,  8. ],
+                       [ 7.3, 33.5],
+                       [ 7.9, 50.6]])
+
+        .. |VES| replace: Vertical Electrical Sounding
+
         """
+        if data is not None:
+            self.data_ = vesSelector(data = data, index_rhoa= self.vesorder)
         self.data_ = getattr(self, 'data_', None)
-        if self.data_ is None: 
+        if self.data_ is None:
             raise FitError(f'Fit the {self.__class__.__name__!r} object first')
-  
-        # invert data 
-        #XXX TODO 
-        if strategy is not None: 
-            self.strategy = strategy 
-            
-        invertVES(data= self.data_, h0 = self.h0 , rho0 = self.rho0,
-                  typeof = self.strategy , **kwd)
-        
-        return self 
-    
+
+        if strategy is not None:
+            self.strategy = strategy
+
+        kwd.setdefault('typeofop', self.typeofop)
+        r = invertVES(data= self.data_, h0 = self.h0 , rho0 = self.rho0,
+                      typeof = self.strategy , **kwd)
+        self._set_inversion (r)
+
+        return self
+
+    def _set_inversion (self, r: Dict [str, Any] ) -> None :
+        """ Populate the attributes of the inverted model `r`. """
+        self.layer_resistivity_ = r['rho']
+        self.layer_thickness_ = r['h']
+        self.layer_depth_ = r['depth']
+        self.response_ = r['response']
+        self.rms_ = r['rms']
+        self.misfits_ = r['misfits']
+        self.niter_ = r['niter']
+        self.converged_ = r['converged']
+        self.iteration_times_ = r['times']
+        if 'quantiles' in r:
+            self.quantiles_ = r['quantiles']
+            self.layer_resistivity_quantiles_ = r['rho_quantiles']
+            self.layer_thickness_quantiles_ = r['h_quantiles']
+            self.layer_depth_quantiles_ = r['depth_quantiles']
+            self.samples_ = r['samples']
+            self.acceptance_ = r['acceptance']
+            self.rhat_ = r['rhat']
+        self._logging.info('%s inversion %s after %s iteration(s); rms=%.4f',
+                           self.strategy, 'converged' if r['converged']
+                           else 'stopped', r['niter'], r['rms'])
+
+    def invert_many(self,
+                    data: str | DataFrame,
+                    strategy: Optional[str] = None,
+                    n_jobs: Optional[int] = None,
+                    **kwd ) -> DataFrame :
+        """ Invert every sounding curve of `data`, in a process pool when
+        `n_jobs` allows it.
+
+        Parameters
+        -----------
+        data:  Path-like object, DataFrame
+            Multi-sounding data of the field ``AB/2 | MN/2 | SE1 | ...| SEn``.
+
+        strategy: str
+            Inversion scheme. See :func:`~kalfeat.tools.exmath.invertVES`.
+
+        n_jobs: int,
+            Number of worker processes. ``None`` or ``1`` inverts the
+            soundings in the current process and ``-1`` uses all the CPUs.
+            The chains of ``HMCMC`` then run in the process of their
+            sounding.
+
+        kwd: dict
+            Additional keywords arguments of
+            :func:`~kalfeat.tools.exmath.invertVES` e.g. `nlayers`.
+
+        Returns
+        --------
+        DataFrame indexed by the sounding names with the inverted `rho`,
+        `h` and `depth` of the layers, the misfit `rms`, the number of
+        iterations `niter`, whether the inversion has `converged`, its
+        wall-clock `time` in seconds and the `error` of the soundings which
+        fail to be inverted. With ``HMCMC``, the posterior quantiles of the
+        layers are added in the `rho_quantiles`, `h_quantiles` and
+        `depth_quantiles` columns. The table is also kept in the
+        `inversions_` attribute.
+
+        Examples
+        ---------
+        >>> from kalfeat.methods import VerticalSounding
+        >>> VerticalSounding().invert_many(
+        ...    'data/ves/ves_gbalo.xlsx', strategy ='LM', n_jobs =2)[
+        ...        ['rms', 'niter', 'converged']]
+        ...                rms  niter  converged
+            sounding
+            SE1       0.151078     14       True
+            SE2       0.144747     22       True
+            SE3       0.107196     38       True
+            SE4       0.197140     10       True
+        """
+        if strategy is not None:
+            self.strategy = strategy
+        data = vesSelector(data = data, keep_all =True )
+        rhoa = data.iloc[:, 2:]
+        if self.fromlog10:
+            rhoa = np.power(10, rhoa)
+        kwd = dict (kwd, h0 = self.h0, rho0 = self.rho0, typeof = self.strategy,
+                    typeofop = kwd.get('typeofop', self.typeofop))
+        tasks = [ (name, data.AB.values, rhoa[name].values, kwd)
+                 for name in rhoa.columns ]
+        records = run_in_pool(_invert_sounding, tasks, n_jobs = n_jobs )
+
+        columns = ['sounding', 'rho', 'h', 'depth', 'rms', 'niter',
+                   'converged', 'time', 'error']
+        if str(self.strategy).upper() =='HMCMC':
+            columns += ['rho_quantiles', 'h_quantiles', 'depth_quantiles']
+        self.inversions_ = pd.DataFrame.from_records(
+            records, columns = columns ).set_index ('sounding')
+
+        return self.inversions_
+
     def __repr__(self):
         """ Pretty format for programmer following the API... """
         return repr_callable_obj(self)
@@ -741,23 +1276,27 @@ class VerticalSounding (ElectricalMethods):
             f'{appender}{"" if rv is None else "?"}'
             )
 
+
+def _invert_sounding (task: tuple ) -> Dict [str, Any]: 
+    """ Invert a single sounding curve and return its model record. 
     
+    Module-level worker of :meth:`VerticalSounding.invert_many` so it can be 
+    pickled to the process pool. The exception raised while inverting the 
+    sounding is caught and stored in the `error` field.
     
+    :param task: tuple - ``(name, AB, rhoa, kws)`` 
+    :returns: dict of the inverted model.
+    """
+    name, AB, rhoa, kws = task 
+    record = dict (sounding = name, error = None )
+    try : 
+        r = invertVES (AB = AB, rhoa = rhoa, **kws )
+    except Exception as e : 
+        record ['error'] = f'{type(e).__name__}: {e}'
+        return record 
     
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-    
-        
\ No newline at end of file
+    record.update ({k: r[k] for k in ('rho', 'h', 'depth', 'rms', 'niter', 
+                                      'converged', 'rho_quantiles', 
+                                      'h_quantiles', 'depth_quantiles') 
+                    if k in r }, time = r['times'].sum())
+    return record 
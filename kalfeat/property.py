@@ -62,6 +62,9 @@
 # import warnings 
 from __future__ import annotations 
 
+import re 
+import functools 
+
 from abc import ( 
     ABC, 
     abstractmethod, 
@@ -69,6 +72,11 @@ from abc import (
 
 from .decorators import refAppender 
 from .documentation import __doc__ 
+from .typing import ( 
+    List, 
+    Tuple, 
+    Optional, 
+    )
 
 
 
@@ -496,6 +504,26 @@ class ElectricalMethods (ABC) :
         self.verbose=verbose 
         
             
+@functools.lru_cache (maxsize = 32 )
+def _compile_header_regex (
+        props: Tuple [Tuple [str, Tuple [str]]] 
+        ) -> re.Pattern: 
+    """ Build the header regex of :meth:`P._header_regex` from the 
+    ``(property, prefixes)`` pairs."""
+    return re.compile ('|'.join (
+        '(?=.*?(?:{}))(?P<{}>)'.format(
+            '|'.join (map (re.escape, prefixes)), prop)
+        for prop, prefixes in props ), re.DOTALL ) 
+
+@functools.lru_cache (maxsize = 1024 )
+def _resolve_header (
+        regex: re.Pattern, 
+        hl: Tuple [str] 
+        ) -> Tuple [Optional [str]]: 
+    """ Memoized mapping of the header `hl` with the compiled `regex`."""
+    return tuple ( None if m is None else m.lastgroup 
+                  for m in map (regex.match, (h.lower() for h in hl )))
+
 class P:
     """
     Data properties are values that are hidden to avoid modifications alongside 
@@ -644,12 +672,49 @@ class P:
         ]
         )}
     all_prefixes = {**all_prefixes , **ves_props} 
+    _header_regexes = dict () 
     
     def __init__( self, hl =None ) :
         self.hl = hl
-        for key , value in self.all_prefixes.items() : 
-            self.__setattr__( key , value)
+    
+    @classmethod 
+    def _header_regex (cls, kind: str ='erp' ) -> re.Pattern : 
+        """ Compile the prefixes of the `kind` properties into a single 
+        regex. 
+        
+        Each property is an alternative made of a lookahead on its prefixes 
+        and ended by an empty named group. The alternatives are tried in 
+        the order of the property dictionnary, so the first property with a 
+        prefix found anywhere in the header wins as in a plain scan with 
+        :meth:`str.find`. The matched property is the `lastgroup`. The regex 
+        is built once per class and `kind`. 
+        """
+        regex = cls._header_regexes.get ((cls, kind))
+        if regex is None: 
+            dict_ = cls().idictcpr if kind =='ves' else cls().idicttags
+            regex = cls._header_regexes[(cls, kind)] = _compile_header_regex(
+                tuple((k, tuple(v)) for k, v in dict_.items()))
+        return regex 
+    
+    @classmethod 
+    def resolve (cls, hl: List [str] | Tuple [str], kind: str ='erp'
+                 ) -> Tuple [Optional [str]]: 
+        """ Map each header item of `hl` to its property name or ``None``. 
+        
+        The mapping of a whole header is memoized so the identical headers 
+        of many files are resolved once. 
+        
+        :param hl: list of the header items. 
+        :param kind: str - ``erp`` or ``ves``. 
+        :returns: tuple of the property names, ``None`` for the items that 
+            match no property. 
             
+        :Example: 
+            >>> from kalfeat.property import P 
+            >>> P.resolve (['pos', 'easting', 'rhoa', 'date'])
+            ... ('station', 'easting', 'resistivity', None)
+        """
+        return _resolve_header (cls._header_regex(kind), tuple (map (str, hl)))
     
     def _check_header_item (self, it , kind ='erp'): 
         """ Check whether the item exists in the property dictionnary.
@@ -658,13 +723,8 @@ class P:
             `kind` = ``erp`` -> for Electrical Resistivity Profiling  
             `kind` = ``ves`` - > for Vertical Electrical Sounding 
         """
-            
-        dict_ = self.idictcpr if kind =='ves' else self.idicttags
-        for k, val in dict_.items(): 
-            for s in val : 
-                if str(it).lower().find(s)>=0: 
-                    return k 
-        return  
+        m = P._header_regex(kind).match (str(it).lower())
+        return None if m is None else m.lastgroup 
                 
     def __call__(self, hl: list = None , kind :str  ='erp'):
         """ Rename the given header to hold the  properties 
@@ -692,16 +752,12 @@ class P:
             ... ['station', 'easting', 'northing', 'resistivity', 
                  'latitude', 'longitude']
         """
-        
-        v_ =list()
-        
         self.hl = hl or self.hl 
         if self.hl is not None: 
             self.hl = [self.hl] if isinstance(self.hl, str ) else self.hl
             if hasattr(self.hl, '__iter__'):
-                for item in self.hl : 
-                    v_.append( self._check_header_item(item, kind)) 
-                v_=list(filter((None).__ne__, v_))
+                v_ = [ k for k in self.resolve (list(self.hl), kind) 
+                      if k is not None ]
                 return None if len (v_) ==0 else v_
             
     @property 
@@ -784,6 +840,12 @@ class P:
             **self.ves_props, **{'resistivity': self.iresistivity}}.items()}
                 
 
+# The prefixes are shared by all the instances as class attributes 
+# rather than being copied at each instanciation. 
+for _key, _prefixes in P.all_prefixes.items(): 
+    setattr (P, _key, _prefixes)
+del _key, _prefixes 
+
 def assert_arrangement(a: int | str ): 
     """ Assert whether the given arrangement is correct. 
     
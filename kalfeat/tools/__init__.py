@@ -2,38 +2,71 @@
 
 import os
 import  re
-import numpy as np
+import importlib 
 
-from .coreutils import ( 
-    plotAnomaly, 
-    vesSelector, 
-    erpSelector, 
-    defineConductiveZone, 
+# The tools are imported from their modules on first access so that the 
+# package stays cheap to import. `HAS_GDAL` and `NEW_GDAL` are resolved on 
+# first access as well since the GDAL probe runs an external command. 
+_LAZY_NAMES = dict (
+    plotAnomaly = 'coreutils', 
+    vesSelector = 'coreutils', 
+    erpSelector = 'coreutils', 
+    iter_erp_lines = 'coreutils', 
+    defineConductiveZone = 'coreutils', 
+    scanConductiveZones = 'coreutils', 
+    type_ = 'exmath', 
+    shape = 'exmath', 
+    power = 'exmath', 
+    magnitude = 'exmath', 
+    sfi = 'exmath', 
+    ohmicArea = 'exmath', 
+    invertVES = 'exmath', 
+    forwardVES = 'exmath', 
+    vesDataOperator = 'exmath', 
+    scalePosition = 'exmath', 
+    batch_type = 'exmath', 
+    batch_shape = 'exmath', 
+    batch_power = 'exmath', 
+    batch_magnitude = 'exmath', 
+    batch_sfi = 'exmath', 
+    batch_ohmic_area = 'exmath', 
+    ves_computation = 'exmath', 
+    aggregate_timings = 'funcutils', 
     )
-from .exmath import ( 
-    type_,
-    shape, 
-    power, 
-    magnitude, 
-    sfi, 
-    ohmicArea, 
-    invertVES, 
-    vesDataOperator, 
-    scalePosition,
-    )
-from ..decorators import gdal_data_check
-
-HAS_GDAL = gdal_data_check(None)._gdal_data_found
-NEW_GDAL = False
+_SUBMODULES = ('cacheutils', 'coreutils', 'exmath', 'funcutils', 'gistools')
 
-if (not HAS_GDAL):
-    try:
-        import pyproj
-    except ImportError:
-        raise RuntimeError("Either GDAL or PyProj must be installed")
-else:
-    import osgeo
-    if hasattr(osgeo, '__version__') and int(osgeo.__version__[0]) >= 3:
-        NEW_GDAL = True
+def _check_gis_backend (): 
+    """ Probe GDAL and fall back to pyproj if GDAL is not working."""
+    global HAS_GDAL, NEW_GDAL 
+    from ..decorators import gdal_data_check
+    
+    HAS_GDAL = gdal_data_check(None)._gdal_data_found
+    NEW_GDAL = False
 
+    if (not HAS_GDAL):
+        try:
+            import pyproj # noqa 
+        except ImportError:
+            raise RuntimeError("Either GDAL or PyProj must be installed")
+    else:
+        import osgeo
+        if hasattr(osgeo, '__version__') and int(osgeo.__version__[0]) >= 3:
+            NEW_GDAL = True
+            
+def __getattr__(name): 
+    if name in ('HAS_GDAL', 'NEW_GDAL'): 
+        _check_gis_backend() 
+        return globals()[name]
+    if name in _SUBMODULES: 
+        return importlib.import_module(f'.{name}', __name__ )
+    if name in _LAZY_NAMES: 
+        value = getattr(importlib.import_module(
+            f'.{_LAZY_NAMES[name]}', __name__ ), name)
+        globals()[name] = value 
+        return value 
+    raise AttributeError (
+        f'module {__name__!r} has no attribute {name!r}')
 
+def __dir__(): 
+    return sorted (set (globals()) | set(_LAZY_NAMES) | set(_SUBMODULES)
+                   | {'HAS_GDAL', 'NEW_GDAL'})
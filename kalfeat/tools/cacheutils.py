@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+#   author: KLaurent <etanoyau@gmail.com>
+#   Licence:  GPL-3.0
+
+"""
+On-disk cache of the parsed workbooks
+=====================================
+
+Parsing ``.xlsx`` files with :func:`pandas.read_excel` is by far the slowest
+step when reading the |ERP| and |VES| data. The cache keeps the parsed
+frames in a binary format so the next reads of an unchanged workbook skip
+the parsing. It is opt-in: pass ``cache=True`` to the readers or set the
+environment variable ``KALFEAT_CACHE=1``.
+
+The entries are keyed by the file path, its size, its modification time and
+the reader keyword arguments, so an edited workbook is parsed again. Frames
+are stored in parquet when `pyarrow` is installed and pickled otherwise. The
+cache directory is bounded in size: the least recently used entries are
+evicted first.
+
+Environment variables:
+
+- ``KALFEAT_CACHE``: enable the cache by default (``1``, ``true``, ``yes``).
+- ``KALFEAT_CACHE_DIR``: cache directory. Default is ``~/.cache/kalfeat``.
+- ``KALFEAT_CACHE_MAXSIZE``: maximum size of the cache in megabytes.
+  Default is ``512``.
+
+The cache can be warmed or cleared from the command line::
+
+    python -m kalfeat cache warm data/erp data/ves
+    python -m kalfeat cache info
+    python -m kalfeat cache clear
+
+"""
+from __future__ import annotations
+
+import os
+import glob
+import hashlib
+import contextlib
+
+import pandas as pd
+
+from .._kalfeatlog import kalfeatlog
+from ..typing import (
+    F,
+    Any,
+    Dict,
+    List,
+    Tuple,
+    Optional,
+    Iterable,
+    DataFrame,
+    )
+try :
+    import pyarrow # noqa
+except ImportError:
+    HAS_PYARROW = False
+else:
+    HAS_PYARROW = True
+
+_logger = kalfeatlog.get_kalfeat_logger(__name__)
+
+# bump to invalidate the entries written by an older layout
+CACHE_VERSION = 1
+CACHE_FORMATS = ('.parquet', '.pkl')
+DEFAULT_MAXSIZE = 512 # megabytes
+
+
+def is_cache_enabled () -> bool:
+    """ Whether the cache is enabled by default through the environment
+    variable ``KALFEAT_CACHE``. """
+    return os.environ.get ('KALFEAT_CACHE', '').lower() in (
+        '1', 'true', 'yes', 'on')
+
+def get_cache_dir (cache_dir: Optional[str] = None ) -> str:
+    """ Return the cache directory, `cache_dir` when given, else the one
+    set by ``KALFEAT_CACHE_DIR`` or ``~/.cache/kalfeat``. """
+    return cache_dir or os.environ.get ('KALFEAT_CACHE_DIR') or os.path.join(
+        os.path.expanduser ('~'), '.cache', 'kalfeat')
+
+def get_cache_maxsize () -> int:
+    """ Maximum size in bytes of the cache from ``KALFEAT_CACHE_MAXSIZE``
+    given in megabytes. """
+    try :
+        maxsize = float (os.environ.get ('KALFEAT_CACHE_MAXSIZE',
+                                         DEFAULT_MAXSIZE))
+    except ValueError:
+        maxsize = DEFAULT_MAXSIZE
+    return int (maxsize * 1024 **2 )
+
+def cache_key (f: str , **kws ) -> str:
+    """ Hash the absolute path, size and modification time of `f` with the
+    reader keywords arguments `kws`.
+
+    :param f: Path-like object - The file to read.
+    :param kws: dict - reader keywords arguments.
+    :returns: str - hexadecimal sha1 digest.
+    """
+    st = os.stat (f)
+    token = repr ((CACHE_VERSION, os.path.abspath(f), st.st_size,
+                   st.st_mtime_ns, sorted ((k, repr(v)) for k, v in kws.items())
+                   ))
+    return hashlib.sha1 (token.encode ()).hexdigest ()
+
+def _entries (cache_dir: str ) -> List[Tuple[str, os.stat_result]]:
+    """ List the cache entries with their stats, the least recently used
+    first. """
+    if not os.path.isdir (cache_dir):
+        return []
+    entries = [ (p, os.stat (p)) for p in (
+        os.path.join (cache_dir, n) for n in os.listdir (cache_dir)
+        if os.path.splitext(n)[1] in CACHE_FORMATS )]
+    return sorted (entries, key = lambda e: e[1].st_mtime_ns )
+
+def _evict (cache_dir: str , maxsize: int ) -> int :
+    """ Remove the least recently used entries until the cache holds in
+    `maxsize` bytes. Return the number of entries removed. """
+    entries = _entries (cache_dir )
+    size = sum (st.st_size for _, st in entries )
+    removed =0
+    for path , st in entries :
+        if size <= maxsize:
+            break
+        try :
+            os.remove (path )
+        except OSError:
+            continue
+        size -= st.st_size ; removed +=1
+
+    return removed
+
+def _lookup (cache_dir: str , key: str ) -> Optional[str]:
+    """ Return the path of the entry `key` if it exists."""
+    for ext in CACHE_FORMATS:
+        path = os.path.join (cache_dir, key + ext )
+        if os.path.isfile (path ):
+            return path
+
+def _load (path: str ) -> DataFrame | Dict[str, DataFrame]:
+    """ Load an entry and mark it as recently used.
+
+    The entry is still loaded when it cannot be touched e.g. in a read-only
+    or shared cache directory.
+    """
+    data = pd.read_parquet (path ) if path.endswith ('.parquet') else (
+        pd.read_pickle (path ))
+    with contextlib.suppress (OSError ):
+        os.utime (path )
+    return data
+
+def _store (cache_dir: str , key: str ,
+            data: DataFrame | Dict[str, DataFrame] ) -> str :
+    """ Write the entry `key` atomically and return its path.
+
+    A dataframe with string column names is written in parquet when
+    `pyarrow` is available. Other objects, e.g. the dictionnary of all
+    the sheets of a workbook, are pickled.
+    """
+    os.makedirs (cache_dir, exist_ok = True )
+    tmp = os.path.join (cache_dir, f'.{key}.{os.getpid()}.tmp')
+    path = None
+    if (HAS_PYARROW and isinstance (data, pd.DataFrame)
+        and all (isinstance (c, str) for c in data.columns)):
+        try :
+            data.to_parquet (tmp )
+        except Exception as e :
+            _logger.debug (f'Parquet storage failed ({e}); use pickle.')
+        else:
+            path = os.path.join (cache_dir, key + '.parquet')
+    if path is None:
+        pd.to_pickle (data, tmp )
+        path = os.path.join (cache_dir, key + '.pkl')
+    os.replace (tmp, path )
+
+    return path
+
+def cached_read (
+        reader: F,
+        f: str ,
+        cache: Optional[bool] = None,
+        cache_dir: Optional[str] = None,
+        **kws
+        ) -> DataFrame | Dict[str, DataFrame]:
+    """ Call ``reader(f, **kws)`` through the on-disk cache.
+
+    :param reader: callable - Parser of `f` e.g. :func:`pandas.read_excel`.
+    :param f: Path-like object - The file to read.
+    :param cache: bool - Use the cache. ``None`` follows the environment
+        variable ``KALFEAT_CACHE``.
+    :param cache_dir: str - Cache directory. See :func:`get_cache_dir`.
+    :param kws: dict - `reader` keywords arguments.
+    :returns: The parsed data. A copy is returned from the cache so the
+        caller can modify it freely.
+
+    :Example:
+        >>> import pandas as pd
+        >>> from kalfeat.tools.cacheutils import cached_read
+        >>> df = cached_read (pd.read_excel, 'data/erp/l10_gbalo.xlsx',
+        ...                  cache =True ) # parse and store
+        >>> df = cached_read (pd.read_excel, 'data/erp/l10_gbalo.xlsx',
+        ...                  cache =True ) # load from the cache
+    """
+    cache = is_cache_enabled () if cache is None else cache
+    if not cache:
+        return reader (f, **kws )
+
+    cache_dir = get_cache_dir (cache_dir )
+    key = cache_key (f, reader = getattr (reader, '__name__', reader), **kws)
+    path = _lookup (cache_dir, key )
+    if path is not None:
+        try :
+            return _load (path )
+        except Exception as e :
+            # corrupted, unreadable or concurrently evicted entry: parse
+            # again
+            _logger.warning (f'Drop the cache entry {path!r}: {e}')
+            with contextlib.suppress (OSError ):
+                os.remove (path )
+
+    data = reader (f, **kws )
+    try :
+        _store (cache_dir, key, data )
+        _evict (cache_dir, get_cache_maxsize ())
+    except OSError as e :
+        _logger.warning (f'Unable to cache {f!r} in {cache_dir!r}: {e}')
+
+    return data
+
+def warm_cache (
+        paths: str | Iterable[str],
+        cache_dir: Optional[str] = None,
+        readableformats: Tuple[str] = ('.xlsx', ),
+        ) -> List[str]:
+    """ Parse the workbooks of `paths` and store them in the cache.
+
+    :param paths: str, iterable - Files, directories or glob patterns.
+    :param cache_dir: str - Cache directory. See :func:`get_cache_dir`.
+    :param readableformats: tuple - Extensions of the files to cache.
+    :returns: list of the files cached.
+    """
+    paths = [paths] if isinstance (paths, str) else paths
+    files =[]
+    for p in paths:
+        if os.path.isdir (p):
+            files.extend (sorted (os.path.join (p, n) for n in os.listdir(p)))
+        elif os.path.isfile (p):
+            files.append (p)
+        else:
+            files.extend (sorted (glob.glob (p)))
+    files = [f for f in files
+             if os.path.splitext (f)[1].lower() in readableformats ]
+    for f in files:
+        cached_read (pd.read_excel, f, cache = True, cache_dir = cache_dir)
+
+    return files
+
+def clear_cache (cache_dir: Optional[str] = None ) -> int :
+    """ Remove all the cache entries and return their number. """
+    cache_dir = get_cache_dir (cache_dir )
+    removed = 0
+    for path, _ in _entries (cache_dir ):
+        with contextlib.suppress (OSError ):
+            os.remove (path ) ; removed +=1
+
+    return removed
+
+def cache_info (cache_dir: Optional[str] = None ) -> Dict[str, Any]:
+    """ Summarize the cache: its directory, number of entries, size and
+    maximum size in bytes. """
+    cache_dir = get_cache_dir (cache_dir )
+    entries = _entries (cache_dir )
+    return dict (directory = cache_dir, entries = len(entries),
+                 size = sum (st.st_size for _, st in entries ),
+                 maxsize = get_cache_maxsize (),
+                 enabled = is_cache_enabled (),
+                 backend = 'parquet' if HAS_PYARROW else 'pickle'
+                 )
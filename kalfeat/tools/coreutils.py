@@ -17,7 +17,6 @@ import copy
 
 import numpy as np 
 import pandas as pd 
-import matplotlib.pyplot as plt
  
 from ..documentation import __doc__ 
 from ..decorators import  (
@@ -31,6 +30,7 @@ from ..typing import (
     Union, 
     Tuple,
     Dict,
+    Iterator,
     Optional,
     NDArray,
     DataFrame, 
@@ -54,19 +54,26 @@ from .funcutils import (
     accept_types,
     read_from_excelsheets
     ) 
+from .cacheutils import cached_read 
 from .gistools import (
     project_point_ll2utm, 
-    project_point_utm2ll 
+    project_point_utm2ll, 
+    project_points_ll2utm, 
+    project_points_utm2ll, 
     )
  
 def _is_readable (
         f:str, 
         readableformats : Tuple[str] = ('.csv', '.xlsx'),
+        cache: Optional[bool] = None, 
         **kws
  ) -> DataFrame: 
     """ Specific files that can be read file throughout the packages 
     :param f: Path-like object -Should be a readable files. 
     :param readableformats: tuple -Specific readable files 
+    :param cache: bool - Read the ``.xlsx`` files through the on-disk cache 
+        of the parsed frames. ``None`` follows the ``KALFEAT_CACHE`` 
+        environment variable. See :mod:`kalfeat.tools.cacheutils`. 
     
     :return: dataframe - A dataframe with head contents... 
     
@@ -82,7 +89,7 @@ def _is_readable (
     if f.endswith ('.csv'): 
         f = pd.read_csv (f,**kws) 
     elif f.endswith ('.xlsx'): 
-        f = pd.read_excel(f, **kws )
+        f = cached_read (pd.read_excel, f, cache = cache, **kws )
         
     return f 
     
@@ -94,6 +101,7 @@ def vesSelector(
     AB :Array |Series = None, 
     MN: Array|Series | List[float] =None, 
     index_rhoa: Optional[int]  = None, 
+    keep_all: bool = False, 
     **kws
 ) -> DataFrame : 
     """ Assert the validity of |VES| data and return a sanitize dataframe. 
@@ -149,6 +157,11 @@ def vesSelector(
         than one, by default the first sounding curve is selected ie 
         `index_rhoa` equals to ``0``.
         
+    :param keep_all: bool - Keep all the sounding curves rather than 
+        selecting one with `index_rhoa`. The resistivity columns then keep 
+        their original names (e.g. `SE1`, ..., `SEn`) after `AB` and `MN` 
+        so each sounding stays identifiable. 
+        
     :param kws: dict - Pandas dataframe reading additionals
         keywords arguments.
         
@@ -170,6 +183,12 @@ def vesSelector(
             0   1  0.4          457
             1   2  0.4          582
             2   3  0.4          558
+        >>> df = vesSelector ('data/ves/ves_gbalo.csv', keep_all=True )
+        >>> df.head(3) 
+        ...    AB   MN   SE1   SE2   SE3  SE4
+            0   1  0.4   943  1179  1103  457
+            1   2  0.4  1179  1103  1073  582
+            2   3  0.4  1103  1073  1038  558
     """
     
     for arr in (AB , MN, rhoa): 
@@ -197,6 +216,7 @@ def vesSelector(
         if ncols is None:
             raise HeaderError (f"Columns {smft(pObj.icpr)} are missing in "
                                "the given dataset.")
+        ocols = list(data.columns) 
         data.columns = ncols 
         try : 
             rhoa= data.resistivity 
@@ -204,9 +224,13 @@ def vesSelector(
             raise ResistivityError(
                 "Data validation aborted! Missing resistivity values.")
         else : 
+            if keep_all : 
+                rhoa = pd.DataFrame(rhoa)
+                rhoa.columns = [c for c, n in zip (ocols, ncols)
+                                if n =='resistivity']
             # In the case, we got a multiple resistivity values 
             # corresponding to the different sounding values 
-            if rhoa.ndim > 1 :
+            elif rhoa.ndim > 1 :
                 if index_rhoa is None: 
                     index_rhoa = 0 
                 elif index_rhoa  >= len(rhoa.columns): 
@@ -217,7 +241,7 @@ def vesSelector(
                         )
                     index_rhoa= 0 
                     
-            rhoa = rhoa.iloc[:, index_rhoa] if rhoa.ndim > 1 else rhoa 
+                rhoa = rhoa.iloc[:, index_rhoa] 
             
         if 'MN' in data.columns: 
             MN = data.MN 
@@ -234,13 +258,22 @@ def vesSelector(
         raise VESError("Data validation aborted! Current electrodes values"
             " are missing. Specify the deep measurement!")
 
-    AB = np.array(AB) ; MN = np.array(MN) ; rhoa = np.array(rhoa) 
+    if keep_all : 
+        rhoa = pd.DataFrame (rhoa) 
+        if rhoa.shape[1]==1: 
+            rhoa.columns =['resistivity']
+    AB = np.array(AB) ; MN = np.array(MN) 
     
     if len(AB) !=len(rhoa): 
         raise VESError(" Deep measurement from the current electrodes `AB` and"
                        " the resistiviy values `rhoa` must have the same length"
                        f'. But `{len(AB)}` and `{len(rhoa)}` were given.')
-        
+    if keep_all: 
+        sdata = pd.concat ([ pd.DataFrame ({'AB': AB, 'MN': MN}), 
+                            rhoa.reset_index(drop =True)], axis =1)
+        return sdata 
+    
+    rhoa = np.array(rhoa) 
     sdata =pd.DataFrame(
         {'AB': AB, 'MN': MN, 'resistivity':rhoa},index =range(len(AB)))
     
@@ -255,7 +288,8 @@ def fill_coordinates(
     north: Array = None, 
     epsg: Optional[int] = None , 
     utm_zone: Optional [str]  = None,
-    datum: str  = 'WGS84'
+    datum: str  = 'WGS84', 
+    backend: Optional [str] = None 
 ) -> Tuple [DataFrame, str] : 
     """ Recompute coordinates values  
     
@@ -302,6 +336,13 @@ def fill_coordinates(
     utm_zone : string
             zone number and 'S' or 'N' e.g. '55S'. Defaults to the
             centre point of the provided points
+            
+    backend: string 
+            projection engine. ``None`` uses GDAL if available and `pyproj`
+            otherwise. Set to ``'numpy'`` to project with the vectorized 
+            formulas of :func:`~kalfeat.tools.gistools.ll_to_utm` and 
+            :func:`~kalfeat.tools.gistools.utm_to_ll`, without GDAL nor 
+            `pyproj`. 
                     
     Returns 
     ------- 
@@ -324,26 +365,43 @@ def fill_coordinates(
             return df[str_] , np.all(df[str_])!=0 
         return None, None 
     
-    def _set_coordinate_values (x, y, *, func ): 
-        """ Iterate `x` and `y` and output new coordinates values computed 
-        from `func` . 
-        param x: iterable values 
+    def _set_coordinate_values (x, y, *, func, bulkfunc = None ): 
+        """ Project `x` and `y` at once with `bulkfunc` and fall back to 
+        iterate `x` and `y` with `func` if the bulk projection fails. 
+        
+        :param x: iterable values 
         :param y: iterabel values 
         :param func: function F 
             can be: 
                 - ``project_point_utm2ll`` for `UTM` to `latlon`` or 
                 - `` project_point_ll2utm`` for `latlon`` to `UTM` 
+        :param bulkfunc: function F 
+            vectorized counterpart of `func` i.e.  ``project_points_utm2ll``
+            or ``project_points_ll2utm``. 
         :retuns: 
             - xx new calculated 
             - yy new calculated 
             - utm zone 
         """
-        xx = np.zeros_like(x); 
+        if bulkfunc is not None: 
+            # one transformer for all the points 
+            try : 
+                xx, yy, uz = bulkfunc (
+                    x, y, utm_zone = utm_zone, datum = datum, epsg =epsg, 
+                    backend = backend )
+                xx = np.asarray(xx, dtype = float )
+                yy = np.asarray(yy, dtype = float )
+            except : pass 
+            else: 
+                if np.isfinite(xx).all() and np.isfinite(yy).all(): 
+                    return xx, yy, uz 
+                
+        xx = np.zeros(len(x), dtype = float ); 
         yy = np.zeros_like(xx)
         for ii, (la, lo) in enumerate (zip(x, y)):
             e , n, uz  = func (
-                la, lo, utm_zone = utm_zone, datum = datum, epsg =epsg 
-                ) 
+                la, lo, utm_zone = utm_zone, datum = datum, epsg =epsg, 
+                backend = backend ) 
             xx [ii] = e ; yy[ii] = n  
                 
         return xx, yy , uz  
@@ -376,11 +434,14 @@ def fill_coordinates(
         try : 
             east , north , uz = _set_coordinate_values(
                 lat.values, lon.values,
-                project_point_ll2utm,
+                func = project_point_ll2utm,
+                bulkfunc = project_points_ll2utm, 
                 )
         except :# pass if an error occurs 
             pass 
-        else : data['easting'] = east ; data['northing'] = north 
+        else : 
+            data['easting'] = east ; data['northing'] = north 
+            if utm_zone is None: utm_zone = uz 
             
     elif e_isvalid and n_isvalid: 
         if utm_zone is None: 
@@ -392,6 +453,7 @@ def fill_coordinates(
             lat , lon, utm_zone = _set_coordinate_values(
                 east.values, north.values,
                 func = project_point_utm2ll,
+                bulkfunc = project_points_utm2ll, 
                 )
         except : pass 
         else : data['longitude'] = lon ;  data['latitude'] = lat 
@@ -511,7 +573,8 @@ def is_erp_series (
 
 def is_erp_dataframe (
         data :DataFrame ,
-        dipolelength : Optional[float] = None 
+        dipolelength : Optional[float] = None, 
+        copy: bool = True 
         ) -> DataFrame:
     """ Ckeck whether the dataframe contains the electrical resistivity 
     profiling (ERP) index properties. 
@@ -535,6 +598,12 @@ def is_erp_dataframe (
         computed and filled the station columns using the default value 
         of the dipole. The *default* value is set to ``10 meters``. 
         
+    copy: bool 
+        If ``False`` and `data` is already sanitized i.e. its columns are 
+        exactly the properties in the expected order, `data` itself is 
+        returned instead of a new dataframe. The `station` column is then 
+        filled in place when it is missing. 
+        
     Returns
     --------
     A new data with index properties.
@@ -558,32 +627,36 @@ def is_erp_dataframe (
     """
     
     data = _assert_all_types(data, pd.DataFrame)
-    datac= data.copy() 
-    
-    def _is_in_properties (h ):
-        """ check whether the item header `h` is in the property values. 
-        Return `h` and it correspondence `key` in the property values. """
-        for key, values in P().idicttags.items() : 
-            for v in values : 
-                if h.lower().find (v)>=0 :
-                    return h, key 
-        return None, None 
+    cold, c = _erp_header_mapping(data.columns)
     
+    return _sanitize_erp_columns(data, cold, c, dipolelength = dipolelength, 
+                                 copy = copy ) 
+
+def _erp_header_mapping (
+        columns: List[str]
+        ) -> Tuple[List[str], List[str]]: 
+    """ Map the raw |ERP| column headers to the property names. 
+    
+    :param columns: list - Raw column headers of the data. 
+    :returns: the headers kept and their corresponding property names. 
+    :raises HeaderError: if none of the headers matches a property or if 
+        several headers match the same property. 
+    """
     def _check_correspondence (pl, dl): 
         """ collect the duplicated name in the data columns """
         return [ l for l in pl for d  in dl if d.lower().find(l)>=0 ]
         
+    # create property object and resolve the header items 
+    # to their property names 
+    pObj = P(columns)
     cold , c = list(), list()
-    # create property object
-    pObj = P(data.columns)
-    for i , ckey in enumerate(list(datac.columns)): 
-        h , k = _is_in_properties(ckey)
-        cold.append (h) if h is not None  else h 
-        c.append(k) if k is not None else k
+    for h, k in zip (list(columns), P.resolve(list(columns))): 
+        if k is not None: 
+            cold.append (h) ; c.append(k)
         
     if len (cold) ==0: 
         raise HeaderError (
-            f'Wrong column headers {list(data.columns)}.'
+            f'Wrong column headers {list(columns)}.'
             f' Unable to find the expected {smft(pObj.isrll)}'
             ' column properties.'
                            )
@@ -602,14 +675,30 @@ def is_erp_dataframe (
             f'found. It seems correspond to {smft(ress)}. '
             'Please ckeck your data column names. '
             )
-            
-    # fetch the property column names and 
-    # replace by 0. the non existence column
-    # reorder the column to match 
-    # ['station','resistivity', 'easting','northing', ]
-    data_ = data[cold] 
-    data_.columns = c  
-    data_= data_.reindex (columns =pObj.idicttags.keys(), fill_value =0.) 
+        
+    return cold, c 
+
+def _sanitize_erp_columns (
+        data: DataFrame, 
+        cold: List[str], 
+        c: List[str], 
+        dipolelength: Optional[float] = None, 
+        copy: bool = True 
+        ) -> DataFrame: 
+    """ Rename the |ERP| columns `cold` of `data` to the properties `c`, 
+    reorder them and fill the missing properties. See 
+    :func:`is_erp_dataframe`. """
+    if not copy and list(data.columns) == c == list(P().idicttags): 
+        # already sanitized, work on the caller's frame 
+        data_ = data 
+    else: 
+        # fetch the property column names and 
+        # replace by 0. the non existence column
+        # reorder the column to match 
+        # ['station','resistivity', 'easting','northing', ]
+        data_ = data[cold] 
+        data_.columns = c  
+        data_= data_.reindex (columns =P().idicttags.keys(), fill_value =0.) 
     dipolelength = _assert_all_types(
         dipolelength , float, int) if dipolelength is not None else None 
     
@@ -622,10 +711,110 @@ def is_erp_dataframe (
         
     return data_
 
+def iter_erp_lines (
+        f: str, 
+        line_col: str = 'line', 
+        chunksize: int = 100_000, 
+        dipolelength: Optional[float] = None, 
+        **kws
+        ) -> Iterator[Tuple[Any, DataFrame]]: 
+    """ Stream the |ERP| lines of a whole survey campaign stored in a 
+    single ``.csv`` file. 
+    
+    The file is read by chunks of `chunksize` rows and the rows are grouped 
+    by the line identifier column `line_col`. Each line is yielded as soon 
+    as it is complete, so the memory stays bounded by the largest line and 
+    not by the file. The header sanitation of :func:`is_erp_dataframe` is 
+    resolved once per schema and applied to every line. 
+    
+    Parameters 
+    -----------
+    f: Path-like object 
+        ``.csv`` file of the campaign. The rows of a same line must be 
+        contiguous, which is the way the field loggers export them. 
+        
+    line_col: str 
+        Name of the column holding the line identifiers. Rows without 
+        identifier are skipped. 
+        
+    chunksize: int 
+        Number of rows read at once. 
+        
+    dipolelength: float 
+        Dipole length used to build the stations of the lines when the 
+        station column is missing. See :func:`is_erp_dataframe`. 
+        
+    kws: dict 
+        Additional :func:`pandas.read_csv` keyword arguments. 
+        
+    Yields 
+    -------
+    Tuple of the line identifier and the sanitized |ERP| dataframe of the 
+    line, ready to be fitted. The pairs can be passed as is to  
+    :meth:`kalfeat.methods.ResistivityProfiling.fit_many`. 
+    
+    Raises 
+    -------
+    ERPError 
+        If `f` is not a ``.csv`` file or if the rows of a line are not 
+        contiguous. 
+    HeaderError 
+        If `line_col` is missing or the headers do not match the |ERP| 
+        properties. 
+        
+    Examples 
+    ---------
+    >>> from kalfeat.tools.coreutils import iter_erp_lines 
+    >>> for line, data in iter_erp_lines ('campaign.csv', line_col ='line_id'): 
+    ...    print (line, data.shape)
+    ... L01 (45, 6)
+        L02 (51, 6)
+    """
+    if not (isinstance (f, str) and os.path.isfile(f) 
+            and f.lower().endswith('.csv')): 
+        raise ERPError (f'Expect an existing ".csv" file; got {f!r}.')
+        
+    schemas = dict () 
+    def _make_line (parts ): 
+        """ Assemble the chunk parts of a line and sanitize its headers."""
+        data = pd.concat (parts, ignore_index = True ) if len(
+            parts) > 1 else parts[0].reset_index (drop =True )
+        data = data.drop (columns = line_col )
+        key = tuple (data.columns)
+        if key not in schemas: 
+            schemas[key] = _erp_header_mapping(data.columns)
+        return _sanitize_erp_columns(data, *schemas[key], 
+                                     dipolelength = dipolelength )
+        
+    cur, parts, seen = None, [], set() 
+    for chunk in pd.read_csv (f, chunksize = chunksize, **kws ): 
+        if line_col not in chunk.columns: 
+            raise HeaderError (f'Missing the line column {line_col!r} in '
+                               f'{list(chunk.columns)}.')
+        chunk = chunk.dropna (subset = [line_col])
+        ids = chunk[line_col].to_numpy() 
+        cuts = np.flatnonzero (ids[1:] != ids[:-1]) + 1 
+        for s, e in zip (np.r_[0, cuts], np.r_[cuts, len(ids)]): 
+            if s ==e : 
+                continue 
+            if ids[s] != cur: 
+                if ids[s] in seen: 
+                    raise ERPError (
+                        f'The rows of line {ids[s]!r} are not contiguous. '
+                        f'Sort the file by {line_col!r} first.')
+                if parts: 
+                    yield cur, _make_line(parts)
+                cur, parts = ids[s], [] 
+                seen.add (cur)
+            parts.append (chunk.iloc[s:e])
+            
+    if parts: 
+        yield cur, _make_line(parts)
 
 def erpSelector (
         f: str | NDArray | Series | DataFrame ,
         columns: str | List[str] = ..., 
+        copy: bool = True, 
         **kws:Any 
 ) -> DataFrame  : 
     """ Read and sanitize the data collected from the survey. 
@@ -650,6 +839,10 @@ def erpSelector (
         the whole name of each item in 
         ``['station','resistivity' ,'longitude', 'latitude']``.
         
+    copy: bool 
+        If ``False``, an already sanitized dataframe `f` is returned as is 
+        rather than copied. See :func:`is_erp_dataframe`. 
+        
     kws: dict
         Additional pandas `pd.read_csv` and `pd.read_excel` 
         methods keyword arguments. Be sure to provide the right argument. 
@@ -705,7 +898,7 @@ def erpSelector (
                 raise ERPError (str(typError))
             
     if isinstance( f, np.ndarray): 
-        name = copy.deepcopy(columns)
+        name = list(columns) if isinstance (columns, list) else columns 
         columns = P().isrll if columns is None else columns 
         colnum = 1 if f.ndim ==1 else f.shape[1]
      
@@ -743,7 +936,7 @@ def erpSelector (
                     )
                 
     if isinstance(f, pd.DataFrame): 
-        f = is_erp_dataframe( f)
+        f = is_erp_dataframe( f, copy = copy )
     elif isinstance(f , pd.Series ): 
         f = is_erp_series(f)
     else : 
@@ -984,6 +1177,7 @@ def plotAnomaly(
     GeekforGeeks: https://www.geeksforgeeks.org/style-plots-using-matplotlib/#:~:text=Matplotlib%20is%20the%20most%20popular,without%20using%20any%20other%20GUIs.
     
     """
+    import matplotlib.pyplot as plt 
     
     def format_thicks (value, tick_number):
         """ Format thick parameter with 'FuncFormatter(func)'
@@ -1188,6 +1382,134 @@ def defineConductiveZone(
 
     return cz , pcz, int(pix), pos
 
+def scanConductiveZones (
+    erp: Array | pd.Series | List[float], 
+    p: Optional [SP] = None, 
+    k: Optional [int] = 5, 
+    window: int = 7, 
+    minima: bool = True, 
+    rankby: str = 'resistivity', 
+    dipolelength: Optional [float] = None, 
+) -> DataFrame : 
+    """ Scan every conductive zone along the |ERP| line and rank the 
+    drilling candidates. 
+    
+    Where :func:`defineConductiveZone` frames a single zone around the given 
+    station or the global minimum, the scanner frames a zone of `window` 
+    stations around every station of the line. The zones are strided views 
+    of the line so no copy is made, and the magnitude, power, shape and sfi 
+    of all of them are computed at once with the array-native kernels of 
+    :mod:`~kalfeat.tools.exmath`. 
+    
+    :param erp: array_like - Apparent resistivity values of the line. 
+    :param p: array_like - Station positions. If not given, the positions 
+        are built from `dipolelength`. 
+    :param k: int - Number of candidates to return. ``None`` returns all 
+        of them. 
+    :param window: int - Odd number of stations of the conductive zone. 
+        The **default** is ``7`` as in :func:`defineConductiveZone`. 
+    :param minima: bool - Keep only the zones whose station holds the 
+        lowest resistivity, i.e. one candidate per anomaly. 
+    :param rankby: str - Ranking criterion; either ``'resistivity'`` (lowest 
+        first), ``'magnitude'``, ``'power'`` or ``'sfi'`` (greatest first). 
+        Ties are broken by the lowest resistivity. 
+    :param dipolelength: float - Distance between two stations used when 
+        `p` is not given. The **default** is ``10.``. 
+        
+    :returns: dataframe of the candidates indexed by their rank with the 
+        station name, its position and resistivity, and the magnitude, 
+        power, shape and sfi of its conductive zone. 
+        
+    :Example: 
+        >>> import numpy as np 
+        >>> from kalfeat.tools.coreutils import scanConductiveZones
+        >>> erp = np.abs (np.random.RandomState(42).randn (500)) * 100 
+        >>> scanConductiveZones (erp, k= 3 )
+        ...      station  position  resistivity   magnitude  power shape       sfi
+        ... rank                                                                  
+        ... 1       S098     980.0     0.511346  145.840149   60.0     U  1.306982
+        ... 2       S402    4020.0     0.524370  158.918396   60.0     U  1.048202
+        ... 3       S490    4900.0     0.797264  167.916899   60.0     K  1.346456
+    """
+    from .exmath import ( 
+        batch_magnitude, 
+        batch_power, 
+        batch_shape, 
+        batch_sfi 
+        )
+    rankings = ('resistivity', 'magnitude', 'power', 'sfi')
+    if str(rankby).lower() not in rankings: 
+        raise ValueError (f"Expect the ranking criterion in {smft(rankings)};"
+                          f" got {rankby!r}")
+    rankby = str(rankby).lower() 
+    window = int (window )
+    if window < 3 or window % 2 ==0 : 
+        raise ValueError (
+            f"Expect an odd number of stations >= 3 ; got {window!r}")
+    
+    erp = np.asarray (erp, dtype = float ).ravel() 
+    if len(erp) < window: 
+        raise ERPError (f"Expect at least {window} stations to frame a"
+                        f" conductive zone; got {len(erp)}.")
+    if p is None: 
+        dipolelength = 10. if dipolelength is None else dipolelength 
+        p = np.arange (len(erp)) * float (dipolelength )
+    p = np.asarray (p, dtype = float ).ravel()
+    if len(p) != len(erp): 
+        raise StationError (
+            'Array of position and resistivity must have the same '
+            f'length: `{len(p)}` and `{len(erp)}` were given.')
+        
+    half = window // 2 
+    # one strided row per zone, the station at the middle 
+    czs = np.lib.stride_tricks.sliding_window_view(erp, window )
+    pczs = np.lib.stride_tricks.sliding_window_view(p, window )
+    pos = np.arange (half, len(erp) - half )
+    if minima: 
+        rows, = np.where (czs.argmin(axis =1) == half )
+        czs, pczs, pos = czs[rows], pczs[rows], pos[rows]
+    # the zones of the stations close to the line ends are truncated as 
+    # in `defineConductiveZone` and scored as a ragged batch.
+    edges = [ (ix, slice (max(ix - half, 0), ix + half + 1), min(ix, half))
+              for ix in (*range(half), *range(len(erp) - half, len(erp)))]
+    if minima: 
+        edges = [ (ix, z, s) for ix, z, s in edges if erp[z].argmin() == s ]
+    epos = np.array ([ix for ix, *_ in edges], dtype = int )
+    es = np.array ([s for *_, s in edges], dtype = int )
+    elengths = np.array ([len(erp[z]) for _, z, _ in edges], dtype = int )
+    eczs = np.concatenate ([erp[z] for _, z, _ in edges] or [[]])
+    epczs = np.concatenate ([p[z] for _, z, _ in edges] or [[]])
+    
+    pos = np.append (pos, epos )
+    rho = erp[pos]
+    mag = np.append (batch_magnitude(czs), batch_magnitude(
+        eczs, lengths = elengths ))
+    pw = np.append (batch_power (pczs), batch_power (
+        epczs, lengths = elengths))
+    shp = np.append (batch_shape(czs, s= half ), batch_shape(
+        eczs, s = es, lengths = elengths ))
+    sf = np.append (batch_sfi (czs, pczs, s = half ), batch_sfi (
+        eczs, epczs, s = es, lengths = elengths ))
+    
+    if rankby =='resistivity': 
+        order = np.lexsort ((-mag, rho ))
+    else: 
+        # greatest first, ties to the lowest resistivity 
+        key = dict (magnitude = mag, power = pw, sfi = sf )[rankby]
+        order = np.lexsort ((rho, -key ))
+    order = order [:k] if k is not None else order 
+        
+    return pd.DataFrame ( dict (
+        station = [f'S{ix:03}' for ix in pos[order]], 
+        position = p[pos[order]], 
+        resistivity = rho[order], 
+        magnitude = mag[order], 
+        power = pw[order], 
+        shape = shp[order], 
+        sfi = sf[order]
+        ), index = pd.Index (np.arange(1, len(order) + 1), name ='rank')
+        )
+    
 def _assert_stations(
     s:Any , 
     dipole:Any = None,
@@ -4,16 +4,20 @@
 
 from __future__ import annotations 
 
+import os 
 import copy 
+import time 
 import inspect 
+import hashlib 
 import warnings 
+import functools 
+from collections import Counter, OrderedDict 
 
 from scipy.signal import argrelextrema 
 import scipy.integrate as integrate
 from scipy.optimize import curve_fit
 import numpy as np
 import pandas as pd 
-import  matplotlib.pyplot as plt
  
 from .._kalfeatlog import kalfeatlog
 from ..documentation import __doc__
@@ -27,6 +31,8 @@ from ..property import P
 from ..typing import (
     T, 
     F,
+    Any, 
+    Dict, 
     List, 
     Tuple,
     Union,
@@ -42,6 +48,7 @@ from ..typing import (
 from .funcutils import (
     _assert_all_types, 
     smart_format,
+    run_in_pool,
                          
 )
 _logger =kalfeatlog.get_kalfeat_logger(__name__)
@@ -105,7 +112,7 @@ def dummy_basement_curve(
 
 def find_limit_for_integration(
         ix_arr: Array[DType[int]],
-        b0: List[T] =[]
+        b0: Optional[List[T]] = None 
 )-> List[T]: 
     r""" Use the roots between f curve and basement curves to 
     detect the limit of integration.
@@ -113,7 +120,8 @@ def find_limit_for_integration(
     :param ix_arr: array-like - Indexes array from masked array where  
         the value are true i.e. where :math:` b-f > 0 \Rightarrow  b> f` . 
         
-    :param b0: list - Empy list to hold the limit during entire loop 
+    :param b0: list - List to hold the limit during entire loop. A new list 
+        is created if ``None``. 
     
     .. note::
         :math:`b > f \Longrightarrow` Curve b (basement) is above the fitting  
@@ -123,7 +131,7 @@ def find_limit_for_integration(
     :return: list - integration bounds 
     
     """
-    
+    b0 = [] if b0 is None else b0 
     s = ix_arr.min() - 1 # 0 -1 =-1
     oc = ix_arr.min() 
     for jj,  v in enumerate(ix_arr): 
@@ -140,17 +148,19 @@ def find_limit_for_integration(
 
 def find_bound_for_integration(
         ix_arr: Array[DType[int]],
-        b0: List[T] =[]
+        b0: Optional[List[T]] = None 
 )-> List[T]: 
-    r""" Recursive function. Use the roots between f curve and basement 
-    curves to detect the  integration bounds. The function use entirely 
-    numpy for seaching integration bound. Since it is much faster than 
-    `find_limit_for_integration` although both did the same tasks. 
+    r""" Use the roots between f curve and basement curves to detect the 
+    integration bounds. 
+    
+    The bounds are the first and the last index of each run of consecutive 
+    indexes found by :func:`find_run_bounds`, without recursion.
     
     :param ix_arr: array-like - Indexes array from masked array where 
         the value are true i.e. where :math:`b-f > 0 \Rightarrow b > f` . 
         
-    :param b0: list - Empy list to hold the limit during entire loop 
+    :param b0: list - List to extend with the bounds. A new list is created 
+        if ``None``. 
     
     :return: list - integration bounds
     
@@ -160,21 +170,55 @@ def find_bound_for_integration(
         :math:`b > f` .
     
     """
+    b0 = [] if b0 is None else b0 
+    b0.extend (find_run_bounds(ix_arr))
     
-    # get the first index and arange this thin the end 
-    psdiff = np.arange(ix_arr.min(), len(ix_arr) + ix_arr.min(), 1) 
-    # make the difference to find the zeros values 
-    diff = ix_arr - psdiff 
-    index, = np.where(diff ==0) ; 
-    # take the min index and max index 
-    b0.append(min(ix_arr[index]))
-    b0.append(max(ix_arr[index]))
-    #now take the max index and add +1 and start by this part 
-    # retreived the values 
-    array_init = ix_arr[int(max(index)) +1:]
-    return b0 if len(
-        array_init)==0 else find_bound_for_integration(array_init, b0)
+    return b0 
  
+def find_run_bounds (
+        arr: Array[DType[int]] | Array[DType[bool]], 
+) -> Array[DType[int]] | List[Array[DType[int]]]: 
+    """ Segment runs into ``[start, end]`` bounds in a single pass. 
+    
+    :param arr: array-like - Either a 1-D array of increasing indexes, 
+        where each run of consecutive indexes is a segment, or a boolean 
+        mask, where each run of ``True`` is a segment. A 2-D mask holds 
+        one curve per row and all the rows are segmented at once. 
+    :returns: 
+        - for indexes or a 1-D mask, the array of bounds in pairs 
+          ``[start0, end0, start1, end1, ...]`` with inclusive ends. 
+        - for a 2-D mask, the list of these arrays, one per row. 
+    
+    :Example: 
+        
+        >>> import numpy as np 
+        >>> from kalfeat.tools.exmath import find_run_bounds 
+        >>> find_run_bounds (np.array ([0, 1, 2, 5, 7, 8]))
+        ... array([0, 2, 5, 5, 7, 8])
+        >>> find_run_bounds (np.array ([[1, 1, 0, 1], [0, 0, 0, 0]], dtype =bool))
+        ... [array([0, 1, 3, 3]), array([], dtype=int64)]
+    """
+    arr = np.asarray (arr )
+    if arr.dtype != bool: 
+        ix = arr.ravel().astype (int ) 
+        if len(ix)==0: 
+            return np.zeros ((0,), dtype = int )
+        cuts, = np.where (np.diff (ix) != 1 )
+        starts = ix[np.concatenate (([0], cuts + 1))]
+        ends = ix[np.concatenate ((cuts, [len(ix) -1]))]
+        return np.column_stack ((starts, ends)).ravel()
+    
+    mask = np.atleast_2d (arr)
+    pad = np.zeros ((len(mask), 1), dtype = int )
+    edges = np.diff (np.hstack ((pad, mask.astype (int ), pad)), axis =1 )
+    rows, starts = np.where (edges == 1 )
+    _, ends = np.where (edges == -1 )
+    bounds = np.column_stack ((starts, ends -1 )).ravel() 
+    if arr.ndim ==1 : 
+        return bounds 
+    counts = 2 * np.bincount (rows, minlength = len(mask)) 
+    
+    return np.split (bounds, np.cumsum (counts)[:-1])
     
 def fitfunc(
         x: Array[T], 
@@ -220,6 +264,7 @@ def vesDataOperator(
         data: DataFrame  =None,
         typeofop: str = None, 
         outdf: bool = False, 
+        seed: Optional[int | np.random.Generator] = None, 
 )-> Tuple[Array] | DataFrame : 
     """ Check the data in the given deep measurement and set the suitable
     operations for duplicated spacing distance of current electrodes `AB`. 
@@ -232,13 +277,16 @@ def vesDataOperator(
     to take the ``median`` values or to ``leaveOneOut`` (i.e. keep one value
     of resistivity among the different values collected at the same point`AB`)
     at the same spacing `AB`. Note that for the `LeaveOneOut``, the selected 
-    resistivity value is randomly chosen. 
+    resistivity value is randomly chosen. The duplicated spacings of all the 
+    sounding curves are reduced at once by a single group-by. 
     
     :param AB: array-like - Spacing of the current electrodes when exploring
         in deeper. Units are in meters. 
     
     :param rhoa: array-like - Apparent resistivity values collected in imaging 
         in depth. Units are in :math:`\Omega {.m}` not :math:`log10(\Omega {.m})`
+        Can be a ``(n, n_soundings)`` array or dataframe of many sounding 
+        curves, one per column, sharing the same `AB`. 
     
     :param data: DataFrame - It is composed of spacing values `AB` and  the 
         apparent resistivity values `rhoa`. If `data` is given, params `AB` and 
@@ -251,8 +299,13 @@ def vesDataOperator(
     :param outdf: bool - Outpout a new dataframe composed of `AB` and `rhoa` 
         data renewed. 
     
+    :param seed: int, Generator - Seed or generator of the random choice of 
+        ``leaveOneOut``. If ``None``, the global state of :mod:`numpy.random` 
+        is used. 
+        
     :returns: 
-        - Tuple of (AB, rhoa): New values computed from `typeofop` 
+        - Tuple of (AB, rhoa): New values computed from `typeofop` sorted 
+          by `AB`. `rhoa` keeps the number of columns of the given `rhoa`. 
         - DataFrame: New dataframe outputed only if ``outdf`` is ``True``.
         
     :note: 
@@ -270,6 +323,10 @@ def vesDataOperator(
                                 typeofop='leaveOneOut', outdf =True)
         >>> df.shape 
         ... (26, 2) # exclude `MN` values and reduce(-6) the duplicated values. 
+        >>> data = vesSelector ('data/ves/ves_gbalo.xlsx', keep_all =True )
+        >>> X, Y = vesDataOperator(data.AB, data.iloc[:, 2:], typeofop='median')
+        >>> Y.shape 
+        ... (26, 4) # all the sounding curves at once 
     """
     op = copy.deepcopy(typeofop) 
     typeofop= str(typeofop).lower()
@@ -288,8 +345,9 @@ def vesDataOperator(
     
     AB= np.array( _assert_all_types(
         AB, np.ndarray, list, tuple, pd.Series)) 
+    columns = rhoa.columns if isinstance (rhoa, pd.DataFrame) else None 
     rhoa = np.array( _assert_all_types(
-        rhoa, np.ndarray, list, tuple, pd.Series))
+        rhoa, np.ndarray, list, tuple, pd.Series, pd.DataFrame))
  
     if len(AB)!= len(rhoa): 
         raise Wex.VESError(
@@ -299,75 +357,904 @@ def vesDataOperator(
     
     #----> When exploring in deeper, after changing the distance 
     # of MN , measure are repeated at the same points. So, we will 
-    # selected these points and take the mean values of tyhe resistivity 
-    
-    # make copies 
-    AB_ = AB.copy() ; rhoa_= rhoa.copy() 
-    # find the duplicated values 
-    # with np.errstate(all='ignore'):
-    mask = np.zeros_like (AB_, dtype =bool) 
-    mask[np.unique(AB_, return_index =True)[1]]=True 
-    dup_values = AB_[~mask]
-    
-    indexes, = np.where(AB_==dup_values)
-    #make a copy of unique values and filled the duplicated
-    # values by their corresponding mean resistivity values 
-    X, rindex  = np.unique (AB_, return_index=True); Y = rhoa_[rindex]
-    d0= np.zeros_like(dup_values)
-    for ii, d in enumerate(dup_values): 
-       index, =  np.where (AB_==d)
-       if typeofop =='mean': 
-           d0[ii] = rhoa_[index].mean() 
-       elif typeofop =='median': 
-           d0[ii] = np.median(rhoa_[index])
-       elif typeofop =='leaveoneout': 
-           d0[ii] = np.random.permutation(rhoa_[index])[0]
-      
-    maskr = np.isin(X, dup_values, assume_unique=True)
-    Y[maskr] = d0
-    
-    return (X, Y) if not outdf else pd.DataFrame (
-        {'AB': X,'resistivity':Y}, index =range(len(X)))
-
-# XXXTODO 
-def invertVES (data: DataFrame[DType[float|int]] = None, 
-               rho0: float = None , 
-               h0 : float = None, 
-               typeof : str = 'HMCMC', 
-               
-               **kwd)->Tuple [Array]: 
-    """ Invert the |VES| data collected in the exporation area.
-    
-    :param data: Dataframe pandas - contains the depth measurement AB from 
-        current electrodes, the potentials electrodes MN and the collected 
-        apparents resistivities. 
+    # selected these points and reduce their resistivities in a single 
+    # group-by: the rows are sorted by spacing so each unique `AB` owns a 
+    # contiguous segment starting at `starts`. 
+    X, inverse, counts = np.unique (AB, return_inverse =True, 
+                                    return_counts =True )
+    starts = np.cumsum (counts ) - counts 
+    Y = rhoa.reshape (len(AB), -1 )
+    if typeofop =='mean': 
+        order = np.argsort (inverse, kind ='stable')
+        Y = np.add.reduceat (Y[order], starts, axis =0 ) / counts[:, None]
+    elif typeofop =='median': 
+        # sort the values then, stably, the groups so the values of each 
+        # segment are sorted too; the median is the middle of the segment.
+        order = np.argsort (Y, axis =0, kind ='stable')
+        order = np.take_along_axis (order, np.argsort (
+            inverse[order], axis =0, kind ='stable'), axis =0 )
+        Y = np.take_along_axis (Y, order, axis =0 )
+        Y = (Y[starts + (counts - 1) // 2 ] + Y[starts + counts // 2 ]) / 2 
+    elif typeofop =='leaveoneout': 
+        order = np.argsort (inverse, kind ='stable')
+        rng = np.random if seed is None else np.random.default_rng (seed )
+        pick = starts[:, None] + (rng.random (
+            (len(X), Y.shape[1])) * counts[:, None]).astype (int )
+        Y = np.take_along_axis (Y[order], pick, axis =0 )
+    Y = Y.reshape ((len(X),) + rhoa.shape[1:])
+    
+    if not outdf: 
+        return X, Y 
+    columns = (list(columns) if columns is not None else 
+               range(Y.shape[1]) if Y.ndim ==2 else ['resistivity'])
+    return pd.concat ([pd.DataFrame ({'AB': X }), pd.DataFrame (
+        Y.reshape (len(X), -1 ), columns = columns )], axis =1 )
+
+# Schlumberger linear filter: abscissae `exp(offset + k * spacing) / (AB/2)`
+_VES_FILTER_SIZE = 40 
+_VES_FILTER_SPACING = np.log(10) / 10 # ten abscissae per decade 
+_VES_FILTER_OFFSET = -3. 
+
+@functools.lru_cache (maxsize = 8 )
+def _schlumberger_filter (
+        size: int = _VES_FILTER_SIZE, 
+        spacing: float = _VES_FILTER_SPACING, 
+        offset: float = _VES_FILTER_OFFSET, 
+) -> Tuple[Array, Array]: 
+    """ Design the linear filter of the Schlumberger apparent resistivity. 
+    
+    With the resistivity transform :math:`T(\lambda)` of a layered earth, 
+    the apparent resistivity at the spacing `s` = `AB/2` is the Hankel 
+    transform :math:`\rho_a(s) = s^2 \int_0^\infty T(\lambda) 
+    J_1(\lambda s) \lambda d\lambda`, i.e. a convolution in the logarithm 
+    of `s` and :math:`\lambda`. It is then approximated by the sum 
+    :math:`\sum_k w_k T(e^{b_k}/s)` over abscissae :math:`b_k` equally 
+    spaced by `spacing`. 
+    
+    The weights are fitted in least squares on the transform pair 
+    :math:`T(\lambda) = e^{-\lambda}`, 
+    :math:`\rho_a(s) = s^3 / (1 + s^2)^{3/2}` over twelve decades of `s`, 
+    with their sum constrained to one so a half-space is reproduced 
+    exactly. The filter is designed once and cached. 
+    
+    :param size: int - Number of weights. 
+    :param spacing: float - Spacing of the abscissae in natural logarithm. 
+    :param offset: float - First abscissa in natural logarithm. 
+    :returns: read-only arrays of the abscissae :math:`e^{b_k}` and the 
+        weights :math:`w_k`. 
+    """
+    b = offset + spacing * np.arange(size )
+    x = np.linspace (-7, 7, 1200 ) # ln(s)
+    lam = np.exp (b[None, :] - x[:, None])
+    s = np.exp (x)
+    A = np.vstack ((np.exp (-lam), np.full (size, 1e2 ))) 
+    y = np.append (s**3 / (1 + s**2 )**1.5, 1e2 )
+    w = np.linalg.lstsq (A, y, rcond =None )[0]
+    
+    lam, w = np.exp (b ), w 
+    lam.flags.writeable = False ; w.flags.writeable = False 
+    return lam, w 
+
+def _resistivity_transform (
+        lam: Array[float], 
+        rho: Array[float], 
+        h: Array[float]
+) -> Array[float]: 
+    """ Resistivity transform of layered models by the Pekeris recurrence 
+    from the bottom half-space up to the surface.
+    
+    The recurrence :math:`T_k = (T_{k+1} + \rho_k t_k) / (1 + T_{k+1} t_k 
+    / \rho_k)` with :math:`t_k = \tanh(\lambda h_k)` runs on the 
+    transform normalized by the resistivity of the current layer, 
+    :math:`u_k = T_k / \rho_k = (u + t_k) / (1 + u t_k)` where 
+    :math:`u = u_{k+1} \rho_{k+1} / \rho_k`, in place. 
+    
+    :param lam: array (n_spacings, n_filter) - Wavenumbers. 
+    :param rho: array (n_models, n_layers) - Layer resistivities. 
+    :param h: array (n_models, n_layers - 1) - Layer thicknesses. 
+    :returns: array (n_models, n_spacings, n_filter). 
+    """
+    shape = (len(rho),) + lam.shape 
+    u = np.ones (shape )
+    th = np.empty (shape ); tmp = np.empty (shape )
+    ratio = rho[:, 1:] / rho[:, :-1]
+    for k in range (h.shape[1] -1, -1, -1): 
+        np.tanh (np.multiply (lam, h[:, k, None, None], out = th ), out = th )
+        u *= ratio[:, k, None, None]
+        np.multiply (u, th, out = tmp ); tmp += 1 
+        u += th ; u /= tmp 
+    u *= rho[:, 0, None, None]
+    
+    return u 
+
+def forwardVES (
+        AB: Array[float], 
+        rho: Array[float], 
+        h: Array[float], 
+        chunksize: Optional[int] = None, 
+) -> Array[float]: 
+    """ Compute the Schlumberger apparent resistivity of layered earth 
+    models at all the spacings `AB` at once. 
+    
+    The Hankel transform of the resistivity transform is evaluated by 
+    the linear digital filter of :func:`_schlumberger_filter`, precomputed 
+    once, so a whole batch of models is computed in a single array 
+    operation. The relative error against the numerical integration is 
+    below ``1e-4`` for resistivity contrasts up to ``1e4``. 
+    
+    :param AB: array-like - Half-spacing `AB/2` of the current electrodes 
+        in meters. 
+    :param rho: array-like (n_layers,) or (n_models, n_layers) - Layer 
+        resistivities in :math:`\Omega.m` from the surface to the bottom 
+        half-space. 
+    :param h: array-like (n_layers - 1,) or (n_models, n_layers - 1) - 
+        Layer thicknesses in meters, the half-space excluded. 
+    :param chunksize: int - Number of models computed together. The 
+        intermediate arrays hold ``chunksize x len(AB) x 40`` floats; the 
+        default keeps them around 512 kB so they stay in the CPU cache. 
+    :returns: array (n_spacings, ) of a single model or 
+        (n_models, n_spacings) of the apparent resistivities. 
     
-    :param rho0: float - Value of the starting resistivity model. If ``None``, 
-        `rho0` should be the half minumm value of the apparent resistivity  
-        collected. Units is in Ω.m not log10(Ω.m)
-        
+    :Example: 
+        >>> import numpy as np 
+        >>> from kalfeat.tools.exmath import forwardVES 
+        >>> AB = np.logspace (0, 2, 5 ) 
+        >>> forwardVES (AB, [100., 10., 1000.], [2., 10.]).round(2)
+        ... array([97.88, 66.35, 15.01, 30.17, 89.88])
+        >>> rho = np.random.default_rng (0).uniform (10, 1000, (100000, 3))
+        >>> h = np.random.default_rng (1).uniform (1, 20, (100000, 2))
+        >>> forwardVES (AB, rho, h).shape 
+        ... (100000, 5)
+    """
+    AB = np.asarray (AB, dtype = float ) 
+    rho = np.asarray (rho, dtype = float ) 
+    h = np.asarray (h, dtype = float )
+    single = rho.ndim ==1 
+    rho = np.atleast_2d (rho ); h = np.atleast_2d (h )
+    if h.size ==0: 
+        h = np.zeros ((len(rho), 0 ))
+    
+    if AB.ndim !=1 or (AB <= 0).any (): 
+        raise Wex.VESError ("Spacings 'AB' must be a 1-D array of positive"
+                            " distances.")
+    if h.shape != (len(rho), rho.shape[1] -1 ): 
+        raise Wex.VESError (
+            f"Expect {rho.shape[1] -1} thickness(es) per model for "
+            f"{rho.shape[1]} layers; got thicknesses of shape {h.shape}.")
+    if (rho <=0).any () or (h <0).any (): 
+        raise Wex.VESError ("Resistivities must be positive and thicknesses"
+                            " non-negative.")
+    
+    lam, w = _schlumberger_filter () 
+    lam = lam[None, :] / AB[:, None]
+    if chunksize is None: 
+        chunksize = max (1, 2**16 // lam.size )
+    rhoa = np.empty ((len(rho), len(AB)))
+    for k in range (0, len(rho), chunksize ): 
+        rhoa [k: k + chunksize ] = _resistivity_transform (
+            lam, rho[k: k + chunksize], h[k: k + chunksize] ) @ w 
+        
+    return rhoa[0] if single else rhoa 
+
+# bounds of the layer resistivities (ohm.m) and minimum thickness (m)
+# explored by the inversions; the thicknesses are also bounded by ten times
+# the largest spacing
+_VES_RHO_BOUNDS = (1e-1, 1e6 )
+_VES_MIN_THICKNESS = 1e-2
+
+def _starting_model (
+        AB: Array[float],
+        rhoa: Array[float],
+        nlayers: int,
+        rho0: Optional[float | Array[float]] = None,
+        h0: Optional[float] = None
+) -> Tuple[Array[float], Array[float]]:
+    """ Build the starting layered model of the inversions.
+
+    The bottoms of the layers are log-spaced from `h0` down to half the
+    largest spacing `AB`. The resistivities are `rho0` or, when not given,
+    read on the sounding curve at twice the depth of the middle of each
+    layer.
+
+    :returns: resistivities (nlayers, ) and thicknesses (nlayers - 1, ).
+    """
+    if nlayers < 2:
+        raise Wex.VESError (f"Expect at least two layers; got {nlayers}.")
+    h0 = 1. if h0 is None else float(h0 )
+    h = np.diff (np.geomspace (h0, max (AB.max () / 2, h0 ), nlayers -1 ),
+                 prepend = 0. )
+    if rho0 is None:
+        zmid = np.append (np.cumsum (h) - h / 2, 1.5 * h.sum ())
+        rho0 = np.exp (np.interp (np.log (2 * zmid ), np.log (AB ),
+                                  np.log (rhoa )))
+
+    return np.broadcast_to (np.asarray (rho0, dtype = float ),
+                            (nlayers,)).copy(), h
+
+def _parameter_bounds (
+        AB: Array[float],
+        nlayers: int,
+        thickness: bool = True
+) -> Tuple[Array[float], Array[float]]:
+    """ Lower and upper bounds of the log-resistivities of `nlayers` layers
+    followed, with `thickness`, by the bounds of their log-thicknesses."""
+    lo, hi = np.full (nlayers, np.log (_VES_RHO_BOUNDS[0])), np.full (
+        nlayers, np.log (_VES_RHO_BOUNDS[1]))
+    if thickness:
+        lo = np.append (lo, np.full (nlayers -1, np.log (_VES_MIN_THICKNESS)))
+        hi = np.append (hi, np.full (nlayers -1, np.log (10 * AB.max ())))
+    return lo, hi
+
+def _log_responses (
+        AB: Array[float],
+        M: Array[float],
+        nlayers: int
+) -> Array[float]:
+    """ Logarithms of the responses of a batch of models `M` (nmodels,
+    2 * nlayers - 1) of log-resistivities then log-thicknesses."""
+    return np.log (forwardVES (AB, np.exp (M[:, :nlayers]),
+                               np.exp (M[:, nlayers:])))
+
+def _invert_damped (
+        AB: Array[float],
+        rhoa: Array[float],
+        rho0: Optional[float | Array[float]] = None,
+        h0: Optional[float] = None,
+        nlayers: Optional[int] = None,
+        occam: bool = False,
+        mu: float = .05,
+        maxiter: int = 50,
+        tol: float = 1e-3,
+        step: float = 1e-4,
+) -> Dict[str, Any]:
+    """ Damped least-squares inversion of a sounding curve.
+
+    The misfit of the logarithms of the apparent resistivities is minimized
+    by Levenberg-Marquardt iterations over the logarithms of the parameters.
+    At each iteration, the Jacobian is computed by forward differences and
+    three damping factors are tried, each in a single batched call of
+    :func:`forwardVES`. With `occam`, the thicknesses are kept fixed and
+    only the resistivities are inverted with the roughness penalty
+    ``mu * ||R log(rho)||^2`` where `R` takes the differences between
+    adjacent layers.
+
+    See :func:`invertVES` for the parameters and the outputs.
+    """
+    AB = np.asarray (AB, dtype = float ); d = np.log (rhoa )
+    nlayers = (20 if occam else 3 ) if nlayers is None else int(nlayers )
+    rho, h = _starting_model(AB, rhoa, nlayers, rho0 = rho0, h0 = h0 )
+
+    # the parameters are the log-resistivities then the log-thicknesses
+    m = np.log (rho )
+    if not occam:
+        m = np.append (m, np.log (h ))
+    lo, hi = _parameter_bounds (AB, nlayers, thickness = not occam )
+    R = np.diff (np.eye (nlayers), axis =0 ) if occam else np.zeros (
+        (0, nlayers ))
+    RtR = np.zeros ((len(m), len(m)))
+    RtR [:nlayers, :nlayers] = mu * R.T @ R
+
+    def objective (M ):
+        """ Log-responses and objectives of a batch of models."""
+        thickness = np.broadcast_to (h, (len(M), nlayers -1 )) if occam else (
+            np.exp (M[:, nlayers:]))
+        logF = np.log (forwardVES (AB, np.exp (M[:, :nlayers]), thickness ))
+        phi = ((d - logF)**2 ).sum (axis =1 ) + mu * (
+            (M[:, :nlayers] @ R.T )**2 ).sum (axis =1 )
+        return logF, np.where (np.isfinite (phi), phi, np.inf )
+
+    (f,), (phi,) = objective (m[None])
+    misfits = [np.sqrt (np.mean ((d - f)**2 ))]
+    times, lam, converged, it = [], 1., False, 0
+    for it in range (1, maxiter + 1 ):
+        t0 = time.perf_counter ()
+        Fj, _ = objective (m + step * np.eye (len(m)))
+        J = (Fj - f ).T / step
+        A = J.T @ J + RtR
+        g = J.T @ (d - f ) - RtR @ m
+        lams = lam * np.array ([.1, 1., 10. ])
+        D = np.diag (np.diag (A )) + 1e-12 * np.eye (len(m))
+        M = np.clip (m + np.linalg.solve (
+            A + lams[:, None, None] * D, np.broadcast_to (
+                g[:, None], (3, len(m), 1)))[..., 0], lo, hi )
+        Fm, phim = objective (M )
+        k = np.argmin (phim )
+        times.append (time.perf_counter () - t0 )
+        if phim[k] < phi:
+            decrease = (phi - phim[k]) / phi
+            m, f, phi, lam = M[k], Fm[k], phim[k], lams[k]
+            misfits.append (np.sqrt (np.mean ((d - f)**2 )))
+            if decrease < tol:
+                converged = True ; break
+        else:
+            # no step decreases the objective: damp harder until the step
+            # vanishes then stop the stalled inversion unconverged
+            lam *= 100.
+            if lam > 1e10:
+                break
+
+    rho = np.exp (m[:nlayers])
+    h = h if occam else np.exp (m[nlayers:])
+
+    return dict (rho = rho, h = h, depth = np.cumsum (h), AB = AB,
+                 rhoa = np.asarray (rhoa, dtype = float ),
+                 response = np.exp (f), rms = misfits[-1],
+                 misfits = np.array (misfits ), niter = it,
+                 converged = converged, times = np.array (times ))
+
+def _hmc_chains (task: tuple ) -> Dict[str, Any]:
+    """ Run a group of Hamiltonian Monte Carlo chains in lockstep.
+
+    Module-level worker of :func:`_invert_hmc` so it can be pickled to the
+    process pool. The chains move in the whitened space ``z`` of the
+    parameters ``m = m0 + L z`` so a single step size fits all the
+    parameters. Each leapfrog step evaluates the potentials and the
+    forward-difference gradients of all the chains in one call of
+    :func:`forwardVES`. The gradients are a deterministic function of the
+    position so the leapfrog stays reversible and volume preserving and the
+    Metropolis correction keeps the posterior exact.
+
+    Each chain draws from its own generator so the samples of a chain do not
+    depend on the group it runs in. The step sizes are adapted towards an
+    acceptance rate of ``0.65`` during the warm-up then frozen.
+
+    :param task: tuple - ``(AB, d, sigma, nlayers, m0, L, lo, hi, seeds,
+        nwarmup, nsamples, nleapfrog, step)``
+    :returns: dict of the `samples` (nchains, nsamples, nparams) of the
+        log-parameters, the `acceptance` rate of each chain, the mean
+        `misfits` of the chains and the wall-clock `times` of the iterations.
+    """
+    (AB, d, sigma, nlayers, m0, L, lo, hi, seeds, nwarmup, nsamples,
+     nleapfrog, step ) = task
+    rngs = [np.random.default_rng (s) for s in seeds ]
+    nchains, nparams = len(rngs), len(m0)
+    shifts = np.vstack ((np.zeros (nparams), step * np.eye (nparams)))
+    # the products are taken chain by chain with `einsum` rather than by the
+    # BLAS whose rounding depends on the number of rows i.e. of chains
+    model = lambda Z: m0 + np.einsum ('cq,pq->cp', Z, L )
+
+    def potential (Z ):
+        """ Potentials, gradients and residuals of the chains at `Z`."""
+        M = model (Z )
+        inside = ((M >= lo) & (M <= hi)).all (axis =1 )
+        M = np.clip (M, lo, hi )[:, None] + shifts
+        logF = _log_responses (AB, M.reshape (-1, nparams ), nlayers ).reshape (
+            nchains, nparams + 1, -1 )
+        r = d - logF[:, 0]
+        J = (logF[:, 1:] - logF[:, :1]) / step
+        U = (r**2 ).sum (axis =1 ) / (2 * sigma**2 )
+        G = np.einsum ('cp,pq->cq', - np.einsum ('cpn,cn->cp', J, r ), L
+                       ) / sigma**2
+        return np.where (inside & np.isfinite (U), U, np.inf ), G, r
+
+    # overdispersed starting points, pulled inside the bounds
+    Z = np.array ([g.standard_normal (nparams ) for g in rngs ])
+    Z = np.einsum ('cq,pq->cp', np.clip (model (Z ), lo + 1e-3, hi - 1e-3 )
+                   - m0, np.linalg.inv (L ))
+    U, G, r = potential (Z )
+    log_eps = np.full (nchains, np.log (.5 ))
+    accepted = np.zeros (nchains )
+    samples = np.empty ((nchains, nsamples, nparams ))
+    misfits = [np.sqrt (np.mean (r**2 ))]
+    times = []
+    for it in range (nwarmup + nsamples ):
+        t0 = time.perf_counter ()
+        P = np.array ([g.standard_normal (nparams ) for g in rngs ])
+        # jitter the step sizes to avoid the periodic trajectories
+        eps = (np.exp (log_eps ) * np.array ([g.uniform (.8, 1. )
+                                              for g in rngs ]))[:, None]
+        H0 = U + .5 * (P**2 ).sum (axis =1 )
+        Zn, Pn, diverged = Z, P - .5 * eps * G, np.zeros (nchains, dtype =bool)
+        for k in range (nleapfrog ):
+            Zn = Zn + eps * Pn
+            Un, Gn, rn = potential (Zn )
+            diverged |= np.isinf (Un )
+            Pn = Pn - (.5 if k == nleapfrog - 1 else 1. ) * eps * Gn
+        Hn = np.where (diverged, np.inf, Un + .5 * (Pn**2 ).sum (axis =1 ))
+        with np.errstate (over ='ignore', invalid ='ignore'):
+            a = np.nan_to_num (np.minimum (1., np.exp (H0 - Hn )))
+        accept = np.array ([g.random () for g in rngs ]) < a
+        Z, U, G, r = (np.where (accept[:, None], Zn, Z ),
+                      np.where (accept, Un, U ),
+                      np.where (accept[:, None], Gn, G ),
+                      np.where (accept[:, None], rn, r ))
+        if it < nwarmup:
+            log_eps += (a - .65 ) / np.sqrt (it + 1 )
+        else:
+            accepted += accept
+            samples [:, it - nwarmup] = np.clip (model (Z ), lo, hi )
+        misfits.append (np.sqrt (np.mean (r**2 )))
+        times.append (time.perf_counter () - t0 )
+
+    return dict (samples = samples, acceptance = accepted / max (nsamples, 1 ),
+                 misfits = np.array (misfits ), times = np.array (times ))
+
+def _potential_scale_reduction (samples: Array[float] ) -> Array[float]:
+    """ Gelman-Rubin statistic of each parameter of the `samples` (nchains,
+    nsamples, nparams); ``nan`` with a single chain."""
+    nchains, n = samples.shape[:2]
+    if nchains < 2 or n < 2:
+        return np.full (samples.shape[2], np.nan )
+    W = samples.var (axis =1, ddof =1 ).mean (axis =0 )
+    B = n * samples.mean (axis =1 ).var (axis =0, ddof =1 )
+    with np.errstate (divide ='ignore', invalid ='ignore'):
+        return np.sqrt (((n - 1 ) / n * W + B / n ) / W )
+
+def _invert_hmc (
+        AB: Array[float],
+        rhoa: Array[float],
+        rho0: Optional[float | Array[float]] = None,
+        h0: Optional[float] = None,
+        nlayers: Optional[int] = None,
+        nchains: int = 4,
+        nsamples: int = 500,
+        nwarmup: int = 250,
+        nleapfrog: int = 10,
+        sigma: Optional[float] = None,
+        quantiles: Tuple[float, ...] = (.05, .5, .95 ),
+        seed: Optional[int] = None,
+        n_jobs: Optional[int] = None,
+        step: float = 1e-4,
+        **kws
+) -> Dict[str, Any]:
+    """ Hamiltonian Monte Carlo inversion of a sounding curve.
+
+    The posterior of the log-resistivities and log-thicknesses of the layers
+    is the gaussian likelihood of the logarithms of the apparent
+    resistivities with a uniform prior within the bounds of the parameters.
+    The chains start around the damped least-squares model and are whitened
+    by its Laplace covariance. They are split in groups run in lockstep, one
+    group per worker process.
+
+    See :func:`invertVES` for the parameters and the outputs.
+    """
+    AB = np.asarray (AB, dtype = float ); d = np.log (rhoa )
+    r0 = _invert_damped (AB, rhoa, rho0 = rho0, h0 = h0, nlayers = nlayers,
+                         **kws )
+    nlayers = len(r0['rho'])
+    m0 = np.log (np.append (r0['rho'], r0['h']))
+    lo, hi = _parameter_bounds (AB, nlayers )
+    sigma = max (r0['rms'], 1e-2 ) if sigma is None else float(sigma )
+
+    # whiten the parameters with the covariance of the linearized posterior,
+    # regularized for the parameters the data do not resolve
+    logF = _log_responses (AB, m0 + np.vstack ((np.zeros (len(m0)), 
+                                                step * np.eye (len(m0)))), 
+                           nlayers )
+    J = (logF[1:] - logF[0]).T / step
+    L = np.linalg.cholesky (np.linalg.inv (J.T @ J / sigma**2 + np.eye (
+        len(m0))))
+
+    if n_jobs is not None and n_jobs < 0:
+        n_jobs = os.cpu_count () or 1
+    groups = np.array_split (np.random.SeedSequence (seed ).spawn (nchains ),
+                             min (n_jobs or 1, nchains ))
+    outs = run_in_pool (_hmc_chains, [
+        (AB, d, sigma, nlayers, m0, L, lo, hi, list(seeds), nwarmup, nsamples,
+         nleapfrog, step ) for seeds in groups ], n_jobs = n_jobs )
+
+    samples = np.concatenate ([o['samples'] for o in outs ])
+    values = np.exp (samples.reshape (-1, len(m0)))
+    rho_q = np.quantile (values[:, :nlayers], quantiles, axis =0 )
+    h_q = np.quantile (values[:, nlayers:], quantiles, axis =0 )
+    depth_q = np.quantile (np.cumsum (values[:, nlayers:], axis =1 ),
+                           quantiles, axis =0 )
+    rho, h = np.median (values[:, :nlayers], axis =0 ), np.median (
+        values[:, nlayers:], axis =0 )
+    response = forwardVES (AB, rho, h )
+    rhat = _potential_scale_reduction (samples )
+    weights = [len(seeds) for seeds in groups ]
+
+    return dict (rho = rho, h = h, depth = np.cumsum (h ), AB = AB,
+                 rhoa = np.asarray (rhoa, dtype = float ), response = response,
+                 rms = np.sqrt (np.mean ((d - np.log (response ))**2 )),
+                 misfits = np.average ([o['misfits'] for o in outs ], axis =0,
+                                       weights = weights ),
+                 niter = nwarmup + nsamples,
+                 converged = bool (np.all (rhat < 1.1 )) if nchains > 1 else True,
+                 times = np.max ([o['times'] for o in outs ], axis =0 ),
+                 quantiles = np.asarray (quantiles ), rho_quantiles = rho_q,
+                 h_quantiles = h_q, depth_quantiles = depth_q,
+                 samples = np.exp (samples ), acceptance = np.concatenate (
+                     [o['acceptance'] for o in outs ]), rhat = rhat )
+
+def invertVES (data: DataFrame[DType[float|int]] = None,
+               rho0: float = None ,
+               h0 : float = None,
+               typeof : str = 'HMCMC',
+               nlayers: Optional[int] = None,
+               mu: float = .05,
+               maxiter: int = 50,
+               tol: float = 1e-3,
+               nchains: int = 4,
+               nsamples: int = 500,
+               nwarmup: int = 250,
+               sigma: Optional[float] = None,
+               seed: Optional[int] = None,
+               n_jobs: Optional[int] = None,
+               **kwd)-> Dict[str, Any]:
+    """ Invert the |VES| data collected in the exporation area.
+
+    :param data: Dataframe pandas - contains the depth measurement AB from
+        current electrodes, the potentials electrodes MN and the collected
+        apparents resistivities.
+
+    :param rho0: float, array-like - Value of the starting resistivity
+        model, of all the layers or of each layer. If ``None``, the
+        resistivity of each layer is read on the sounding curve at twice
+        the depth of its middle. Units is in Ω.m not log10(Ω.m)
+
     :param h0: float -  Thickness  in meter of the first layers in meters.
-         If ``None``, it should be the minimum thickess as possible ``1.`` m. 
-    
-    :param typeof: str - Type of inversion scheme. The defaut is Hybrid Monte 
+         If ``None``, it should be the minimum thickess as possible ``1.`` m.
+         The bottoms of the next layers are log-spaced down to half the
+         largest spacing `AB`.
+
+    :param typeof: str - Type of inversion scheme. The defaut is Hybrid Monte
         Carlo (HMC) known as ``HMCMC`` . Another scheme is Bayesian neural network
-        approach (``BNN``). 
-    
-    :param kws: dict - Additionnal keywords arguments from |VES| data operations. 
-        See :func:`kalfeat.utils.exmath.vesDataOperator` for futher details. 
-    
+        approach (``BNN``). The deterministic schemes are the damped least
+        squares of a few layers whose resistivities and thicknesses are
+        inverted (``LM`` for Levenberg-Marquardt) and the smooth model of
+        many layers of fixed thicknesses (``OCCAM``).
+
+    :param nlayers: int - Number of layers including the bottom half-space.
+        Default is ``3`` for ``HMCMC`` and ``LM`` and ``20`` for ``OCCAM``.
+
+    :param mu: float - Weight of the roughness penalty of ``OCCAM``.
+
+    :param maxiter: int - Maximum number of iterations.
+
+    :param tol: float - The inversion has converged when an iteration
+        decreases the objective by less than this relative amount. It has
+        not converged when it stalls, i.e. no damped step decreases the
+        objective anymore.
+
+    :param nchains: int - Number of Markov chains of ``HMCMC``. They start
+        around the ``LM`` model and are advanced together.
+
+    :param nsamples: int - Number of samples kept in each chain.
+
+    :param nwarmup: int - Number of warm-up iterations of each chain, used to
+        adapt the step sizes then discarded.
+
+    :param sigma: float - Standard deviation of the noise of the logarithms
+        of the apparent resistivities. If ``None``, it is the misfit of the
+        ``LM`` model, at least ``0.01``.
+
+    :param seed: int - Seed of the chains. Each chain gets its own stream so
+        the samples do not depend on `n_jobs`.
+
+    :param n_jobs: int - Number of worker processes the chains are spread
+        over. ``None`` or ``1`` runs them in the current process and ``-1``
+        uses all the CPUs.
+
+    :param kws: dict - Additionnal keywords arguments from |VES| data operations.
+        See :func:`kalfeat.utils.exmath.vesDataOperator` for futher details.
+
+    :returns: dict of the inverted model: the resistivities `rho` of the
+        layers, their thicknesses `h` and the depths of their bottoms
+        `depth`; the inverted data `AB`, `rhoa` and the `response` of the
+        model; the final relative misfit `rms`, its history `misfits`, the
+        number of iterations `niter`, whether the inversion has `converged`
+        and the wall-clock `times` of the iterations in seconds. With
+        ``HMCMC``, the model is the posterior median; the dict also holds the
+        `quantiles` and the posterior quantiles `rho_quantiles`,
+        `h_quantiles` and `depth_quantiles` of each layer, the `samples`
+        (nchains, nsamples, 2 * nlayers - 1) of the resistivities then the
+        thicknesses, the `acceptance` rate of each chain and the
+        Gelman-Rubin statistic `rhat` of each parameter; it has `converged`
+        when all the `rhat` are below ``1.1``.
+
+    :Example:
+        >>> from kalfeat.tools import vesSelector
+        >>> from kalfeat.tools.exmath import invertVES
+        >>> data = vesSelector ('data/ves/ves_gbalo.xlsx', index_rhoa =2 )
+        >>> r = invertVES (data, typeof ='OCCAM', nlayers =8 )
+        >>> r['depth'].round(1) # bottoms of the layers in meters 
+        ... array([ 1. ,  1.9,  3.7,  7.1, 13.6, 26.1, 50. ])
+        >>> r['rho'].round() 
+        ... array([1207., 1151., 1111.,  788.,  147.,   38.,   97.,  310.])
+        >>> r['rms'], r['niter'], r['converged']
+        ... (0.1184..., 4, True)
+        >>> import numpy as np 
+        >>> AB = np.geomspace (1, 200, 30 )
+        >>> rhoa = forwardVES (AB, [300., 30., 1000.], [3., 15.])
+        >>> r = invertVES (AB = AB, rhoa = rhoa, typeof ='HMCMC', seed =0 )
+        >>> r['rho_quantiles'].round() # 5%, 50% and 95% of each layer
+        ... array([[ 298.,   29.,  934.],
+                   [ 300.,   30.,  999.],
+                   [ 302.,   31., 1068.]])
+        >>> r['h_quantiles'].round(2)
+        ... array([[ 2.97, 14.44],
+                   [ 3.  , 14.99],
+                   [ 3.03, 15.44]])
     """
-    
+    typeof = str(typeof).upper()
+    if typeof not in ('HMCMC', 'BNN', 'LM', 'OCCAM'):
+        raise ValueError (f"Unacceptable inversion scheme {typeof!r}. Use "
+                          f"{smart_format(['HMCMC', 'BNN', 'LM', 'OCCAM'])}.")
     X, Y = vesDataOperator(data =data, **kwd)
+
+    if typeof in ('LM', 'OCCAM'):
+        return _invert_damped (X, Y, rho0 = rho0, h0 = h0, nlayers = nlayers,
+                               occam = typeof =='OCCAM', mu = mu,
+                               maxiter = maxiter, tol = tol )
+    if typeof =='HMCMC':
+        return _invert_hmc (X, Y, rho0 = rho0, h0 = h0, nlayers = nlayers,
+                            nchains = nchains, nsamples = nsamples,
+                            nwarmup = nwarmup, sigma = sigma, seed = seed,
+                            n_jobs = n_jobs, maxiter = maxiter, tol = tol )
+
+    raise NotImplementedError (f"{typeof!r} inversion is not available yet;"
+                               " use 'HMCMC', 'LM' or 'OCCAM' instead.")
+
+    
+def _intersection_bounds (
+        fdiff: F, 
+        lo: float, 
+        hi: float, 
+        intersection: str = 'sample', 
+        sample: int = 1000, 
+) -> Array[float]: 
+    """ Find the bounds of the ranges of ``[lo, hi]`` where `fdiff` is 
+    positive i.e. where the basement curve is above the fitting curve. 
+    
+    :param fdiff: np.poly1d - Difference of the basement curve and the 
+        fitting curve. 
+    :param lo, hi: float - Range of the search. 
+    :param intersection: str - ``sample`` evaluates `fdiff` on `sample` 
+        points and keeps the runs of positive values as in the original 
+        implementation, so the bounds snap on the sampled grid. ``exact`` 
+        solves the real roots of `fdiff` through the eigenvalues of its 
+        companion matrix (:func:`numpy.roots`). 
+    :param sample: int - Number of points of the grid in ``sample`` mode.
+    :returns: array of the bounds in pairs ``[a0, b0, a1, b1, ...]``; empty 
+        when `fdiff` is never positive. 
+    """
+    intersection = str(intersection).lower() 
+    if intersection not in ('sample', 'exact'): 
+        raise ValueError (f"Unacceptable argument {intersection!r}. Use "
+                          "'sample' or 'exact' for intersection.")
+    if intersection =='sample': 
+        xx = np.linspace(lo, hi, int(sample))
+        return xx[find_run_bounds(fdiff(xx) > 0 )] 
+    
+    r = np.roots (fdiff.coeffs ) if fdiff.order > 0 else np.zeros ((0,))
+    tol = 1e-9 * max(1., np.abs(r).max(initial =0.))
+    r = np.sort (r[np.abs(r.imag) <= tol].real )
+    breaks = np.concatenate (([lo], r[(r > lo) & (r < hi)], [hi]))
+    # sign of each piece taken at its middle 
+    positive = fdiff((breaks[:-1] + breaks[1:]) /2 ) > 0 
+    if not positive.any(): 
+        return np.zeros ((0,))
+    # merge the adjacent positive pieces ( roots of even multiplicity)
+    edges = np.diff (np.concatenate (([0], positive.astype(int), [0])))
+    starts, = np.where (edges ==1 ) ; ends, = np.where (edges ==-1 )
+    
+    return np.column_stack ((breaks[starts], breaks[ends])).ravel()
+
+def _integrate_pseudo_area (
+        ff: F, 
+        roots: Array[float], 
+        integration: str = 'exact' 
+) -> Tuple[Array[float], Array[float]]: 
+    """ Integrate `ff` between each pair of `roots` and nullify the 
+    negative areas. 
+    
+    :param ff: callable - Curve to integrate, commonly a :class:`numpy.poly1d`.
+    :param roots: array-like - Integration bounds in pairs ``[a0, b0, a1, b1,
+        ...]``. 
+    :param integration: str - ``exact`` integrates a polynomial `ff` through 
+        its antiderivative evaluated at all the bounds at once, with a null 
+        error. ``quad`` uses the adaptive quadrature of 
+        :func:`scipy.integrate.quad` and works for any callable. 
+    :returns: the pseudo-areas and their integration errors. 
+    """
+    integration = str(integration).lower() 
+    if integration not in ('exact', 'quad'): 
+        raise ValueError (f"Unacceptable argument {integration!r}. Use "
+                          "'exact' or 'quad' for integration.")
+    bounds = np.asarray (roots, dtype = float).reshape(-1, 2) 
+    
+    if integration =='exact' and isinstance (ff, np.poly1d): 
+        antider = ff.integ () (bounds)
+        values = antider[:, 1] - antider[:, 0]
+        errors = np.zeros (len(bounds)) 
+    else: 
+        values = np.zeros (len(bounds)) ; errors = np.zeros (len(bounds))
+        for ii, (inf, sup) in enumerate(bounds): 
+            values[ii], errors[ii] = integrate.quad(ff, a = inf, b = sup)
+            
+    return np.where (values < 0, 0., values), errors 
+    
+class VESComputation : 
+    """ Memoized stages of the ohmic-area computation of a sounding curve. 
+    
+    :func:`ohmicArea` runs a chain of stages: the reduction of the 
+    duplicated spacings, the polynomial fit of the sounding curve, the 
+    basement curve from `ohmSkey` with the second fit of the curve beyond 
+    it, the integration bounds and the pseudo-areas. Each stage keeps its 
+    last result with the key of its inputs, i.e. its own arguments and the 
+    stages it depends on. A stage is recomputed only when its key changes, 
+    so the same sounding can be drawn with ``objective='view'`` or evaluated 
+    from another `ohmSkey` without reducing nor fitting the curve again. 
+    The cached arrays are read-only. 
+    
+    The objects are shared through :func:`ves_computation` which keys them by 
+    the hash of the data and the operator settings. 
+    
+    :param AB: array-like - Spacing of the current electrodes `AB/2`. 
+    :param rhoa: array-like - Apparent resistivities of the sounding. 
+    :param typeofop: str - Operation on the duplicated `AB`. See 
+        :func:`vesDataOperator`. 
+    :param seed: int - Seed of the ``leaveOneOut`` operation. 
     
-    pass 
+    :Example: 
+        >>> from kalfeat.tools.coreutils import vesSelector 
+        >>> from kalfeat.tools.exmath import ves_computation 
+        >>> data = vesSelector ('data/ves/ves_gbalo.xlsx', index_rhoa =3 )
+        >>> vc = ves_computation (data )
+        >>> [vc.area (ohmSkey, 'exact', 'sample', 1000 )[0].sum().round(3) 
+        ...  for ohmSkey in (30, 45)]
+        ... [789.593, 350.702]
+        >>> vc.computed # the curve was reduced and fitted once 
+        ... Counter({'basement': 2, 'bounds': 2, 'area': 2, 'curve': 1, 
+                     'fit': 1})
+    """
+    __slots__ = ('AB', 'rhoa', 'typeofop', 'seed', 'computed', '_stages')
+    
+    def __init__ (
+            self, 
+            AB: Array[float], 
+            rhoa: Array[float], 
+            typeofop: str = 'mean', 
+            seed: Optional[int] = None 
+            ): 
+        self.AB = AB 
+        self.rhoa = rhoa 
+        self.typeofop = typeofop 
+        self.seed = seed 
+        # number of computations of each stage 
+        self.computed: Counter = Counter () 
+        self._stages: Dict [str, Tuple[Any, Any]] = {}
+        
+    def _memo (self, stage: str, key: Any, compute: F ) -> Any : 
+        """ Return the result of `stage` for `key`, computed by `compute` 
+        when the cached result belongs to another key."""
+        cached = self._stages.get (stage )
+        if cached is not None and cached[0] == key: 
+            return cached[1]
+        value = compute ()
+        for v in (value if isinstance (value, tuple) else (value,)): 
+            if isinstance (v, np.ndarray ): 
+                v.flags.writeable = False 
+        self._stages [stage] = (key, value )
+        self.computed [stage] += 1 
+        return value 
+        
+    @property 
+    def curve (self ) -> Tuple[Array[float], Array[float]]: 
+        """ Spacings and resistivities once the duplicated `AB` reduced."""
+        return self._memo ('curve', None, lambda: vesDataOperator (
+            self.AB, self.rhoa, typeofop = self.typeofop, seed = self.seed )) 
+    
+    @property 
+    def fit (self ) -> Tuple[F, Array[float], Array[float]]: 
+        """ Polynomial fit of the curve and its projected samples. See 
+        :func:`fitfunc`."""
+        return self._memo ('fit', None, lambda: fitfunc (*self.curve ))
+    
+    def basement (self, ohmSkey: float ) -> Dict[str, Any]: 
+        """ Basement curve from `ohmSkey` and the fit of the curve beyond it.
+        
+        :returns: dict of the index `oIx` of the spacing closest to 
+            `ohmSkey`, the spacings `oB` from it, the basement curve `f_brl`, 
+            its intercept `beta`, its difference `f_diff` to the fitting 
+            curve and the difference `ff` of the fit of the curve beyond 
+            `oIx` to the fitting curve. 
+        """
+        def compute (): 
+            (X, Y ), (f_rhotl, *_ ) = self.curve, self.fit 
+            oIx = int (np.argmin (np.abs (X - ohmSkey )))
+            f_brl, beta = dummy_basement_curve (f_rhotl, ohmSkey )
+            f45, *_ = fitfunc (X[oIx:], Y[oIx:])
+            return dict (oIx = oIx, oB = X[oIx:], f_brl = f_brl, beta = beta, 
+                         f_diff = np.poly1d ([np.sin (np.deg2rad (45 )), beta ]
+                                             ) - f_rhotl, 
+                         ff = f45 - f_rhotl )
+        return self._memo ('basement', ohmSkey, compute )
+    
+    def bounds (
+            self, 
+            ohmSkey: float, 
+            intersection: str = 'sample', 
+            sample: int = 1000 
+            ) -> Array[float]: 
+        """ Integration bounds in pairs. See :func:`_intersection_bounds`."""
+        def compute (): 
+            b = self.basement (ohmSkey )
+            return _intersection_bounds (b['f_diff'], b['oB'].min (), 
+                                         b['oB'].max (), 
+                                         intersection = intersection, 
+                                         sample = sample )
+        return self._memo ('bounds', (ohmSkey, intersection, sample ), 
+                           compute )
+    
+    def area (
+            self, 
+            ohmSkey: float, 
+            integration: str = 'exact', 
+            intersection: str = 'sample', 
+            sample: int = 1000 
+            ) -> Tuple[Array[float], Array[float]]: 
+        """ Pseudo-areas and their integration errors. See 
+        :func:`_integrate_pseudo_area`."""
+        return self._memo ('area', (ohmSkey, integration, intersection, sample), 
+                           lambda: _integrate_pseudo_area (
+                               self.basement (ohmSkey )['ff'], self.bounds (
+                                   ohmSkey, intersection, sample ), 
+                               integration ))
 
+# memoized computations, the least recently used first 
+_VES_COMPUTATIONS: OrderedDict = OrderedDict () 
+_VES_COMPUTATIONS_MAXSIZE = 32 
+
+def ves_computation (
+        data: DataFrame = None, 
+        AB: Array[float] = None, 
+        rhoa: Array[float] = None, 
+        typeofop: str = None, 
+        seed: Optional[int] = None, 
+) -> VESComputation : 
+    """ Return the memoized :class:`VESComputation` of a sounding curve. 
+    
+    The computations are keyed by the sha1 digest of the spacings and 
+    resistivities with the operator settings; the ``32`` most recently used 
+    are kept. The random ``leaveOneOut`` operation without an integer `seed` 
+    is not memoized. 
+    
+    :param data: DataFrame - `AB` and `resistivity` of the sounding as 
+        outputed by :func:`~kalfeat.tools.coreutils.vesSelector`. 
+    :param AB, rhoa: array-like - Spacings and resistivities when `data` is 
+        not given. 
+    :param typeofop: str - Operation on the duplicated `AB`. See 
+        :func:`vesDataOperator`. 
+    :param seed: int - Seed of the ``leaveOneOut`` operation. 
+    :returns: the computation, shared with the previous calls on the same 
+        curve. 
+    """
+    if data is not None: 
+        data = _assert_all_types(data, pd.DataFrame)
+        AB, rhoa = data.AB, data.resistivity 
+    AB, rhoa = np.asarray (AB ), np.asarray (rhoa )
+    typeofop = 'mean' if typeofop is None else typeofop 
+    if (str(typeofop).lower() =='leaveoneout' and not isinstance (
+            seed, (int, np.integer ))): 
+        return VESComputation (AB, rhoa, typeofop = typeofop, seed = seed )
+    
+    digest = hashlib.sha1 () 
+    for a in (AB, rhoa ): 
+        digest.update (repr ((a.dtype.str, a.shape )).encode ())
+        digest.update (np.ascontiguousarray (a ).tobytes ())
+    key = (digest.hexdigest (), str(typeofop).lower(), seed ) 
+    
+    vc = _VES_COMPUTATIONS.get (key )
+    if vc is None: 
+        vc = _VES_COMPUTATIONS [key] = VESComputation (
+            AB.copy (), rhoa.copy (), typeofop = typeofop, seed = seed )
+        if len(_VES_COMPUTATIONS) > _VES_COMPUTATIONS_MAXSIZE: 
+            _VES_COMPUTATIONS.popitem (last = False )
+    _VES_COMPUTATIONS.move_to_end (key )
+    
+    return vc 
     
 def ohmicArea(
         data: DataFrame[DType[float|int]] = None, 
         ohmSkey: float = 45., 
         sum : bool = False, 
         objective: str = 'ohmS',
+        integration: str = 'exact', 
+        intersection: str = 'sample', 
+        sample: int = 1000, 
         **kws
 ) -> float: 
     r""" 
@@ -377,7 +1264,8 @@ def ohmicArea(
     -----------
     * data: Dataframe pandas - contains the depth measurement AB from current 
         electrodes, the potentials electrodes MN and the collected apparents 
-        resistivities. 
+        resistivities. Can also be the :class:`VESComputation` of the 
+        sounding, then `kws` are ignored. 
     
     * ohmSkey: float - The depth in meters from which one expects to find a 
         fracture zone outside of pollutions. Indeed, the `ohmSkey` parameter is 
@@ -394,8 +1282,27 @@ def ohmicArea(
         the X and Y values of the expected fractured zone. Where X is the AB dipole 
         spacing when imaging to the depth and Y is the apparent resistivity computed 
     
-    kws: dict - Additionnal keywords arguments from |VES| data operations. 
-        See :func:`kalfeat.tools.exmath.vesDataOperator` for futher details. 
+    * integration: str - Scheme to integrate the pseudo-area. ``exact`` 
+        (default) integrates the polynomial fitting curves analytically 
+        through their antiderivative, so the error is null. ``quad`` uses the 
+        adaptive quadrature of :func:`scipy.integrate.quad`, useful when the 
+        fitting curve is not a polynomial. 
+    
+    * intersection: str - How to find where the basement curve crosses the 
+        fitting curve. ``sample`` (default) evaluates both curves on `sample`
+        points from `ohmSkey` to the maximum depth and keeps the runs where 
+        the basement curve is above, so the roots snap on that grid. 
+        ``exact`` solves the roots of the polynomial difference of both 
+        curves restricted to the same range. 
+    
+    * sample: int - Resolution of the grid in ``sample`` intersection mode. 
+        Default is ``1000``. 
+    
+    kws: dict - Additionnal keywords arguments from |VES| data operations 
+        i.e. `typeofop` and `seed`. See 
+        :func:`kalfeat.tools.exmath.vesDataOperator` for futher details. 
+        The stages of the computation are memoized for the same sounding 
+        curve and operation. See :class:`VESComputation`. 
     
     Returns 
     --------
@@ -428,7 +1335,7 @@ def ohmicArea(
     >>> from kalfeat.tools.coreutils import vesSelector 
     >>> data = vesSelector (f= 'data/ves/ves_gbalo.xlsx') 
     >>> (ohmS, err, roots), *_ = ohmicArea(data = data, ohmSkey =45, sum =True ) 
-    ... (13.46012197818152, array([5.8131967e-12]), array([45.        , 98.07307307]))
+    ... (14.061733903079585, array([0.]), array([45.        , 98.07307307]))
     # pseudo-area is computed between the spacing point AB =[45, 98] depth. 
     >>> _, (XY.shape, XYfit.shape, XYohms_area.shape) = ohmicArea(
                     AB= data.AB, rhoa =data.resistivity, ohmSkey =45, 
@@ -529,8 +1436,9 @@ def ohmicArea(
                         " evaluation or 'graph' for visualization outputs."
                         )
 
-    bound0=[]
-    X, Y = vesDataOperator(data =data, **kws)
+    vc = data if isinstance (data, VESComputation ) else ves_computation(
+        data =data, **kws)
+    X, Y = vc.curve 
     
     try : 
        ohmSkey = str(ohmSkey).lower().replace('m', '')
@@ -544,73 +1452,151 @@ def ohmicArea(
         raise Wex.VESError(f"The startpoint 'ohmSkey={ohmSkey}m'is expected "
                            f"to be less than the 'maxdepth={X.max()}m'.")
 
-    #-------> construct the fitting curves for 1000 points 
-    # create the polyfit function fitting raw(f) from coefficents 
-    # (coefs) of the initial function 
-    f_rhotl, x_new, y_projected = fitfunc (X, Y)
-    
-    # Finding the intercepts between the fitting curve and the dummy 
-    # basement curves 
-    #--> e. g. start from 20m (oix) --> ... searching  and find the index 
-    oIx = np.argmin (np.abs(X - ohmSkey)) 
-    # from this index (oIx) , read the remain depth. 
-    oB = X[int(oIx):] # from O-> end [OB]
-    #--< construct the basement curve from the index of ohmSkey
-    f_brl, beta = dummy_basement_curve( f_rhotl,  ohmSkey)
-    # 1000 points from OB (xx)
-    xx = np.linspace(oB.min(), oB.max(), 1000)
-    b45_projected= f_brl(xx)
-    
-    # create a fit function for b45 and find the limits 
-    # find the intersection between the b45_projected values and 
-    # fpartial projected values are the solution of equations f45 -fpartials 
-    diff_arr = b45_projected - f_rhotl(xx) #ypartial_projected 
-
-    # # if f-y < 0 => f< y so fitting curve is under the basement curve 
-    # # we keep the limit indexes for integral computation 
-    # # we want to keep the 
-    array_masked = np.ma.masked_where (diff_arr < 0 , diff_arr , copy =True)
-    # get indexes of valid values 
-    indexes, = array_masked.nonzero() 
- 
-    try : 
-        ib_indexes = find_bound_for_integration(indexes, b0=bound0)
-    except : 
-        bound0=[] #initialize the bounds lists 
-        ib_indexes =find_limit_for_integration(indexes, b0= bound0) 
-    
-    roots = xx[ib_indexes] 
-    f45, *_ = fitfunc(oB, Y[oIx:])
-    ff = f45 - f_rhotl 
-    pairwise_r = np.split(roots, len(roots)//2 ) if len(
-        roots) > 2 else [np.array(roots)]
-    ohmS = np.zeros((len(pairwise_r,)))
-    err_ohmS = np.zeros((len(pairwise_r,)))
-    for ii, (inf, sup) in enumerate(pairwise_r): 
-        values, err = integrate.quad(ff, a = inf, b = sup)
-        ohmS[ii] = np.zeros((1,)) if values < 0 else values 
-        err_ohmS[ii] = err
-        
-
-    if sum: 
-        ohmS = ohmS.sum()  
-    
-    rv =[
-        (ohmS, err_ohmS, roots),
-         ( np.hstack((X[:, np.newaxis], Y[:, np.newaxis]) ), 
+    # The stages are memoized by `vc`: the reduced curve, its fitting 
+    # curve for 1000 points, the dummy basement curve from the index of 
+    # `ohmSkey` with the fit of the remain depth, the intersections where 
+    # the fitting curve is under the basement curve kept as integral 
+    # limits and the pseudo-areas. Only the stages of the `objective` run.
+    rv = [(None, None, None), (None, None, None)]
+    if objective !='graph': 
+        roots = vc.bounds (ohmSkey, intersection, sample )
+        ohmS, err_ohmS = vc.area (ohmSkey, integration, intersection, sample )
+        rv[0] = (ohmS.sum() if sum else ohmS.copy(), err_ohmS.copy(), 
+                 roots.copy())
+    if objective !='ohms': 
+        _, x_new, y_projected = vc.fit 
+        b = vc.basement (ohmSkey )
+        oB = b['oB']
+        rv[1] = ( np.hstack((X[:, np.newaxis], Y[:, np.newaxis]) ), 
              np.hstack((x_new[:, np.newaxis], y_projected[:, np.newaxis])), 
-             np.hstack((oB[:, np.newaxis], f_brl(oB)[:, np.newaxis]) )
+             np.hstack((oB[:, np.newaxis], b['f_brl'](oB)[:, np.newaxis]) )
          ) 
-        ]    
-        
-    for ii, ( obj , ix) in enumerate( zip(('ohms', 'graph'), [1, -1])): 
-        if objective ==obj : 
-            rv[ii + ix ]= (None, None, None)
-            break 
 
     return rv
  
 
+def _batch_polyfit (
+        x: Array[float], 
+        Y: Array[float] 
+) -> List[Tuple[Array[int], Array[float]]]: 
+    """ Fit every column of `Y` against `x` the way :func:`fitfunc` does. 
+    
+    The degree of each column is the number of its local extrema plus one. 
+    Columns sharing the same degree are solved together since 
+    :func:`numpy.polyfit` accepts a 2-D `y`. 
+    
+    :param x: array-like - Shared x-axis of length `n`. 
+    :param Y: array-like - ``(n, n_curves)`` values to fit.
+    :returns: list of ``(cols, coeffs)`` where `coeffs` is the 
+        ``(degree + 1, len(cols))`` coefficients of the columns `cols`.
+    """
+    Y = np.asarray (Y, dtype = float )
+    ndeg = np.ones (Y.shape[1], dtype = int )
+    for comp in (np.less, np.greater): 
+        _, cols = argrelextrema(Y, comp, axis =0 )
+        ndeg += np.bincount(cols, minlength = Y.shape[1])
+        
+    return [ (cols, np.polyfit(x, Y[:, cols], d )) 
+            for d in np.unique (ndeg) for cols in np.where (ndeg == d) ] 
+
+def batch_ohmic_area (
+        AB: Array[float], 
+        rhoa: Array[float], 
+        ohmSkey: float = 45., 
+        sum: bool = False, 
+        typeofop: str = 'mean', 
+        integration: str = 'exact', 
+        intersection: str = 'sample', 
+        sample: int = 1000, 
+) -> List[Tuple[Array[float], Array[float], Array[float]]]: 
+    """ Compute the ohmic-area of many soundings sharing the same `AB` axis. 
+    
+    It is the batch variant of :func:`ohmicArea`. The duplicated spacing 
+    reduction, the polynomial fits and the search of the integration bounds 
+    are done once for all the sounding curves instead of once per curve. 
+    
+    :param AB: array-like - Spacing of the current electrodes `AB/2` of 
+        length `n`, shared by all the soundings. 
+    :param rhoa: array-like - ``(n, n_soundings)`` apparent resistivities, 
+        one sounding curve per column. 
+    :param ohmSkey: float - The depth in meters from which one expects to 
+        find a fracture zone. See :func:`ohmicArea`. 
+    :param sum: bool - Sum the pseudo-areas of each sounding. 
+    :param typeofop: str - Operation on the duplicated `AB`. See 
+        :func:`vesDataOperator`. 
+    :param integration: str - ``exact`` or ``quad`` integration scheme. 
+        See :func:`ohmicArea`. 
+    :param intersection: str - ``sample`` or ``exact`` search of the 
+        integration bounds. See :func:`ohmicArea`. 
+    :param sample: int - Resolution of the grid in ``sample`` mode. 
+    :returns: list of ``(ohmS, err, roots)`` per sounding as the first 
+        item outputed by :func:`ohmicArea`. A sounding whose fitting curve 
+        never goes under the basement curve has an empty `roots` and an 
+        ohmic-area of ``0``.
+    
+    :Example: 
+        
+        >>> from kalfeat.tools.coreutils import vesSelector 
+        >>> from kalfeat.tools.exmath import batch_ohmic_area 
+        >>> data = vesSelector ('data/ves/ves_gbalo.xlsx', keep_all=True)
+        >>> r = batch_ohmic_area (data.AB, data.iloc[:, 2:], sum =True)
+        >>> [round(ohmS, 3) for ohmS, *_ in r ]
+        ... [14.062, 147.565, 563.224, 350.702]
+    """
+    rhoa = np.asarray (rhoa ) 
+    rhoa = rhoa.reshape(-1, 1) if rhoa.ndim ==1 else rhoa 
+    
+    X, Y = vesDataOperator(AB, rhoa, typeofop = typeofop ) 
+    
+    try : 
+       ohmSkey = str(ohmSkey).lower().replace('m', '')
+       if ohmSkey.find('none')>=0 : 
+           ohmSkey = X.max()/2 
+       ohmSkey = float(ohmSkey)
+    except: 
+        raise ValueError (f'Could not convert value {ohmSkey!r} to float')
+        
+    if ohmSkey >= X.max(): 
+        raise Wex.VESError(f"The startpoint 'ohmSkey={ohmSkey}m'is expected "
+                           f"to be less than the 'maxdepth={X.max()}m'.")
+        
+    oIx = np.argmin (np.abs(X - ohmSkey)) 
+    oB = X[int(oIx):] 
+    xx = np.linspace(oB.min(), oB.max(), int(sample))
+    slope = np.sin(np.deg2rad(45))
+    
+    # rhoT(l) and the refitted curve from `ohmSkey` as polynomials 
+    # per sounding, and the rhoT(l) sampled on the shared axis `xx`
+    nc = Y.shape[1]
+    f_rhotl = [None] * nc ; f45 = [None] * nc 
+    y_rhotl = np.empty ((len(xx), nc )) 
+    for cols, coeffs in _batch_polyfit(X, Y): 
+        y_rhotl[:, cols] = np.vander(xx, len(coeffs)) @ coeffs 
+        for k, c in zip (cols, coeffs.T): 
+            f_rhotl[k] = np.poly1d(c)
+    for cols, coeffs in _batch_polyfit(oB, Y[oIx:]): 
+        for k, c in zip (cols, coeffs.T): 
+            f45[k] = np.poly1d(c)
+            
+    beta = np.array ([ f(ohmSkey) for f in f_rhotl ])
+    # segment the runs where the basement is above for all curves at once
+    if str(intersection).lower() =='sample': 
+        diff_arr = slope * xx[:, None] + beta - y_rhotl 
+        sbounds = find_run_bounds(diff_arr.T > 0 )
+    rv =[]
+    for k in range (nc ): 
+        if str(intersection).lower() =='sample': 
+            roots = xx[sbounds[k]]
+        else: 
+            roots = _intersection_bounds(
+                np.poly1d ([slope, beta[k]]) - f_rhotl[k], oB.min(), 
+                oB.max(), intersection = intersection )
+        ohmS, err_ohmS = _integrate_pseudo_area(
+            f45[k] - f_rhotl[k], roots, integration )
+        rv.append ((ohmS.sum() if sum else ohmS, err_ohmS, roots ))
+        
+    return rv 
+
 def _type_mechanism (
         cz: Array |List[float],
         dipolelength : float =10.
@@ -1009,6 +1995,7 @@ def scalePosition(
     ydata_new = func(xdata, *popt)
     
     if show:
+        import matplotlib.pyplot as plt 
         plt.plot(xdata, ydata, 'b-', label='data')
         plt.plot(xdata, func(xdata, *popt), 'r-',
              label='fit: a=%5.3f, b=%5.3f' % tuple(popt))
@@ -1222,8 +2209,11 @@ def sfi (
     maxl, = argrelextrema(cz,np.greater)
     ixf = len(minl) + len(maxl)
     
-    # create the polyfit function f from coefficents (coefs)
-    coefs  = np.polyfit(x=p, y=cz, deg =ixf + 1 ) 
+    # create the polyfit function f from coefficents (coefs) in the 
+    # coordinates local to the first station `x0`: the fit and its roots 
+    # on the positions lose the precision at km-scale offsets. 
+    x0 = np.asarray (p, dtype = float)[0]
+    coefs  = np.polyfit(x=np.asarray (p) - x0, y=cz, deg =ixf + 1 ) 
     f = np.poly1d(coefs )
     # generate a sample of values to cover the fit function 
     # for degree 2: eq => f(x) =ax2 +bx + c or c + bx + ax2 as 
@@ -1232,10 +2222,8 @@ def sfi (
     # for instance for degree =2 
     # model (f)= [coefs[2] + coefs[1] * x  +   coefs [0]* x**2  for x in xmod]
     # where x_new(xn ) = 1000 points generated 
-    # thus compute ynew (yn) from the poly function f
-    xn  = np.linspace (min(p), max(p), 1000) 
-    yn = f(xn)
-    
+    # thus compute ynew (yn) from the poly function f. The sample is only 
+    # generated to plot the fitting curve. 
     # solve the system to find the different root 
     # from the min resistivity value bound. 
     # -> Get from each anomaly bounds (leftside and right side ) 
@@ -1255,7 +2243,7 @@ def sfi (
     # find the roots from rhoa_side:
     #  f(x) =y => f (x) = rho_side 
     fn = f  - rho_side  
-    roots = np.abs(fn.r )
+    roots = np.abs(fn.r + x0 )
     # detect the rho_side positions 
     ppow = roots [np.where (roots > spos )] if side =='leftside' else roots[
         np.where (roots < spos)]
@@ -1274,7 +2262,8 @@ def sfi (
             sfi = np.sqrt ( (pw/pw_star)**2 + (ma / ma_star )**2 ) % np.sqrt(2)
  
     if plot: 
-        plot_(p,cz,'-ok', xn, yn, raw = raw , **plotkws)
+        xn  = np.linspace (min(p), max(p), 1000) 
+        plot_(p,cz,'-ok', xn, f(xn - x0), raw = raw , **plotkws)
   
     
     return sfi 
@@ -1328,6 +2317,7 @@ def plot_ (
                   figsize = (7, 7) ,**KWS )
     
     """
+    import matplotlib.pyplot as plt 
     plt.style.use(style)
     # retrieve all the aggregated data from keywords arguments
     if (rlabel := kws.get('rlabel')) is not None : 
@@ -1403,7 +2393,7 @@ def plot_ (
     
 def quickplot (arr: Array | List[float], dl:float  =10)-> None: 
     """Quick plot to see the anomaly"""
-    
+    import matplotlib.pyplot as plt 
     plt.plot(np.arange(0, len(arr) * dl, dl), arr , ls ='-', c='k')
     plt.show() 
     
@@ -1450,6 +2440,365 @@ def power (p:Sub[SP[Array, DType [int]]] | List[int] ) -> float :
     return np.abs(p.min()- p.max()) 
 
 
+def _iter_length_groups (
+        arr: Array | List[float], 
+        lengths: Optional [Array[int]] = None 
+) -> Tuple[int, List[Tuple[Array[int], Array]]]: 
+    """ Split a batch of profiles into groups of profiles of equal length. 
+    
+    :param arr: array-like - Either a 2-D ``(n_profiles, n_stations)`` matrix 
+        (padded when `lengths` is given) or a 1-D array of the profiles 
+        concatenated one after another (`lengths` is then required).
+    :param lengths: array-like of int - Number of stations of each profile 
+        for ragged batch.
+    :returns: the number of profiles and a list of ``(rows, matrix)`` where 
+        `rows` are the indexes of the profiles of the group and `matrix` 
+        their values stacked into a ``(len(rows), length)`` array.
+    """
+    arr = np.asarray(arr)
+    if arr.ndim ==1 and lengths is None: 
+        arr = arr.reshape(1, -1 )
+    if arr.ndim ==2 and lengths is None: 
+        return len(arr), [(np.arange(len(arr)), arr)]
+    
+    lengths = np.asarray (lengths, dtype = int ).ravel() 
+    if arr.ndim ==2 : 
+        if len(lengths) != len(arr) or lengths.max(initial =0) > arr.shape[1]: 
+            raise ValueError (
+                "Expect one length per row not greater than the number of"
+                f" columns; got {len(lengths)} lengths for {arr.shape}.")
+        starts = np.arange(len(arr)) * arr.shape[1]
+        arr = arr.ravel() 
+    elif arr.ndim ==1 : 
+        if lengths.sum() != len(arr): 
+            raise ValueError (
+                f"Lengths sum to {lengths.sum()} while the ragged batch holds"
+                f" {len(arr)} values.")
+        starts = np.concatenate (([0], np.cumsum(lengths)[:-1]))
+    else: 
+        raise ValueError (f"Expect a 1-D or 2-D array; got {arr.ndim}-D.")
+        
+    groups =[]
+    for length in np.unique (lengths ): 
+        rows, = np.where (lengths == length )
+        groups.append ((rows, arr[starts[rows, None] + np.arange(length)]))
+        
+    return len(lengths), groups 
+
+def batch_magnitude (
+        czs: Array | List[float], 
+        lengths: Optional [Array[int]] = None 
+) -> Array[float]: 
+    """ Compute the magnitude of many conductive zones at once. 
+    
+    Array-native variant of :func:`magnitude`. 
+    
+    :param czs: array-like - ``(n_profiles, n_stations)`` matrix of the 
+        conductive zones resistivity values or a ragged batch i.e. the 
+        conductive zones concatenated in a 1-D array.
+    :param lengths: array-like of int - Number of stations of each 
+        conductive zone when `czs` is a ragged batch or a padded matrix. 
+    :return: array of the magnitudes in ohm.meters.
+    
+    :Example: 
+        >>> import numpy as np 
+        >>> from kalfeat.tools.exmath import batch_magnitude
+        >>> batch_magnitude ([[1, 5, 3], [10, 2, 4]])
+        ... array([4., 8.])
+        >>> batch_magnitude ([1, 5, 3, 10, 2], lengths =[3, 2])
+        ... array([4., 8.])
+    """
+    n, groups = _iter_length_groups(czs, lengths )
+    mag = np.full (n, np.nan )
+    for rows, cz in groups : 
+        mag [rows] = np.abs (cz.max(axis =1) - cz.min(axis =1))
+    return mag 
+
+def batch_power (
+        ps: Array | List[float], 
+        lengths: Optional [Array[int]] = None 
+) -> Array[float]: 
+    """ Compute the power of many conductive zones at once. 
+    
+    Array-native variant of :func:`power`. 
+    
+    :param ps: array-like - ``(n_profiles, n_stations)`` matrix of the 
+        conductive zones station positions or a ragged batch. 
+    :param lengths: array-like of int - Number of stations of each 
+        conductive zone when `ps` is ragged or padded. 
+    :return: array of the widths of the conductive zones in meters.
+    """
+    n, groups = _iter_length_groups(ps, lengths )
+    pw = np.full (n, np.nan )
+    for rows, p in groups : 
+        pw [rows] = np.abs (p.min(axis =1) - p.max(axis =1))
+    return pw 
+
+def batch_shape (
+        czs: Array | List[float], 
+        s: Optional [Array[int]] = None , 
+        lengths: Optional [Array[int]] = None 
+) -> Array[str]: 
+    """ Compute the shape of many conductive zones at once. 
+    
+    Array-native variant of :func:`shape`; the local extrema on both sides 
+    of the station are counted for all the profiles in a few array 
+    operations instead of calling :func:`scipy.signal.argrelextrema`. 
+    
+    :param czs: array-like - ``(n_profiles, n_stations)`` matrix of the 
+        conductive zones resistivity values or a ragged batch. 
+    :param s: array-like of int - Station position index in each conductive 
+        zone. If ``None``, the index of the minimum resistivity is used. 
+    :param lengths: array-like of int - Number of stations of each 
+        conductive zone when `czs` is ragged or padded. 
+    :return: array of the shapes of anomalies. 
+    
+    :Example: 
+        >>> import numpy as np 
+        >>> from kalfeat.tools.exmath import batch_shape, shape 
+        >>> czs = np.abs (np.random.RandomState(42).randn(4, 7)) 
+        >>> batch_shape (czs)
+        ... array(['H', 'V', 'H', 'K'], dtype='<U1')
+        >>> [shape (cz) for cz in czs ]
+        ... ['H', 'V', 'H', 'K']
+    """
+    n, groups = _iter_length_groups(czs, lengths )
+    if s is not None: 
+        s = np.broadcast_to(np.asarray(s, dtype = int ), (n,))
+        
+    shapes = np.full (n, 'V')
+    for rows, cz in groups : 
+        length = cz.shape[1]
+        s_index = cz.argmin(axis =1) if s is None else s[rows]
+        if (s_index >= length).any(): 
+            raise Wex.StationError(
+                f"Position should be less than {length!r}: got"
+                f" {int(s_index.max())!r}")
+        # strict local minima and maxima; the ends are never extrema 
+        lmin = np.zeros (cz.shape, dtype = bool )
+        lmax = np.zeros (cz.shape, dtype = bool )
+        lmin[:, 1:-1] = (cz[:, 1:-1] < cz[:, :-2]) & (cz[:, 1:-1] < cz[:, 2:])
+        lmax[:, 1:-1] = (cz[:, 1:-1] > cz[:, :-2]) & (cz[:, 1:-1] > cz[:, 2:])
+        
+        left = np.arange(length) < s_index[:, None]
+        right = np.arange(length) > s_index[:, None]
+        nminl, nminr = (lmin & left).sum(1), (lmin & right).sum(1)
+        nmaxl, nmaxr = (lmax & left).sum(1), (lmax & right).sum(1)
+        
+        ls, rs = cz[:, 0], cz[:, -1] 
+        med = np.median (cz, axis =1 )
+        
+        c1 = ((ls >= med) & (rs < med)) | ((ls < med) & (rs >= med))
+        # mirror the truthiness of `(ls and rs) > med` of the scalar shape
+        c2 = ~c1 & (np.where (ls !=0, rs, ls) > med )
+        c3 = ~c1 & ~c2 & (ls < med) & (rs < med)
+        
+        shapes [rows] = np.select (
+            [ c1 & (nminl ==0) & (nminr ==0), 
+              c1 & ((nminl ==0) != (nminr ==0)), 
+              c2 & (nminl ==0) & (nminr ==0), 
+              c2 & (((nminl ==0) & (nminr ==1)) | ((nminr ==0) & (nminl ==1))), 
+              c2 & (nminl >=1) & (nminr >=1), 
+              c3 & ((nmaxl >=1) | (nmaxr >=1))
+              ], 
+            ['C', 'K', 'U', 'H', 'W', 'M'], 
+            default = 'V')
+        
+    return shapes 
+
+def _type_sections (length: int ) -> List[Tuple[int, int]]: 
+    """ Bounds of the subsets of an |ERP| line of `length` stations as split 
+    by :func:`type_`."""
+    nsec = length // 7 
+    if nsec !=0 and length % nsec ==0 : 
+        edges = np.arange(0, length + 1, length // nsec )
+    elif length < 7: 
+        edges = np.array ([0, length ])
+    else: 
+        edges = np.append(
+            np.arange(0, length - length % 7, 7), length )
+    return list(zip (edges[:-1], edges[1:]))
+
+def batch_type (
+        erps: Array | List[float], 
+        lengths: Optional [Array[int]] = None 
+) -> Array[str]: 
+    """ Compute the type of anomaly of many |ERP| lines at once. 
+    
+    Array-native variant of :func:`type_`. Each line is split in the same 
+    subsets as the scalar function and the width status of all the subsets 
+    is computed over the whole batch at once. As in :func:`type_`, the lines 
+    whose subsets have different status are typed ``'PC'``.
+    
+    :param erps: array-like - ``(n_profiles, n_stations)`` matrix of the 
+        apparent resistivity values or a ragged batch of |ERP| lines. 
+    :param lengths: array-like of int - Number of stations of each line when 
+        `erps` is ragged or padded. 
+    :return: array of the types of anomaly. 
+    
+    :Example: 
+        >>> import numpy as np 
+        >>> from kalfeat.tools.exmath import batch_type
+        >>> erps = np.abs (np.random.RandomState(42).randn(3, 21))
+        >>> batch_type (erps) 
+        ... array(['EC', 'NC', 'PC'], dtype='<U2')
+    """
+    n, groups = _iter_length_groups(erps, lengths )
+    types = np.full (n, 'PC')
+    for rows, erp in groups : 
+        erp = erp.astype (float )
+        status = []
+        for a, b in _type_sections(erp.shape[1]): 
+            sub = erp[:, a:b]
+            cols = np.arange(b -a )
+            s_index = sub.argmin(axis =1)[:, None]
+            # first maximum on the left side and last one on the right side
+            ixl = np.where (cols <= s_index , sub, -np.inf).argmax(axis =1)
+            ixr = (b - a - 1) - np.where (
+                cols >= s_index, sub, -np.inf)[:, ::-1].argmax(axis =1)
+            status.append (np.abs (ixl - ixr ) > 4 )
+            
+        status = np.array(status )
+        types [rows] = np.where (status.all(axis =0), 'EC', np.where (
+            (~status).all(axis =0), 'NC', 'PC'))
+        
+    return types 
+
+def _batch_roots (coefs: Array[float] ) -> Array[complex]: 
+    """ Roots of many polynomials of the same degree at once. 
+    
+    The eigenvalues of the companion matrices of all the polynomials are 
+    computed in a single call and come in the order of :func:`numpy.roots`. 
+    The polynomials with a null leading or constant coefficient are left to 
+    :func:`numpy.roots` and their missing roots are padded with ``NaN``. 
+    
+    :param coefs: array-like - ``(n_poly, degree + 1)`` coefficients in 
+        decreasing powers. 
+    :returns: ``(n_poly, degree)`` complex array of the roots. 
+    """
+    coefs = np.asarray (coefs, dtype = float )
+    n, deg = coefs.shape[0], coefs.shape[1] - 1 
+    roots = np.full ((n, deg), np.nan, dtype = complex )
+    regular = (coefs[:, 0] !=0) & (coefs[:, -1] !=0)
+    if deg > 0 and regular.any(): 
+        A = np.zeros ((regular.sum(), deg, deg ))
+        A[:, 1:, :-1] = np.eye (deg - 1 )
+        A[:, 0, :] = - coefs[regular, 1:] / coefs[regular, :1]
+        roots [regular] = np.linalg.eigvals(A)
+    for ix in np.where (~regular)[0]: 
+        r = np.roots (coefs[ix])
+        roots[ix, :len(r)] = r 
+        
+    return roots 
+
+def batch_sfi (
+        czs: Array | List[float], 
+        ps: Optional [Array | List[float]] = None, 
+        s: Optional [Array[int]] = None, 
+        dipolelength: Optional [float] = None, 
+        lengths: Optional [Array[int]] = None 
+) -> Array[float]: 
+    """ Compute the pseudo-fracturing index of many conductive zones at once. 
+    
+    Array-native variant of :func:`sfi`. The zones of the same length and 
+    the same relative station positions share a single Vandermonde matrix: 
+    they are fitted in local coordinates with one least-squares solve per 
+    degree, and the roots of all the fits of a degree are the eigenvalues 
+    of a stack of companion matrices. The roots are moved back on the 
+    station positions by adding the position of the first station, as 
+    :func:`sfi` does, so both agree to round-off even on km-long lines. 
+    
+    :param czs: array-like - ``(n_profiles, n_stations)`` matrix of the 
+        conductive zones resistivity values or a ragged batch. 
+    :param ps: array-like - Station positions of the conductive zones, 
+        shaped as `czs`. If not given, the positions are set from 
+        `dipolelength`. 
+    :param s: array-like of int - Station position index in each conductive 
+        zone. If ``None``, the index of the minimum resistivity is used. 
+    :param dipolelength: float - Distance between stations when `ps` is 
+        not given. The **default** value is ``10.``. 
+    :param lengths: array-like of int - Number of stations of each 
+        conductive zone when `czs` is ragged or padded. 
+    :return: array of the sfi values. ``NaN`` when the side resistivity is 
+        not reached by the fit i.e. when :func:`sfi` returns an empty array. 
+        
+    :Example: 
+        >>> import numpy as np 
+        >>> from kalfeat.tools.exmath import batch_sfi, sfi 
+        >>> czs = np.abs (np.random.RandomState(42).randn(3, 7)) 
+        >>> batch_sfi (czs)
+        ... array([0.9606216 , 0.99839389, 0.09617282])
+        >>> [float(sfi (cz)) for cz in czs ]
+        ... [0.9606216039984953, 0.9983938925774948, 0.09617282435965313]
+    """
+    n, groups = _iter_length_groups(czs, lengths )
+    if ps is not None: 
+        _, pgroups = _iter_length_groups(ps, lengths )
+        if [len(rows) for rows, _ in pgroups] != [
+                len(rows) for rows, _ in groups ]: 
+            raise Wex.StationError (
+                'Array of position and conductive zone must have the same'
+                ' length.')
+    if s is not None: 
+        s = np.broadcast_to(np.asarray(s, dtype = int ), (n,))
+    dipolelength = 10. if dipolelength is None else dipolelength 
+    
+    sfis = np.full (n, np.nan )
+    for ig, (rows, cz) in enumerate (groups) : 
+        cz = cz.astype (float )
+        length = cz.shape[1] 
+        p = np.broadcast_to (np.arange(length) * dipolelength, cz.shape 
+                             ) if ps is None else pgroups[ig][1].astype(float)
+        iz = np.arange (len(cz))
+        if s is None: 
+            s_index = cz.argmin(axis =1)
+            spos = p[iz, s_index ]
+        else: 
+            s_index = s[rows]
+            if (s_index >= length).any(): 
+                raise Wex.StationError (
+                    'Location index must be less than the number of'
+                    f' stations = {length}. {int(s_index.max())} is gotten.')
+            # as `detect_station_position`, positions are read as integers 
+            spos = p.astype (np.int32)[iz, s_index ]
+        # the lowest of the maximum resistivities of both sides 
+        before = np.arange(length) <= s_index[:, None]
+        rho_side = np.minimum (np.where (before, cz, -np.inf).max(axis =1), 
+            np.where (np.arange(length) >= s_index[:, None], cz, -np.inf
+                      ).max(axis =1))
+        
+        pmin, cmin = p.min(axis =1), cz.min(axis =1)
+        pw = np.abs (pmin - p.max(axis =1))
+        ma = np.abs (cz.max(axis =1) - cmin)
+        ma_star = np.abs (cmin - rho_side )
+        
+        x0 = p[:, 0]
+        xs, inv = np.unique (p - x0[:, None], axis =0, return_inverse =True )
+        for ix, x in enumerate (xs) : 
+            zones, = np.where (inv.ravel() == ix )
+            for cols, coefs in _batch_polyfit(x, cz[zones].T ): 
+                iz = zones [cols]
+                # solve the roots in local coordinates then move them on 
+                # the station positions; expanding the polynomials in the 
+                # positions loses the precision at km-scale offsets.
+                coefs = coefs.T.copy() 
+                coefs[:, -1] -= rho_side[iz]
+                roots = np.abs (_batch_roots (coefs ) + x0[iz, None])
+                # the first root beyond the station as in `sfi`
+                with np.errstate (invalid ='ignore'): 
+                    beyond = roots > spos[iz, None]
+                found = beyond.any(axis =1)
+                ppow = roots [np.arange(len(iz)), beyond.argmax(axis =1)]
+                pw_star = np.abs (pmin[iz] - ppow )
+                with np.errstate(all='ignore'):
+                    v = np.sqrt ((pw_star / pw[iz])**2 + (
+                        ma_star[iz] / ma[iz])**2 ) % np.sqrt(2)
+                    v = np.where (v == np.inf, np.sqrt ((pw[iz] / pw_star)**2 
+                        + (ma[iz] / ma_star[iz])**2) % np.sqrt(2), v )
+                sfis [rows[iz]] = np.where (found, v, np.nan )
+                
+    return sfis 
+
 def _find_cz_bound_indexes (
     erp: Union[Array[float, DType[float]], List[float], pd.Series],
     cz: Union [Sub[Array], List[float]] 
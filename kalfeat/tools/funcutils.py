@@ -6,7 +6,10 @@ from __future__ import annotations
 
 import os 
 import sys 
+import time 
+import glob 
 import inspect 
+import itertools 
 import subprocess 
 import warnings
 
@@ -24,7 +27,11 @@ from ..typing import (
     List ,
     DataFrame, 
     Sub,
+    Iterable, 
+    Iterator, 
+    Optional, 
     )
+from .cacheutils import cached_read 
 
 _logger = kalfeatlog.get_kalfeat_logger(__name__)
 
@@ -189,20 +196,27 @@ def accept_types (*objtypes: list ,
         [f'{o.__name__}' for o in objtypes]
         ) if format else [f'{o.__name__}' for o in objtypes] 
 
-def read_from_excelsheets(erp_file: str = None ) -> List[DataFrame]: 
+def read_from_excelsheets(
+        erp_file: str = None, 
+        cache: Optional[bool] = None 
+        ) -> List[DataFrame]: 
     
     """ Read all Excelsheets and build a list of dataframe of all sheets.
    
     :param erp_file:
         Excell workbooks containing `erp` profile data.
         
+    :param cache: 
+        Read the workbook through the on-disk cache of the parsed sheets. 
+        ``None`` follows the ``KALFEAT_CACHE`` environment variable. See 
+        :mod:`kalfeat.tools.cacheutils`. 
+        
     :return: A list composed of the name of `erp_file` at index =0 and the 
       datataframes.
       
     """
-    
-    allfls:Dict [str, Dict [T, List[T]] ] = pd.read_excel(
-        erp_file, sheet_name=None)
+    allfls:Dict [str, Dict [T, List[T]] ] = cached_read(
+        pd.read_excel, erp_file, cache = cache, sheet_name=None)
     
     list_of_df =[os.path.basename(os.path.splitext(erp_file)[0])]
     for sheets , values in allfls.items(): 
@@ -210,6 +224,179 @@ def read_from_excelsheets(erp_file: str = None ) -> List[DataFrame]:
 
     return list_of_df 
 
+def collect_sources (
+        sources: str | Iterable [T], 
+        readableformats: Tuple [str] = ('.csv', '.xlsx'), 
+        lazy: bool = False 
+        ) -> List [Tuple [str, T]] | Iterator [Tuple [str, T]]: 
+    """ Expand `sources` into a list of named items ready for batch processing.
+    
+    :param sources: str, iterable - A directory, a glob pattern, a single 
+        file or an iterable of files, dataframes or ``(name, obj)`` pairs. 
+        A directory is expanded into its readable files (sorted by name).
+    :param readableformats: tuple - file extensions kept when a directory 
+        is expanded. 
+    :param lazy: bool - Yield the pairs one by one instead of returning a 
+        list, so a stream of lines (e.g. 
+        :func:`kalfeat.tools.coreutils.iter_erp_lines`) is not loaded at 
+        once. 
+    :returns: list of ``(name, source)`` pairs. The name is the file name 
+        for files, the given name for pairs and ``'line<index>'`` for the 
+        other objects. 
+        
+    :Example: 
+        >>> from kalfeat.tools.funcutils import collect_sources
+        >>> collect_sources ('data/erp/l1*_gbalo.xlsx')
+        ... [('l10_gbalo.xlsx', 'data/erp/l10_gbalo.xlsx'),
+             ('l11_gbalo.xlsx', 'data/erp/l11_gbalo.xlsx')]
+    """
+    if isinstance (sources, str): 
+        if os.path.isdir (sources): 
+            sources = sorted (
+                os.path.join(sources, f) for f in os.listdir(sources) 
+                if os.path.splitext(f)[1].lower() in readableformats )
+        elif os.path.isfile(sources): 
+            sources = [sources]
+        else: 
+            pattern = sources 
+            matches = sorted (glob.glob (pattern )) 
+            if len(matches)==0: 
+                raise FileNotFoundError (
+                    f'No file found from {pattern!r}')
+            sources = matches 
+                
+    named = _name_sources(sources)
+    
+    return named if lazy else list(named) 
+
+def _name_sources (sources: Iterable [T]) -> Iterator [Tuple [str, T]]: 
+    """ Name each item of `sources`. See :func:`collect_sources`."""
+    for ii, src in enumerate (sources ): 
+        if isinstance (src, tuple) and len(src)==2 : 
+            yield str(src[0]), src[1]
+        elif isinstance(src, str): 
+            yield os.path.basename(src), src
+        else: 
+            yield f'line{ii}', src 
+
+def run_in_pool (
+        func: F, 
+        items: Iterable [T], 
+        n_jobs: int = None 
+        ) -> List [T]: 
+    """ Map `func` over `items`, in a process pool when `n_jobs` allows it.
+    
+    :param func: callable - module-level (picklable) function applied to 
+        each item. 
+    :param items: iterable - items to process. The order is preserved in the 
+        outputs. An iterator is consumed by windows, so only a few items 
+        are held in memory at once.
+    :param n_jobs: int - number of worker processes. ``None`` or ``1`` runs 
+        the work in the current process; ``-1`` uses all the CPUs. 
+    :returns: list of `func` outputs. 
+    """
+    if n_jobs is not None and n_jobs < 0: 
+        n_jobs = os.cpu_count () or 1 
+    if n_jobs is None or n_jobs <= 1 : 
+        return [ func (item) for item in items ]
+    
+    from concurrent.futures import ProcessPoolExecutor 
+    if hasattr (items, '__len__'): 
+        items = list(items)
+        if len(items) <= 1: 
+            return [ func (item) for item in items ]
+        n_jobs = min (n_jobs, len(items))
+        # group the tasks to amortize the inter-process communication cost.
+        chunksize = max (1, len(items) // (4 * n_jobs))
+        with ProcessPoolExecutor(max_workers= n_jobs) as executor: 
+            return list(executor.map(func, items, chunksize = chunksize))
+        
+    outputs, items = [], iter(items)
+    with ProcessPoolExecutor(max_workers= n_jobs) as executor: 
+        while True: 
+            window = list(itertools.islice (items, 4 * n_jobs ))
+            if not window: 
+                break 
+            outputs.extend (executor.map(func, window))
+            
+    return outputs 
+    
+class StageTimer : 
+    """ Wall-clock timer of the successive stages of a pipeline. 
+    
+    Each call to :meth:`lap` charges the time elapsed since the previous 
+    lap, or since the timer was created, to the given stage. A disabled 
+    timer does not read the clock, so the instrumented code only pays a 
+    method call per stage. 
+    
+    :param enabled: bool - Time the stages. 
+    
+    :Example: 
+        >>> from kalfeat.tools.funcutils import StageTimer 
+        >>> timer = StageTimer ()
+        >>> data = sorted (range (10**6), reverse =True ) ; timer.lap ('sort')
+        >>> total = sum (data ) ; timer.lap ('sum')
+        >>> timer.timings 
+        ... {'sort': 0.0321..., 'sum': 0.0081...}
+    """
+    __slots__ = ('enabled', 'timings', '_last')
+    
+    def __init__ (self, enabled: bool = True ): 
+        self.enabled = enabled 
+        self.timings: Dict [str, float] = {}
+        self._last = time.perf_counter () if enabled else None 
+        
+    def lap (self, stage: str ) -> None : 
+        """ Charge the time elapsed since the last lap to `stage`."""
+        if not self.enabled: 
+            return 
+        now = time.perf_counter ()
+        self.timings [stage] = self.timings.get (stage, 0.) + now - self._last
+        self._last = now 
+        
+    def log (self, logger, name: str ) -> None : 
+        """ Emit the timings of `name` through `logger` at the info level."""
+        if self.enabled and self.timings: 
+            logger.info ('Stage timings of %s (s): %s', name, ', '.join (
+                f'{k}={v:.6f}' for k, v in self.timings.items ()))
+        
+def aggregate_timings (
+        timings: Iterable [Dict [str, float]] 
+        ) -> DataFrame : 
+    """ Aggregate the stage timings of many runs, e.g. the `timings_` of 
+    the objects fitted over a whole campaign. 
+    
+    :param timings: iterable of dict - Stage timings in seconds of each run.
+    :returns: dataframe indexed by the stages in order of appearance with 
+        the number of runs (`count`), the `total`, `mean`, `min` and `max` 
+        times in seconds and the `share` of the total time of all stages. 
+        
+    :Example: 
+        >>> from kalfeat.methods import ResistivityProfiling
+        >>> from kalfeat.tools.funcutils import aggregate_timings
+        >>> robjs = [ResistivityProfiling(auto =True, timings =True).fit(f)
+        ...          for f in ('data/erp/l10_gbalo.xlsx', 
+        ...                    'data/erp/l11_gbalo.xlsx')]
+        >>> aggregate_timings (robj.timings_ for robj in robjs )
+        ...              count     total      mean       min       max     share
+            stage                                                               
+            read             2  0.019962  0.009981  0.009872  0.010090  0.612071
+            coordinates      2  0.001517  0.000758  0.000745  0.000772  0.046509
+            ...
+    """
+    columns = ['count', 'total', 'mean', 'min', 'max', 'share']
+    table = pd.DataFrame.from_records (list (timings ))
+    if table.empty: 
+        return pd.DataFrame (columns = columns, index = pd.Index (
+            [], name ='stage'))
+    table = table.agg (['count', 'sum', 'mean', 'min', 'max']).T.rename (
+        columns = {'sum': 'total'})
+    table ['count'] = table ['count'].astype (int )
+    table ['share'] = table.total / table.total.sum ()
+    table.index.name = 'stage'
+    
+    return table 
+    
 def check_dimensionality(obj, data, z, x):
     """ Check dimensionality of data and fix it.
     
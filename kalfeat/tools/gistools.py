@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 # Created on Fri Apr 14 14:47:48 2017
 
+import functools
+
 import numpy as np
 
 from .._kalfeatlog import kalfeatlog
@@ -18,7 +20,10 @@ try :
         import pyproj
 except :
     HAS_GDAL =False
-    pass 
+    try : 
+        import pyproj 
+    except ImportError: 
+        pyproj = None 
 
 _logger = kalfeatlog.get_kalfeat_logger(__name__)
 
@@ -233,7 +238,184 @@ def get_utm_zone(latitude, longitude):
 
     return zone_number, is_northern, '{0:02.0f}{1}'.format(zone_number, n_str)
 
-def project_point_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
+# ==============================================================================
+# Cache of coordinate transformers
+# ==============================================================================
+TRANSFORMER_CACHE_SIZE = 32
+
+
+def _zone_key(zone_number, is_northern):
+    """
+    Normalized utm zone used as key of the transformers cache e.g. '30N'
+    """
+    return '{0:d}{1}'.format(int(zone_number), 'N' if is_northern else 'S')
+
+
+def _epsg_to_utm(epsg):
+    """
+    Get the zone number, the hemisphere and the ellipsoid id of a UTM EPSG 
+    projection for the numpy backend
+    """
+    if 32601 <= epsg <= 32660:
+        return epsg - 32600, True, _datum_ellipsoid['WGS84']
+    if 32701 <= epsg <= 32760:
+        return epsg - 32700, False, _datum_ellipsoid['WGS84']
+    projstring = epsg_dict.get(epsg, [''])[0]
+    if '+proj=utm' in projstring:
+        params = dict(item.lstrip('+').partition('=')[::2]
+                      for item in projstring.split())
+        return (int(params['zone']), 'south' not in params,
+                _get_ellipsoid_id(params.get('ellps', 'WGS84')))
+    raise GISError("EPSG {0} is not a UTM projection supported by the numpy"
+                   " backend".format(epsg))
+
+
+@functools.lru_cache(maxsize=TRANSFORMER_CACHE_SIZE)
+def get_transformer(datum='WGS84', utm_zone=None, epsg=None, direction='ll2utm',
+                    backend=None):
+    """
+    Get a ready-to-use coordinate transformer. 
+    
+    Building the osr spatial references or the pyproj projection is the 
+    costly part of a projection so the transformers are kept in a bounded 
+    LRU cache keyed by `(datum, utm_zone, epsg, direction)`. Use 
+    :func:`transformer_cache_info` to get the hit/miss statistics.
+
+    Arguments:
+    ---------------
+        **datum** : string or int
+                    well known datum ex. WGS84, NAD27, NAD83, etc. or its
+                    EPSG number (GDAL only)
+
+        **utm_zone** : string
+                       zone number and 'S' or 'N' e.g. '55S'. Not used when 
+                       `epsg` is given.
+
+        **epsg** : int
+                   epsg number defining projection (see
+                   http://spatialreference.org/ref/ for moreinfo)
+                   Overrides utm_zone if both are provided
+
+        **direction** : string
+                   'll2utm' to project (lon, lat) into (easting, northing)
+                   or 'utm2ll' for the inverse.
+
+        **backend** : string
+                   projection engine. ``None`` uses GDAL if available and 
+                   pyproj otherwise. 'numpy' uses the vectorized USGS 
+                   formulas of :func:`ll_to_utm` and :func:`utm_to_ll` and
+                   does not need GDAL nor pyproj.
+
+    Returns:
+    --------------
+        **transform**: callable(x, y) -> (x, y)
+                       transformer of arrays of coordinates. Its attribute 
+                       `utm_zone` holds the zone found from `epsg` if any.
+
+    """
+    if direction not in ('ll2utm', 'utm2ll'):
+        raise GISError("direction {0!r} not understood, needs to be "
+                       "'ll2utm' or 'utm2ll'".format(direction))
+    if backend not in (None, 'numpy'):
+        raise GISError("backend {0!r} not understood, needs to be None or "
+                       "'numpy'".format(backend))
+    if epsg is None:
+        try:
+            zone_number = int(utm_zone[0:-1])
+        except (TypeError, ValueError):
+            raise GISError('Zone number {0} is not a number'.format(utm_zone))
+        is_northern = utm_zone[-1].upper() == 'N'
+
+    if backend == 'numpy':
+        if epsg is not None:
+            zone_number, is_northern, ellipsoid_id = _epsg_to_utm(epsg)
+            utm_zone = zone_number if is_northern else -zone_number
+        else:
+            ellipsoid_id = _get_ellipsoid_id(datum)
+
+        def transform(x, y):
+            if direction == 'll2utm':
+                _, easting, northing = ll_to_utm(
+                    ellipsoid_id, y, x, zone_number=zone_number,
+                    northern=is_northern)
+                return easting, northing
+            lat, lon = utm_to_ll(ellipsoid_id, y, x,
+                                 zone_number if is_northern else -zone_number)
+            return lon, lat
+
+    elif HAS_GDAL:
+        # set lat lon coordinate system
+        ll_cs = osr.SpatialReference()
+        if isinstance(datum, int):
+            ogrerr = ll_cs.ImportFromEPSG(datum)
+        elif isinstance(datum, str):
+            ogrerr = ll_cs.SetWellKnownGeogCS(datum)
+        else:
+            raise GISError("""datum {0} not understood, needs to be EPSG as int
+                               or a well known datum as a string""".format(datum))
+        if ogrerr != OGRERR_NONE:
+            raise GISError("GDAL/osgeo ogr error code: {}".format(ogrerr))
+
+        # set utm coordinate system
+        utm_cs = osr.SpatialReference()
+        if epsg is not None:
+            ogrerr = utm_cs.ImportFromEPSG(epsg)
+            if ogrerr != OGRERR_NONE:
+                raise GISError("GDAL/osgeo ogr error code: {}".format(ogrerr))
+            # get utm zone (for information) if applicable
+            utm_zone = utm_cs.GetUTMZone()
+            if utm_zone > 0:
+                utm_cs.SetUTM(abs(utm_zone), utm_zone > 0)
+        else:
+            ogrerr = utm_cs.CopyGeogCSFrom(ll_cs)
+            if ogrerr != OGRERR_NONE:
+                raise GISError("GDAL/osgeo ogr error code: {}".format(ogrerr))
+            utm_cs.SetUTM(zone_number, is_northern)
+
+        ct = osr.CoordinateTransformation(
+            *((ll_cs, utm_cs) if direction == 'll2utm' else (utm_cs, ll_cs)))
+
+        def transform(x, y):
+            x = np.asarray(x, dtype=float)
+            y = np.asarray(y, dtype=float)
+            points = np.array(ct.TransformPoints(
+                np.array([x.ravel(), y.ravel()]).T))
+            return points[:, 0].reshape(x.shape), points[:, 1].reshape(x.shape)
+    else:
+        if pyproj is None:
+            raise GISError("Either GDAL or PyProj must be installed")
+        if epsg is not None:
+            pp = pyproj.Proj('+init=EPSG:%d' % (epsg))
+        else:
+            projstring = '+proj=utm +zone=%d +%s +datum=%s' % \
+                         (zone_number, 'north' if is_northern else 'south', datum)
+            pp = pyproj.Proj(projstring)
+        inverse = direction == 'utm2ll'
+
+        def transform(x, y):
+            return pp(x, y, inverse=inverse)
+    # end if
+
+    transform.utm_zone = utm_zone
+    return transform
+
+
+def transformer_cache_info():
+    """
+    Hits, misses, maximum size and current size of the transformers cache
+    """
+    return get_transformer.cache_info()
+
+
+def clear_transformer_cache():
+    """
+    Drop all the cached transformers and reset the statistics
+    """
+    get_transformer.cache_clear()
+
+
+def project_point_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None,
+                         backend=None):
     """
     Project a point that is in Lat, Lon (will be converted to decimal degrees)
     into UTM coordinates.
@@ -257,6 +439,10 @@ def project_point_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
                    http://spatialreference.org/ref/ for moreinfo)
                    Overrides utm_zone if both are provided
 
+        **backend** : string
+                   projection engine, see :func:`get_transformer`. Set to
+                   'numpy' to project without GDAL nor pyproj.
+
     Returns:
     --------------
         **proj_point**: tuple(easting, northing, zone)
@@ -275,42 +461,10 @@ def project_point_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
         lat = np.array([assert_lat_value(lat)])
         lon = np.array([assert_lon_value(lon)])
 
-    if HAS_GDAL:
-        # set lat lon coordinate system
-        ll_cs = osr.SpatialReference()
-        if isinstance(datum, int):
-            ogrerr = ll_cs.ImportFromEPSG(datum)
-            if ogrerr != OGRERR_NONE:
-                raise GISError("GDAL/osgeo ogr error code: {}".format(ogrerr))
-        elif isinstance(datum, str):
-            ogrerr = ll_cs.SetWellKnownGeogCS(datum)
-            if ogrerr != OGRERR_NONE:
-                raise GISError("GDAL/osgeo ogr error code: {}".format(ogrerr))
-        else:
-            raise GISError("""datum {0} not understood, needs to be EPSG as int
-                               or a well known datum as a string""".format(datum))
-
-        # set utm coordinate system
-        utm_cs = osr.SpatialReference()
-    # end if
-
     # project point on to EPSG coordinate system if given
-    if isinstance(epsg, int):
-        if HAS_GDAL:
-            ogrerr = utm_cs.ImportFromEPSG(epsg)
-            if ogrerr != OGRERR_NONE:
-                raise GISError("GDAL/osgeo ogr error code: {}".format(ogrerr))
-        else:
-            import pyproj 
-            pp = pyproj.Proj('+init=EPSG:%d'%(epsg))
-        # end if
     # otherwise project onto given datum
-    elif epsg is None:
-        if HAS_GDAL:
-            ogrerr = utm_cs.CopyGeogCSFrom(ll_cs)
-            if ogrerr != OGRERR_NONE:
-                raise GISError("GDAL/osgeo ogr error code: {}".format(ogrerr))
-        # end if
+    zone_key = None
+    if epsg is None:
         if utm_zone is None or not isinstance(None, str) or utm_zone.lower() == 'none':
             # get the UTM zone in the datum coordinate system, otherwise
             zone_number, is_northern, utm_zone = get_utm_zone(lat.mean(),
@@ -318,34 +472,20 @@ def project_point_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
         else:
             # get zone number and is_northern from utm_zone string
             zone_number = int(utm_zone[0:-1])
-            is_northern = True if utm_zone[-1].lower() > 'n' else False
-
-        if(HAS_GDAL):
-            utm_cs.SetUTM(zone_number, is_northern)
-        else:
-            projstring = '+proj=utm +zone=%d +%s +datum=%s' % \
-                         (zone_number, 'north' if is_northern else 'south', datum)
-            pp = pyproj.Proj(projstring)
-        # end if
+            is_northern = True if utm_zone[-1].lower() >= 'n' else False
+        zone_key = _zone_key(zone_number, is_northern)
     # end if
 
+    ll2utm = get_transformer(datum, zone_key, epsg, 'll2utm', backend)
+
     # return different results depending on if lat/lon are iterable
-    projected_point = np.zeros_like(lat, dtype=[('easting', np.float),
-                                                ('northing', np.float),
-                                                ('elev', np.float),
+    projected_point = np.zeros_like(lat, dtype=[('easting', float),
+                                                ('northing', float),
+                                                ('elev', float),
                                                 ('utm_zone', 'U4')])
 
-    if(HAS_GDAL):
-        ll2utm = osr.CoordinateTransformation(ll_cs, utm_cs).TransformPoint
-    else:
-        ll2utm = pp
-    # end if
-
+    projected_point['easting'], projected_point['northing'] = ll2utm(lon, lat)
     for ii in range(lat.size):
-        point = ll2utm(lon[ii], lat[ii])
-        projected_point['easting'][ii] = point[0]
-        projected_point['northing'][ii] = point[1]
-        if(HAS_GDAL): projected_point['elev'][ii] = point[2]
         projected_point['utm_zone'][ii] = utm_zone if utm_zone is not None else get_utm_zone(lat[ii], lon[ii])[2]
     # end for
 
@@ -357,9 +497,38 @@ def project_point_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
                 projected_point['utm_zone'][0])
     else:
         return np.rec.array(projected_point)
-    
+
+
+def _parse_utm_zone(utm_zone):
+    """
+    Get the zone number and the hemisphere from `utm_zone` given as a string
+    (##N or ##S) or as the std UTM code returned by gdal.
+    """
+    if isinstance(utm_zone, str) or isinstance(utm_zone, np.bytes_):
+        # the isinstance(utm_zone, str) could be False in python3 due to numpy datatype change.
+        # So FZ added  isinstance(utm_zone, np.bytes_) and convert the utm_zone into string
+        if isinstance(utm_zone, np.bytes_):
+            utm_zone = utm_zone.decode('UTF-8') # b'54J'
+        try:
+            zone_number = int(utm_zone[0:-1])  #b'54J'
+            zone_letter = utm_zone[-1]
+        except ValueError:
+            raise ValueError('Zone number {0} is not a number'.format(utm_zone[0:-1]))
+        is_northern = True if zone_letter.lower() >= 'n' else False
+    elif isinstance(utm_zone, (int, np.integer)):
+        # std UTM code returned by gdal
+        is_northern = False if utm_zone < 0 else True
+        zone_number = abs(utm_zone)
+    else:
+        raise NotImplementedError(
+            "utm_zone type (%s, %s) not supported"%(type(utm_zone), str(utm_zone)))
+
+    return zone_number, is_northern
+
+
 #espg = 3149
-def project_point_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None):
+def project_point_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None,
+                         backend=None):
     """
     Project a point that is in Lat, Lon (will be converted to decimal degrees)
     into UTM coordinates.
@@ -379,6 +548,10 @@ def project_point_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None):
         **datum** : string
                     well known datum ex. WGS84, NAD27, etc.
                     
+        **backend** : string
+                   projection engine, see :func:`get_transformer`. Set to
+                   'numpy' to project without GDAL nor pyproj.
+
     Returns:
     --------------
         **proj_point**: tuple(lat, lon)
@@ -395,66 +568,19 @@ def project_point_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None):
     except ValueError:
         raise GISError("northing is not a float")
 
-    if HAS_GDAL:
-        # set utm coordinate system
-        utm_cs = osr.SpatialReference()
-        utm_cs.SetWellKnownGeogCS(datum)
-    # end if
-
-    if epsg is not None:
-        if HAS_GDAL:
-            ogrerr = utm_cs.ImportFromEPSG(epsg)
-            if ogrerr != OGRERR_NONE:
-                raise Exception("GDAL/osgeo ogr error code: {}".format(ogrerr))
-        else:
-            import pyproj
-            pp = pyproj.Proj('+init=EPSG:%d'%(epsg))
-        # end if
-    elif isinstance(utm_zone, str) or isinstance(utm_zone, np.bytes_):
-        # the isinstance(utm_zone, str) could be False in python3 due to numpy datatype change.
-        # So FZ added  isinstance(utm_zone, np.bytes_) and convert the utm_zone into string
-        if isinstance(utm_zone, np.bytes_):
-            utm_zone = utm_zone.decode('UTF-8') # b'54J'
-        try:
-            zone_number = int(utm_zone[0:-1])  #b'54J'
-            zone_letter = utm_zone[-1]
-        except ValueError:
-            raise ValueError('Zone number {0} is not a number'.format(utm_zone[0:-1]))
-        is_northern = True if zone_letter.lower() >= 'n' else False
-    elif isinstance(utm_zone, int):
-        # std UTM code returned by gdal
-        is_northern = False if utm_zone < 0 else True
-        zone_number = abs(utm_zone)
-    else:
-        print("epsg and utm_zone", str(epsg), str(utm_zone))
-
-        raise NotImplementedError(
-            "utm_zone type (%s, %s) not supported"%(type(utm_zone), str(utm_zone)))
-    
+    zone_key = None
     if epsg is None:
-        if HAS_GDAL:
-            utm_cs.SetUTM(zone_number, is_northern)
-        else:
-            import pyproj
-            projstring = '+proj=utm +zone=%d +%s +datum=%s' % \
-                         (zone_number, 'north' if is_northern else 'south', datum)
-            pp = pyproj.Proj(projstring)
-        # end if
-    # end if
+        zone_key = _zone_key(*_parse_utm_zone(utm_zone))
 
-    if HAS_GDAL:
-        ll_cs = utm_cs.CloneGeogCS()
-        utm2ll = osr.CoordinateTransformation(utm_cs, ll_cs).TransformPoint
-        ll_point = list(utm2ll(easting, northing, 0.))
-    else:
-        ll_point = pp(easting, northing, inverse=True)
-    # end if
+    utm2ll = get_transformer(datum, zone_key, epsg, 'utm2ll', backend)
+    ll_point = utm2ll(easting, northing)
 
     # be sure to round out the numbers to remove computing with floats
-    return round(ll_point[1], 6), round(ll_point[0], 6), utm_zone 
+    return round(float(ll_point[1]), 6), round(float(ll_point[0]), 6), utm_zone 
 
 
-def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
+def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None,
+                          backend=None):
     """
     Project a list of points that is in Lat, Lon (will be converted to decimal 
     degrees) into UTM coordinates.
@@ -479,6 +605,10 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
                    http://spatialreference.org/ref/ for moreinfo)
                    Overrides utm_zone if both are provided
 
+        **backend** : string
+                   projection engine, see :func:`get_transformer`. Set to
+                   'numpy' to project without GDAL nor pyproj.
+
     Returns:
     --------------
         **proj_point**: tuple(easting, northing, zone)
@@ -512,65 +642,26 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
     if lat is None or lon is None:
         return None, None, None
 
-    if HAS_GDAL:
-        # set utm coordinate system
-        utm_cs = osr.SpatialReference()
-        utm_cs.SetWellKnownGeogCS(datum)
-
-        # set lat, lon coordinate system
-        ll_cs = utm_cs.CloneGeogCS()
-        ll_cs.ExportToPrettyWkt()
-    # end if
-
     # get zone number, north and zone name
-    if epsg is not None:
-        if HAS_GDAL:
-            # set projection info
-            ogrerr = utm_cs.ImportFromEPSG(epsg)
-            if ogrerr != OGRERR_NONE:
-                raise Exception("GDAL/osgeo ogr error code: {}".format(ogrerr))
-            # get utm zone (for information) if applicable
-            utm_zone = utm_cs.GetUTMZone()
-
-            # Whilst some projections e.g. Geoscience Australia Lambert (epsg3112) do
-            # not yield UTM zones, they provide eastings and northings for the whole
-            # Australian region. We therefore set UTM zones, only when a valid UTM zone
-            # is available
-            if(utm_zone>0):
-                # set projection info
-                utm_cs.SetUTM(abs(utm_zone), utm_zone > 0)
-        else:
-            pp = pyproj.Proj('+init=EPSG:%d'%(epsg))
-        # end if
-    else:
+    zone_key = None
+    if epsg is None:
         if utm_zone is not None:
             # get zone number and is_northern from utm_zone string
             zone_number = int(utm_zone[0:-1])
-            is_northern = True if utm_zone[-1].lower() > 'n' else False
+            is_northern = True if utm_zone[-1].lower() >= 'n' else False
         else:
             # get centre point and get zone from that
             latc = (np.nanmax(lat) + np.nanmin(lat)) / 2.
             lonc = (np.nanmax(lon) + np.nanmin(lon)) / 2.
             zone_number, is_northern, utm_zone = get_utm_zone(latc, lonc)
-        # set projection info
-
-        if(HAS_GDAL):
-            utm_cs.SetUTM(zone_number, is_northern)
-        else:
-            projstring = '+proj=utm +zone=%d +%s +datum=%s' % \
-                         (zone_number, 'north' if is_northern else 'south', datum)
-            pp = pyproj.Proj(projstring)
-        # end if
+        zone_key = _zone_key(zone_number, is_northern)
     # end if
-    
-    if HAS_GDAL:
-        ll2utm = osr.CoordinateTransformation(ll_cs, utm_cs).TransformPoints
-        easting, northing, elev = np.array(ll2utm(np.array([lon, lat]).T)).T
 
-    else:
-        ll2utm = pp
-        easting, northing = ll2utm(lon, lat)
-    # end if
+    ll2utm = get_transformer(datum, zone_key, epsg, 'll2utm', backend)
+    if epsg is not None and (HAS_GDAL or backend == 'numpy'):
+        # get utm zone (for information) if applicable
+        utm_zone = ll2utm.utm_zone
+    easting, northing = ll2utm(lon, lat)
 
     projected_point = (easting, northing, utm_zone)
 
@@ -582,6 +673,62 @@ def project_points_ll2utm(lat, lon, datum='WGS84', utm_zone=None, epsg=None):
     return projected_point
 # end func
 
+def project_points_utm2ll(easting, northing, utm_zone, datum='WGS84', epsg=None,
+                          backend=None):
+    """
+    Project a list of points that is in UTM into Lat, Lon coordinates using 
+    a single transformation for all the points.
+    
+    Arguments:
+    ---------------
+        **easting** : array-like float
+                    easting coordinates in meters
+                    
+        **northing** : array-like float
+                    northing coordinates in meters
+        
+        **utm_zone** : string (##N or ##S)
+                      utm zone in the form of number and North or South
+                      hemisphere, 10S or 03N
+        
+        **datum** : string
+                    well known datum ex. WGS84, NAD27, etc.
+                    
+        **epsg** : int
+                   epsg number defining projection (see 
+                   http://spatialreference.org/ref/ for moreinfo)
+                   Overrides utm_zone if both are provided
+
+        **backend** : string
+                   projection engine, see :func:`get_transformer`. Set to
+                   'numpy' to project without GDAL nor pyproj.
+                    
+    Returns:
+    --------------
+        **proj_point**: tuple(lat, lon, zone)
+                        projected points in lat and lon in Datum, as decimal
+                        degrees.
+                    
+    """
+    try:
+        easting = np.asarray(easting, dtype=float)
+        northing = np.asarray(northing, dtype=float)
+    except ValueError:
+        raise GISError("easting and northing must be floats")
+    if easting.shape != northing.shape:
+        raise ValueError("easting and northing arrays are of different lengths")
+
+    zone_key = None
+    if epsg is None:
+        zone_key = _zone_key(*_parse_utm_zone(utm_zone))
+
+    utm2ll = get_transformer(datum, zone_key, epsg, 'utm2ll', backend)
+    lon, lat = utm2ll(easting, northing)
+
+    # be sure to round out the numbers to remove computing with floats
+    return np.round(lat, 6), np.round(lon, 6), utm_zone
+
+
 # =================================
 # functions from latlon_utm_conversion.py
 
@@ -632,10 +779,40 @@ _ellipsoid = [
 # Defense Mapping Agency. 1987b. DMA Technical Report: Supplement to Department of Defense World Geodetic System
 # 1984 Technical Report. Part I and II. Washington, DC: Defense Mapping Agency
 
+# Ellipsoids (ids of `_ellipsoid`) of the datums understood by the numpy backend
+_datum_ellipsoid = {
+    'WGS84': 23,
+    'WGS72': 22,
+    'NAD83': 11,
+    'GRS80': 11,
+    'NAD27': 5,
+}
+
+
+def _get_ellipsoid_id(datum):
+    """
+    Get the id in `_ellipsoid` from a datum name, an ellipsoid name or an id
+    """
+    if isinstance(datum, (int, np.integer)):
+        if not 0 < datum < len(_ellipsoid):
+            raise GISError("Ellipsoid id {0} not in the range 1-{1}".format(
+                datum, len(_ellipsoid) - 1))
+        return int(datum)
+    key = str(datum).upper().replace('-', '').replace(' ', '')
+    if key in _datum_ellipsoid:
+        return _datum_ellipsoid[key]
+    for ell in _ellipsoid[1:]:
+        if ell[1].upper().replace('-', '').replace(' ', '') == key:
+            return ell[0]
+    raise GISError("datum {0} not understood by the numpy backend, needs to "
+                   "be one of {1} or an ellipsoid of `_ellipsoid`".format(
+                       datum, list(_datum_ellipsoid)))
+
+
 # @deprecated("This function may be removed in later release."
 #             " kalfeat.utils.gistools.project_point_ll2utm() should be "
 #             "used instead.")
-def ll_to_utm(reference_ellipsoid, lat, lon):
+def ll_to_utm(reference_ellipsoid, lat, lon, zone_number=None, northern=None):
     """
     converts lat/long to UTM coords.  Equations from USGS Bulletin 1532
     East Longitudes are positive, West longitudes are negative.
@@ -643,6 +820,11 @@ def ll_to_utm(reference_ellipsoid, lat, lon):
     Lat and Long are in decimal degrees
     Written by Chuck Gantz- chuck.gantz@globalstar.com
 
+    `lat` and `lon` can be arrays of any shape; all the points are converted
+    at once. `zone_number` and `northern` force the projection of all the 
+    points into the same UTM zone and hemisphere. By default, they are 
+    computed from each point.
+
     Outputs:
         UTMzone, easting, northing"""
 
@@ -650,33 +832,41 @@ def ll_to_utm(reference_ellipsoid, lat, lon):
     ecc_squared = _ellipsoid[reference_ellipsoid][_eccentricity_squared]
     k0 = 0.9996
 
+    scalar = np.ndim(lat) == 0 and np.ndim(lon) == 0
+    lat = np.asarray(lat, dtype=float)
+    lon = np.asarray(lon, dtype=float)
+
     # Make sure the longitude is between -180.00 .. 179.9
-    long_temp = (lon + 180) - int((lon + 180) / 360) * 360 - 180  # -180.00 .. 179.9
+    long_temp = (lon + 180) - np.trunc((lon + 180) / 360) * 360 - 180  # -180.00 .. 179.9
 
     lat_rad = lat * _deg2rad
     long_rad = long_temp * _deg2rad
 
-    zone_number = int((long_temp + 180) / 6) + 1
+    if zone_number is None:
+        zone_number = np.trunc((long_temp + 180) / 6).astype(int) + 1
 
-    if 56.0 <= lat < 64.0 and 3.0 <= long_temp < 12.0:
-        zone_number = 32
+        zone_number = np.where((56.0 <= lat) & (lat < 64.0)
+                               & (3.0 <= long_temp) & (long_temp < 12.0),
+                               32, zone_number)
 
-    # Special zones for Svalbard
-    if 72.0 <= lat < 84.0:
-        if 0.0 <= long_temp < 9.0:
-            zone_number = 31
-        elif 9.0 <= long_temp < 21.0:
-            zone_number = 33
-        elif 21.0 <= long_temp < 33.0:
-            zone_number = 35
-        elif 33.0 <= long_temp < 42.0:
-            zone_number = 37
+        # Special zones for Svalbard
+        svalbard = (72.0 <= lat) & (lat < 84.0)
+        for zn, (lo, hi) in zip((31, 33, 35, 37),
+                                ((0., 9.), (9., 21.), (21., 33.), (33., 42.))):
+            zone_number = np.where(svalbard & (lo <= long_temp) & (long_temp < hi),
+                                   zn, zone_number)
+    zone_number = np.broadcast_to(zone_number, lat.shape)
 
     long_origin = (zone_number - 1) * 6 - 180 + 3  # +3 puts origin in middle of zone
     long_origin_rad = long_origin * _deg2rad
 
     # compute the UTM Zone from the latitude and longitude
-    utm_zone = "%d%c" % (zone_number, _utm_letter_designator(lat))
+    # format the zone names once per distinct (zone, band) pair
+    letters = np.asarray(_utm_letter_designator(lat))
+    pairs, inverse = np.unique(zone_number * 100 + np.searchsorted(
+        _utm_bands, letters), return_inverse=True)
+    utm_zone = np.array(['%d%s' % (pair // 100, _utm_bands[pair % 100])
+                         for pair in pairs])[inverse].reshape(lat.shape)
 
     ecc_prime_squared = ecc_squared / (1 - ecc_squared)
     N = a / np.sqrt(1 - ecc_squared * np.sin(lat_rad) ** 2)
@@ -717,58 +907,34 @@ def ll_to_utm(reference_ellipsoid, lat, lon):
                                                       - 330 * ecc_prime_squared
                                                       ) * A ** 6 / 720)))
 
-    if lat < 0:
-        utm_northing = utm_northing + 10000000.0  # 10000000 meter offset for southern hemisphere
+    southern = lat < 0 if northern is None else ~np.asarray(northern, dtype=bool)
+    # 10000000 meter offset for southern hemisphere
+    utm_northing = utm_northing + np.where(southern, 10000000.0, 0.)
+
+    if scalar:
+        return str(utm_zone), float(utm_easting), float(utm_northing)
     return utm_zone, utm_easting, utm_northing
 
 
+_utm_letters = np.array(list('CDEFGHJKLMNPQRSTUVWX'))
+_utm_bands = np.append(_utm_letters, 'Z')
+
+
 def _utm_letter_designator(lat):
     # This routine determines the correct UTM letter designator for the given latitude
     # returns 'Z' if latitude is outside the UTM limits of 84N to 80S
     # Written by Chuck Gantz- chuck.gantz@globalstar.com
+    # Latitudes bands are 8 degrees wide from 80S, the last band X 
+    # covers 72N to 84N. `lat` can be an array.
 
-    if 84 >= lat >= 72:
-        return 'X'
-    elif 72 > lat >= 64:
-        return 'W'
-    elif 64 > lat >= 56:
-        return 'V'
-    elif 56 > lat >= 48:
-        return 'U'
-    elif 48 > lat >= 40:
-        return 'T'
-    elif 40 > lat >= 32:
-        return 'S'
-    elif 32 > lat >= 24:
-        return 'R'
-    elif 24 > lat >= 16:
-        return 'Q'
-    elif 16 > lat >= 8:
-        return 'P'
-    elif 8 > lat >= 0:
-        return 'N'
-    elif 0 > lat >= -8:
-        return 'M'
-    elif -8 > lat >= -16:
-        return 'L'
-    elif -16 > lat >= -24:
-        return 'K'
-    elif -24 > lat >= -32:
-        return 'J'
-    elif -32 > lat >= -40:
-        return 'H'
-    elif -40 > lat >= -48:
-        return 'G'
-    elif -48 > lat >= -56:
-        return 'F'
-    elif -56 > lat >= -64:
-        return 'E'
-    elif -64 > lat >= -72:
-        return 'D'
-    elif -72 > lat >= -80:
-        return 'C'
-    else:
-        return 'Z'  # if the Latitude is outside the UTM limits
+    lat = np.asarray(lat, dtype=float)
+    with np.errstate(invalid='ignore'):
+        inside = (-80 <= lat) & (lat <= 84)
+        index = np.clip(np.floor((np.where(inside, lat, 0.) + 80) / 8),
+                        0, len(_utm_letters) - 1).astype(int)
+    letters = np.where(inside, _utm_letters[index], 'Z')  # if the Latitude is outside the UTM limits
+
+    return str(letters) if letters.ndim == 0 else letters
 
 
 def utm_to_ll(reference_ellipsoid, northing, easting, zone):
@@ -780,6 +946,10 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
     Written by Chuck Gantz- chuck.gantz@globalstar.com
     Converted to Python by Russ Nelson <nelson@crynwr.com>
 
+    `northing` and `easting` can be arrays of any shape. `zone` is either a 
+    zone string (e.g. '30N'), an array of zone strings, one per point, or 
+    the std UTM code returned by gdal (negative in southern hemisphere).
+
     Outputs:
         Lat,Lon
     """
@@ -788,18 +958,24 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
     a = _ellipsoid[reference_ellipsoid][_equatorial_radius]
     ecc_squared = _ellipsoid[reference_ellipsoid][_eccentricity_squared]
     e1 = (1 - np.sqrt(1 - ecc_squared)) / (1 + np.sqrt(1 - ecc_squared))
-    # NorthernHemisphere; //1 for northern hemispher, 0 for southern
 
-    x = easting - 500000.0  # remove 500,000 meter offset for longitude
-    y = northing
+    scalar = np.ndim(northing) == 0 and np.ndim(easting) == 0
+    x = np.asarray(easting, dtype=float) - 500000.0  # remove 500,000 meter offset for longitude
+    y = np.asarray(northing, dtype=float)
 
-    zone_letter = zone[-1]
-    zone_number = int(zone[:-1])
-    if zone_letter >= 'N':
-        NorthernHemisphere = 1  # point is in northern hemisphere
+    zone = np.asarray(zone)
+    if zone.dtype.kind in 'iu':
+        # std UTM code returned by gdal
+        zone_number = np.abs(zone)
+        northern = zone >= 0
     else:
-        NorthernHemisphere = 0  # point is in southern hemisphere
-        y -= 10000000.0  # remove 10,000,000 meter offset used for southern hemisphere
+        zones, inverse = np.unique(zone.astype(str), return_inverse=True)
+        zone_number = np.array([int(z[:-1]) for z in zones])[inverse].reshape(zone.shape)
+        # point is in northern hemisphere from the band N
+        northern = np.array([z[-1] >= 'N' for z in zones])[inverse].reshape(zone.shape)
+
+    # remove 10,000,000 meter offset used for southern hemisphere
+    y = y - np.where(northern, 0., 10000000.0)
 
     # +3 puts origin in middle of zone
     long_origin = (zone_number - 1) * 6 - 180 + 3
@@ -813,7 +989,6 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
     phi1_rad = (mu + (3 * e1 / 2 - 27 * e1 ** 3 / 32) * np.sin(2 * mu)
                 + (21 * e1 ** 2 / 16 - 55 * e1 ** 4 / 32) * np.sin(4 * mu)
                 + (151 * e1 ** 3 / 96) * np.sin(6 * mu))
-    phi1 = phi1_rad * _rad2deg
 
     n1 = a / np.sqrt(1 - ecc_squared * np.sin(phi1_rad) ** 2)
     t1 = np.tan(phi1_rad) ** 2
@@ -832,8 +1007,12 @@ def utm_to_ll(reference_ellipsoid, northing, easting, zone):
         5 - 2 * c1 + 28 * t1 - 3 * c1 ** 2 + 8 * ecc_prime_squared + 24 * t1 ** 2)
            * d ** 5 / 120) / np.cos(phi1_rad)
     lon = long_origin + lon * _rad2deg
+
+    if scalar and zone.ndim == 0:
+        return float(lat), float(lon)
     return lat, lon
 
+
 # http://spatialreference.org/ref/epsg/28350/proj4/
 epsg_dict = {28350: ['+proj=utm +zone=50 +south +ellps=GRS80 +towgs84=0,0,0,0,0,0,0 +units=m +no_defs', 50],
              28351: ['+proj=utm +zone=51 +south +ellps=GRS80 +towgs84=0,0,0,0,0,0,0 +units=m +no_defs', 51],
@@ -187,6 +187,7 @@ from typing import (
     Sequence, 
     Dict, 
     Iterable, 
+    Iterator, 
     Callable, 
     Union, 
     Any , 
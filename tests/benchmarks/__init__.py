@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+"""
+ Benchmarks 
+ ^^^^^^^^^^
+
+Performance budgets of the package. Budgets are kept loose enough to 
+pass on a slow CI runner and can be tightened through environment 
+variables. 
+"""
+import os 
+import sys 
+import subprocess 
+
+from tests import TEST_KALFEAT_ROOT 
+
+def run_python (code, repeat =3 ): 
+    """ Run `code` in a fresh interpreter `repeat` times and return the 
+    list of the standard outputs stripped. 
+    
+    A fresh interpreter is needed for import measurements since the 
+    modules would otherwise already sit in `sys.modules`. 
+    """
+    outs =[]
+    env = dict (os.environ, PYTHONPATH = TEST_KALFEAT_ROOT) 
+    for _ in range (repeat ): 
+        p = subprocess.run ([sys.executable, '-c', code], env = env , 
+                            cwd = TEST_KALFEAT_ROOT , capture_output=True, 
+                            text=True, check =True )
+        outs.append (p.stdout.strip()) 
+    return outs 
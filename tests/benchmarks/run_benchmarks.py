@@ -0,0 +1,324 @@
+# -*- coding: utf-8 -*-
+"""
+ Run benchmarks
+ ^^^^^^^^^^^^^^
+
+Time the main entry points of the package on synthetic surveys at several
+scales and store the timings in a JSON file so two versions can be
+compared::
+
+    python -m tests.benchmarks.run_benchmarks -o base.json
+    # ... change the code ...
+    python -m tests.benchmarks.run_benchmarks -o new.json --compare base.json
+
+The exit status is ``1`` when a benchmark is slower than the base by more
+than the threshold of ``--compare`` and ``2`` when the base and the run
+share no benchmark, e.g. after a typo in ``-k``. Use``--quick`` for a single run of
+the smallest scale only, e.g. to check the suite itself, and ``-k`` to
+select the benchmarks by name.
+"""
+import os
+import sys
+import json
+import time
+import timeit
+import argparse
+import platform
+import tempfile
+import warnings
+from collections import namedtuple
+
+import numpy as np
+import pandas as pd
+
+import kalfeat
+from tests.benchmarks.synthetic import (
+    UTM_ZONE,
+    make_erp,
+    make_ves,
+    make_campaign,
+    )
+
+# sizes of each scale, from the smallest
+SCALES = dict (
+    stations = (100, 1_000, 10_000),
+    lines = (1, 10, 50),
+    soundings = (4, 40, 400),
+    spacings = (16, 32, 64),
+    zones = (10, 100, 1_000),
+    points = (1_000, 10_000, 100_000),
+    instances = (100, 1_000, 10_000),
+    models = (1_000, 10_000, 100_000),
+    )
+# a benchmark is slower than its base beyond this ratio
+THRESHOLD = float (os.environ.get ('KALFEAT_BENCH_THRESHOLD', 1.25 ))
+
+Benchmark = namedtuple ('Benchmark', ('name', 'scale', 'setup'))
+BENCHMARKS = []
+
+def benchmark (name, scale ):
+    """ Register the setup of a benchmark. The setup is called with the size
+    of the data and a temporary directory and returns the callable to time.
+    """
+    def decorator (setup ):
+        BENCHMARKS.append (Benchmark (name, scale, setup ))
+        return setup
+    return decorator
+
+
+@benchmark ('erpSelector', 'stations')
+def _erp_selector (size, tmpdir ):
+    from kalfeat.tools.coreutils import erpSelector
+    f = os.path.join (tmpdir, f'erp{size}.csv')
+    make_erp (size, seed =0 ).to_csv (f, index =False )
+    return lambda: erpSelector (f)
+
+@benchmark ('vesSelector', 'soundings')
+def _ves_selector (size, tmpdir ):
+    from kalfeat.tools.coreutils import vesSelector
+    data = make_ves (size, seed =0 )
+    # the selector renames the columns of the frame it is given
+    return lambda: vesSelector (data.copy (), keep_all =True )
+
+@benchmark ('fill_coordinates', 'stations')
+def _fill_coordinates (size, tmpdir ):
+    from kalfeat.tools.coreutils import erpSelector, fill_coordinates
+    data = erpSelector (make_erp (size, coordinates ='ll', seed =0 ))
+    return lambda: fill_coordinates (data.copy (), utm_zone = UTM_ZONE )
+
+@benchmark ('ResistivityProfiling()', 'instances')
+def _erp_init (size, tmpdir ):
+    from kalfeat.methods import ResistivityProfiling
+    return lambda: [ ResistivityProfiling () for _ in range (size )]
+
+@benchmark ('VerticalSounding()', 'instances')
+def _ves_init (size, tmpdir ):
+    from kalfeat.methods import VerticalSounding
+    return lambda: [ VerticalSounding () for _ in range (size )]
+
+@benchmark ('ResistivityProfiling.fit', 'stations')
+def _erp_fit (size, tmpdir ):
+    from kalfeat.methods import ResistivityProfiling
+    data = make_erp (size, seed =0 )
+    return lambda: ResistivityProfiling (auto =True ).fit (data )
+
+@benchmark ('ResistivityProfiling.fit_many', 'lines')
+def _erp_fit_many (size, tmpdir ):
+    from kalfeat.methods import ResistivityProfiling
+    campaign = make_campaign (size, seed =0 )
+    lines = [ line.drop (columns ='line') for _, line in campaign.groupby (
+        'line', sort =False )]
+    return lambda: ResistivityProfiling.fit_many (lines, auto =True )
+
+@benchmark ('scanConductiveZones', 'stations')
+def _scan (size, tmpdir ):
+    from kalfeat.tools.coreutils import scanConductiveZones
+    erp = make_erp (size, coordinates =None, seed =0 ).rho.to_numpy ()
+    return lambda: scanConductiveZones (erp, k = None )
+
+@benchmark ('VerticalSounding.fit', 'spacings')
+def _ves_fit (size, tmpdir ):
+    from kalfeat.methods import VerticalSounding
+    data = make_ves (1, size, seed =0 )
+    return lambda: VerticalSounding ().fit (data.copy ())
+
+@benchmark ('VerticalSounding.fit_all', 'soundings')
+def _ves_fit_all (size, tmpdir ):
+    from kalfeat.methods import VerticalSounding
+    data = make_ves (size, seed =0 )
+    return lambda: VerticalSounding ().fit_all (data.copy ())
+
+@benchmark ('ohmicArea', 'spacings')
+def _ohmic_area (size, tmpdir ):
+    from kalfeat.tools.coreutils import vesSelector
+    from kalfeat.tools.exmath import ohmicArea
+    data = vesSelector (make_ves (1, size, seed =0 ))
+    return lambda: ohmicArea (data )
+
+@benchmark ('ohmicArea[cold]', 'spacings')
+def _ohmic_area_cold (size, tmpdir ):
+    from kalfeat.tools.coreutils import vesSelector
+    from kalfeat.tools import exmath
+    data = vesSelector (make_ves (1, size, seed =0 ))
+    def run ():
+        # drop the memoized computations to time every stage
+        exmath._VES_COMPUTATIONS.clear ()
+        return exmath.ohmicArea (data )
+    return run
+
+@benchmark ('forwardVES', 'models')
+def _forward_ves (size, tmpdir ):
+    from kalfeat.tools.exmath import forwardVES
+    rng = np.random.default_rng (0 )
+    AB = np.logspace (0, np.log10 (300. ), 25 )
+    rho, h = rng.uniform (10, 1000, (size, 3)), rng.uniform (1, 20, (size, 2))
+    return lambda: forwardVES (AB, rho, h )
+
+@benchmark ('invertVES', 'spacings')
+def _invert_ves (size, tmpdir ):
+    from kalfeat.tools.coreutils import vesSelector
+    from kalfeat.tools.exmath import invertVES
+    data = vesSelector (make_ves (1, size, seed =0 ))
+    return lambda: invertVES (data, typeof ='LM')
+
+@benchmark ('invertVES[HMCMC]', 'spacings')
+def _invert_ves_hmc (size, tmpdir ):
+    from kalfeat.tools.coreutils import vesSelector
+    from kalfeat.tools.exmath import invertVES
+    data = vesSelector (make_ves (1, size, seed =0 ))
+    return lambda: invertVES (data, typeof ='HMCMC', seed =0 )
+
+def _zones (size ):
+    """ `size` conductive zones of 7 stations."""
+    return np.abs (np.random.default_rng (0 ).standard_normal ((size, 7))
+                   ) * 100
+
+@benchmark ('sfi', 'zones')
+def _sfi (size, tmpdir ):
+    from kalfeat.tools.exmath import sfi
+    czs = _zones (size )
+    return lambda: [ sfi (cz ) for cz in czs ]
+
+@benchmark ('batch_sfi', 'zones')
+def _batch_sfi (size, tmpdir ):
+    from kalfeat.tools.exmath import batch_sfi
+    czs = _zones (size )
+    return lambda: batch_sfi (czs )
+
+def _utm_points (size ):
+    rng = np.random.default_rng (0 )
+    return (rng.uniform (7e5, 8e5, size ), rng.uniform (1.05e6, 1.15e6, size ))
+
+def _register_projections (backend, label ):
+    """ Register the projections of the gistools `backend`."""
+    @benchmark (f'project_points_utm2ll[{label}]', 'points')
+    def _utm2ll (size, tmpdir ):
+        from kalfeat.tools.gistools import project_points_utm2ll
+        east, north = _utm_points (size )
+        return lambda: project_points_utm2ll (
+            east, north, UTM_ZONE, backend = backend )
+
+    @benchmark (f'project_points_ll2utm[{label}]', 'points')
+    def _ll2utm (size, tmpdir ):
+        from kalfeat.tools.gistools import (
+            project_points_utm2ll,
+            project_points_ll2utm
+            )
+        lat, lon, _ = project_points_utm2ll (
+            *_utm_points (size ), UTM_ZONE, backend ='numpy')
+        return lambda: project_points_ll2utm (
+            lat, lon, utm_zone = UTM_ZONE, backend = backend )
+
+# the default backend is GDAL if available and pyproj otherwise
+for _backend, _label in ((None, 'default'), ('numpy', 'numpy')):
+    _register_projections (_backend, _label )
+
+
+def time_callable (func, repeat =5, number =None ):
+    """ Time `func` and return the best and the median time of a call in
+    seconds with the number of calls of each run.
+
+    When `number` is not given, it is set so that a run lasts at least
+    0.2 second as in :meth:`timeit.Timer.autorange`.
+    """
+    timer = timeit.Timer (func )
+    if number is None:
+        number, _ = timer.autorange ()
+    times = np.array (timer.repeat (repeat, number )) / number
+    return dict (best = float (times.min ()), median = float (np.median (times)),
+                 number = number, repeat = repeat )
+
+def run_benchmarks (names =None, quick =False, repeat =5 ):
+    """ Run the benchmarks whose name contains one of `names`, all of them
+    by default.
+
+    :param names: list of str - Substrings of the names of the benchmarks.
+    :param quick: bool - Run once the smallest size of each scale.
+    :param repeat: int - Number of runs of each benchmark.
+    :returns: dict of the timings with the versions of the environment,
+        ready to be dumped in JSON.
+    """
+    results = []
+    selected = [ b for b in BENCHMARKS if not names or any (
+        n.lower () in b.name.lower () for n in names )]
+    with tempfile.TemporaryDirectory () as tmpdir, \
+            warnings.catch_warnings ():
+        # keep the timings free of the warnings of the synthetic data
+        warnings.simplefilter ('ignore')
+        for b in selected:
+            for size in SCALES [b.scale][:1 if quick else None]:
+                func = b.setup (size, tmpdir )
+                func () # warm up e.g. the caches and the lazy imports
+                t = time_callable (func, repeat = 1 if quick else repeat,
+                                   number = 1 if quick else None )
+                results.append (dict (name = b.name, scale = b.scale,
+                                      size = size, **t ))
+    return dict (
+        created = time.strftime ('%Y-%m-%dT%H:%M:%S'),
+        kalfeat = kalfeat.__version__,
+        python = platform.python_version (),
+        numpy = np.__version__,
+        pandas = pd.__version__,
+        platform = platform.platform (),
+        results = results
+        )
+
+def compare (base, new, threshold = THRESHOLD ):
+    """ Compare the best timings of two runs.
+
+    :param base: dict - Timings of the reference version.
+    :param new: dict - Timings of the version to check.
+    :param threshold: float - Ratio of the timings beyond which a benchmark
+        is a regression; its inverse marks an improvement.
+    :returns: dataframe of the benchmarks run in both, with the ratio of the
+        timings and their ``status``.
+    """
+    key = ['name', 'size']
+    table = pd.DataFrame (base ['results'])[key + ['best']].merge (
+        pd.DataFrame (new ['results'])[key + ['best']], on = key,
+        suffixes = ('_base', '_new'))
+    table ['ratio'] = table.best_new / table.best_base
+    table ['status'] = np.select (
+        [table.ratio > threshold, table.ratio < 1 / threshold ],
+        ['regression', 'improvement'], default ='')
+    return table.set_index (key )
+
+def main (argv =None ):
+    parser = argparse.ArgumentParser (
+        prog ='python -m tests.benchmarks.run_benchmarks',
+        description ='Time kalfeat on synthetic surveys.')
+    parser.add_argument ('-o', '--output', default = None,
+                         help ='JSON file of the timings.')
+    parser.add_argument ('-k', dest ='names', action ='append',
+                         help ='Run the benchmarks whose name contains it.')
+    parser.add_argument ('--quick', action ='store_true',
+                         help ='Run once the smallest size of each scale.')
+    parser.add_argument ('--repeat', type = int, default = 5 )
+    parser.add_argument ('--compare', default = None,
+                         help ='JSON file of the base timings.')
+    parser.add_argument ('--threshold', type = float, default = THRESHOLD )
+    args = parser.parse_args (argv )
+
+    timings = run_benchmarks (args.names, quick = args.quick,
+                              repeat = args.repeat )
+    for r in timings ['results']:
+        print (f"{r['name']:<36} {r['scale']:>9} = {r['size']:<7} "
+               f"{r['best'] * 1e3:12.3f} ms")
+    if args.output:
+        with open (args.output, 'w') as f:
+            json.dump (timings, f, indent =2 )
+
+    if args.compare:
+        with open (args.compare ) as f:
+            table = compare (json.load (f), timings, args.threshold )
+        if table.empty:
+            print (f'No benchmark in common with {args.compare!r}.',
+                   file = sys.stderr )
+            return 2
+        print (table.to_string (float_format ='{:.4g}'.format ))
+        return int ((table.status =='regression').any ())
+    return 0
+
+
+if __name__ =='__main__':
+    sys.exit (main ())
@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+"""
+ Synthetic surveys
+ ^^^^^^^^^^^^^^^^^
+
+Generators of |ERP| lines, |VES| soundings and whole campaigns of any size
+for the benchmarks. The data are laid out as the field files of `data/`:
+raw headers that the selectors have to parse, stations every dipole length
+and UTM coordinates in the zone of the Gbalo surveys.
+
+.. |ERP| replace:: Electrical resistivity profiling
+.. |VES| replace:: Vertical electrical sounding
+"""
+import numpy as np
+import pandas as pd
+
+# origin of the synthetic lines, close to the l10 line of Gbalo
+EASTING, NORTHING, UTM_ZONE = 790284., 1093124., '30N'
+
+
+def make_erp (
+        n_stations =100,
+        dipolelength =10.,
+        n_anomalies =None,
+        coordinates ='utm',
+        seed =None
+        ):
+    """ Make an |ERP| line of `n_stations`.
+
+    The background resistivity is log-normal around a few hundreds of
+    ohm.meters and the conductive zones are gaussian troughs a few stations
+    wide.
+
+    :param n_stations: int - Number of stations of the line.
+    :param dipolelength: float - Distance between stations in meters.
+    :param n_anomalies: int - Number of conductive zones. Default is one
+        per hundred stations.
+    :param coordinates: str - ``'utm'`` gives the easting and northing
+        (``x``, ``y``) as in the field files, ``'ll'`` the longitude and
+        latitude, and ``None`` no coordinates.
+    :param seed: int - Seed of the random generator.
+    :returns: dataframe with the raw headers ``pk``, ``x``, ``y`` and ``rho``.
+    """
+    rng = np.random.default_rng (seed )
+    pk = np.arange (n_stations ) * float (dipolelength )
+    n_anomalies = max (1, n_stations // 100 ) if n_anomalies is None else (
+        n_anomalies )
+    logrho = np.log10 (300. ) + .15 * rng.standard_normal (n_stations )
+    for c in rng.uniform (0, n_stations, n_anomalies ):
+        w = rng.uniform (1.5, 4. )
+        logrho -= rng.uniform (.5, 1.2 ) * np.exp (
+            -.5 * ((np.arange (n_stations ) - c) / w )**2 )
+    data = dict (pk = pk , rho = np.round (10 ** logrho, 1) )
+
+    if coordinates is not None:
+        # the line runs south-south-west with a small jitter
+        east = EASTING - .5 * pk + rng.normal (0, .5, n_stations )
+        north = NORTHING - .85 * pk + rng.normal (0, .5, n_stations )
+        if coordinates =='ll':
+            from kalfeat.tools.gistools import project_points_utm2ll
+            lat, lon, _ = project_points_utm2ll (east, north, UTM_ZONE,
+                                              backend ='numpy')
+            data.update (lon = lon, lat = lat )
+        else:
+            data.update (x = np.round (east ), y = np.round (north ))
+
+    return pd.DataFrame (data )
+
+def make_ves (
+        n_soundings =4,
+        n_spacings =32,
+        seed =None
+        ):
+    """ Make `n_soundings` Schlumberger soundings sharing the same spacings.
+
+    The curves are of H-type as the ones of Gbalo: a resistive cover over a
+    conductive weathered layer lying on the resistive basement. As in the
+    field files, some spacings ``AB/2`` are measured twice with a larger
+    ``MN/2``.
+
+    :param n_soundings: int - Number of soundings i.e. columns ``SE*``.
+    :param n_spacings: int - Number of measurements of each sounding.
+    :param seed: int - Seed of the random generator.
+    :returns: dataframe with the columns ``AB/2``, ``MN/2`` and ``SE1``...
+    """
+    rng = np.random.default_rng (seed )
+    # MN/2 is enlarged every 8 measurements and the last spacing is then 
+    # measured again 
+    nover = n_spacings // 8
+    ab = np.round (np.logspace (0, np.log10 (500.), n_spacings - nover ), 1)
+    steps = np.array_split (np.arange (len(ab)), nover + 1 )
+    rows_ab, rows_mn = [], []
+    for k, st in enumerate (steps ):
+        mn = .4 * 2.5 **k
+        if k:
+            rows_ab.append (ab[steps[k-1][-1]]) ; rows_mn.append (mn )
+        rows_ab.extend (ab[st]) ; rows_mn.extend ([mn] * len(st))
+
+    x = np.log10 (rows_ab )
+    data = {'AB/2': rows_ab, 'MN/2': np.round (rows_mn, 2)}
+    for k in range (n_soundings ):
+        r1, r3 = rng.uniform (800, 1500 ), rng.uniform (600, 1200 )
+        depth, dip = rng.uniform (.8, 1.4 ), rng.uniform (.4, .8 )
+        logrho = np.log10 (r1) + (np.log10(r3) - np.log10 (r1)) / (
+            1 + np.exp (-4 * (x - depth - .6))) - dip * np.exp (
+                -.5 * ((x - depth) / .35 )**2 )
+        data [f'SE{k+1}'] = np.round (10 ** logrho )
+
+    return pd.DataFrame (data )
+
+def make_campaign (
+        n_lines =10,
+        n_stations =100,
+        seed =None,
+        **kws
+        ):
+    """ Make a whole campaign of `n_lines` |ERP| lines.
+
+    :param n_lines: int - Number of lines.
+    :param n_stations: int - Number of stations of each line.
+    :param seed: int - Seed of the random generator.
+    :param kws: dict - Keyword arguments of :func:`make_erp`.
+    :returns: dataframe of the lines stacked one after another with their
+        name in the ``line`` column as in the campaign exports read by
+        :func:`~kalfeat.tools.coreutils.iter_erp_lines`.
+    """
+    seeds = np.random.SeedSequence (seed ).spawn (n_lines )
+    lines = [ make_erp (n_stations, seed = s, **kws ).assign (
+        line = f'L{k+1:03}') for k, s in enumerate (seeds )]
+    return pd.concat (lines, ignore_index =True )
+
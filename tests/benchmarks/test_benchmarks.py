@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""
+ Test benchmarks  
+ ^^^^^^^^^^^^^^^
+
+The benchmark suite runs on the synthetic surveys and the comparison of 
+two runs flags the regressions. 
+"""
+import os 
+import copy 
+import json 
+import unittest 
+
+from tests import make_temp_dir 
+from tests.benchmarks.synthetic import make_erp, make_ves, make_campaign 
+from tests.benchmarks.run_benchmarks import (
+    BENCHMARKS, 
+    run_benchmarks, 
+    compare, 
+    main 
+    )
+
+class TestBenchmarks (unittest.TestCase): 
+    
+    @classmethod 
+    def setUpClass (cls ): 
+        cls._temp_dir = make_temp_dir(cls.__name__)
+        
+    def test_synthetic_surveys (self): 
+        """ Generators give the layout of the field files at any size."""
+        erp = make_erp (250, seed =0 )
+        self.assertEqual (list(erp.columns), ['pk', 'rho', 'x', 'y'])
+        self.assertEqual (len(erp), 250 )
+        self.assertTrue (erp.equals (make_erp (250, seed =0 )))
+        self.assertEqual (list(make_erp (10, coordinates ='ll').columns), 
+                          ['pk', 'rho', 'lon', 'lat'])
+        ves = make_ves (3, 40 )
+        self.assertEqual (ves.shape, (40, 5))
+        self.assertTrue ((ves.iloc[:, 2:] > 0).all(axis =None))
+        campaign = make_campaign (4, 20 )
+        self.assertEqual (list(campaign.line.unique()), 
+                          ['L001', 'L002', 'L003', 'L004'])
+        
+    def test_run_and_compare (self): 
+        """ Timings are dumped in JSON and regressions are detected."""
+        timings = run_benchmarks (['Selector', 'sfi'], quick =True )
+        self.assertEqual ({r['name'] for r in timings['results']}, {
+            'erpSelector', 'vesSelector', 'sfi', 'batch_sfi'})
+        self.assertEqual (len({b.name for b in BENCHMARKS}), len(BENCHMARKS))
+        
+        base = os.path.join (self._temp_dir, 'base.json')
+        with open (base, 'w') as f: 
+            json.dump (timings, f )
+        slow = copy.deepcopy (timings )
+        slow['results'][0]['best'] *= 2 
+        table = compare (timings, slow )
+        self.assertEqual (list(table.status), ['regression'] + [''] * (
+            len(table) -1 ))
+        # the ohmicArea runs compared against a base without them 
+        self.assertEqual (main (['--quick', '-k', 'ohmicArea', 
+                                 '--compare', base ]), 2 )
+        
+        obase = os.path.join (self._temp_dir, 'ohmic_base.json')
+        self.assertEqual (main (['--quick', '-k', 'ohmicArea', '-o', obase ]), 
+                          0 )
+        with open (obase ) as f: 
+            otimings = json.load (f )
+        self.assertEqual ({r['name'] for r in otimings['results']}, 
+                          {'ohmicArea', 'ohmicArea[cold]'})
+        # a single quick run is noisy: only a gross slowdown is flagged 
+        self.assertEqual (main (['--quick', '-k', 'ohmicArea', '--compare', 
+                                 obase, '--threshold', '100' ]), 0 )
+        for r in otimings['results']: 
+            r['best'] /= 1e4 
+        with open (obase, 'w') as f: 
+            json.dump (otimings, f )
+        self.assertEqual (main (['--quick', '-k', 'ohmicArea', '--compare', 
+                                 obase, '--threshold', '100' ]), 1 )
+        
+        
+if __name__=='__main__': 
+    unittest.main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+ Test construction cost
+ ^^^^^^^^^^^^^^^^^^^^^^
+
+Building the methods objects must stay cheap: the logging is configured
+once and the named loggers are cached.
+"""
+import os
+import json
+import logging
+import unittest
+
+from kalfeat._kalfeatlog import kalfeatlog
+from tests.benchmarks import run_python
+from tests.benchmarks.run_benchmarks import time_callable
+
+# budget in microseconds for building one object, best of the runs.
+INIT_BUDGET = float (os.environ.get ('KALFEAT_INIT_BUDGET', 50 ))
+
+_CONFIGURE_CODE = """
+import json, logging
+calls = []
+basicConfig = logging.basicConfig
+logging.basicConfig = lambda *a, **k: (calls.append(1), basicConfig(*a, **k))
+from kalfeat.methods import ResistivityProfiling, VerticalSounding
+objs = [cls() for cls in (ResistivityProfiling, VerticalSounding) * 100]
+print(json.dumps({'calls': len(calls)}))
+"""
+
+
+class TestConstruction (unittest.TestCase):
+
+    def test_configure_once (self):
+        """ The default logging configuration is loaded once."""
+        out, = run_python (_CONFIGURE_CODE, repeat =1 )
+        self.assertEqual (json.loads (out.splitlines()[-1]), {'calls': 1})
+
+    def test_cached_loggers (self):
+        """ The named loggers are the ones of :mod:`logging`."""
+        logger = kalfeatlog.get_kalfeat_logger ('kalfeat.test')
+        self.assertIs (logger, kalfeatlog.get_kalfeat_logger ('kalfeat.test'))
+        self.assertIs (logger, logging.getLogger ('kalfeat.test'))
+
+    def test_construction_budget (self):
+        """ Building an object stays under budget."""
+        from kalfeat.methods import ResistivityProfiling, VerticalSounding
+        for cls in (ResistivityProfiling, VerticalSounding):
+            best = time_callable (cls, repeat =3, number =1000 )['best'] * 1e6
+            self.assertLess (best, INIT_BUDGET,
+                f"{cls.__name__}() took {best:.1f}us; budget {INIT_BUDGET}us")
+
+
+if __name__=='__main__':
+    unittest.main()
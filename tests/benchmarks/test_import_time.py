@@ -0,0 +1,53 @@
+# -*- coding: utf-8 -*-
+"""
+ Test import time  
+ ^^^^^^^^^^^^^^^^
+
+`import kalfeat` must stay cheap: the scientific stack is only loaded 
+when a submodule that needs it is reached. 
+"""
+import os 
+import json 
+import unittest 
+
+from tests.benchmarks import run_python 
+
+# budget in seconds for a bare ``import kalfeat``, best of the runs.
+IMPORT_BUDGET = float (os.environ.get ('KALFEAT_IMPORT_BUDGET', .5 ))
+HEAVY_MODULES = ('numpy', 'pandas', 'scipy', 'matplotlib', 'pyproj', 
+                 'sklearn')
+
+_IMPORT_CODE = """
+import sys, time, json
+t = time.perf_counter()
+import kalfeat
+t = time.perf_counter() - t
+print(json.dumps({'time': t, 'modules': sorted(
+    m for m in %r if m in sys.modules)}))
+""" % (HEAVY_MODULES,)
+
+
+class TestImportTime (unittest.TestCase): 
+    
+    def test_import_budget (self): 
+        """ Bare import stays under budget and loads no heavy module."""
+        outs = [json.loads (o) for o in run_python (_IMPORT_CODE)] 
+        best = min (o['time'] for o in outs)
+        self.assertLess (best, IMPORT_BUDGET, 
+            f"'import kalfeat' took {best:.3f}s; budget {IMPORT_BUDGET}s")
+        for o in outs : 
+            self.assertEqual (o['modules'], [])
+        
+    def test_lazy_access (self): 
+        """ Submodules and the tools names are still reachable."""
+        code =("import sys, kalfeat;"
+               "print(kalfeat.methods.ResistivityProfiling.__name__,"
+               " kalfeat.tools.erpSelector.__name__,"
+               " 'matplotlib' in sys.modules)") 
+        out, = run_python (code , repeat =1 )
+        self.assertEqual (out.split()[-3:], 
+                          ['ResistivityProfiling', 'erpSelector', 'False']) 
+        
+        
+if __name__=='__main__': 
+    unittest.main()
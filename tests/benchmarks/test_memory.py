@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+"""
+ Test memory  
+ ^^^^^^^^^^^
+
+Memory held by the features of many fitted |ERP| lines.
+"""
+import os 
+import pickle 
+import tracemalloc 
+import unittest 
+
+import numpy as np 
+
+from kalfeat.methods import ResistivityProfiling, ProfileFeatures
+from tests import ERP_DATA_DIR 
+
+N_LINES = 100_000 
+# budget in bytes per fitted line kept in memory 
+FEATURES_BUDGET = int (os.environ.get ('KALFEAT_FEATURES_BUDGET', 1024 ))
+
+
+def _traced (func ): 
+    """ Return the output of `func` and the memory it still holds."""
+    tracemalloc.start()
+    try : 
+        out = func () 
+        size, _ = tracemalloc.get_traced_memory()
+    finally: 
+        tracemalloc.stop()
+    return out, size 
+
+
+class TestFeaturesMemory (unittest.TestCase): 
+    
+    @classmethod 
+    def setUpClass (cls ): 
+        cls.rObj = ResistivityProfiling(auto =True).fit(
+            os.path.join(ERP_DATA_DIR, 'l10_gbalo.xlsx'))
+        cls.features = cls.rObj.features() 
+        
+    def _lines (self, as_record =True ): 
+        """ Records of `N_LINES` distinct fitted lines."""
+        base = self.features.as_dict() 
+        lines = []
+        for ii in range (N_LINES ): 
+            values = dict (base, station = f'S{ii % 1000:03}', 
+                           sfi = ii * 1e-3, power = float (ii), 
+                           conductive_zone = base['conductive_zone'].copy(), 
+                           position_zone = base['position_zone'].copy())
+            lines.append (ProfileFeatures(**values) if as_record else values)
+        return lines 
+    
+    def test_features_memory (self): 
+        """ 100k records stay under budget and below the dict records."""
+        records, rsize = _traced (self._lines)
+        _, dsize = _traced (lambda: self._lines(as_record =False))
+        self.assertLess(rsize / N_LINES, FEATURES_BUDGET, 
+                        f'{rsize / N_LINES:.0f} bytes per line; budget '
+                        f'{FEATURES_BUDGET} bytes.')
+        self.assertLess(rsize, dsize)
+        
+        table = ProfileFeatures.to_frame(records)
+        self.assertEqual(table.shape, (N_LINES, 12))
+        np.testing.assert_allclose(table.sfi, np.arange(N_LINES) * 1e-3)
+        
+    def test_features_pickle (self): 
+        """ Records are cheaper to pickle than the fitted objects."""
+        blob = pickle.dumps(self.features)
+        self.assertEqual(pickle.loads(blob), self.features)
+        self.assertLess(len(blob), len(pickle.dumps(self.rObj)) / 4 )
+        self.assertEqual(self.features.type, self.rObj.type_)
+        self.assertEqual(self.features.station, self.rObj.sves_)
+        
+        
+if __name__=='__main__': 
+    unittest.main()
@@ -7,6 +7,7 @@ Test module methods
 """
 import os
 import numpy as np 
+import pandas as pd 
 # import datetime
 import  unittest 
 import pytest
@@ -17,10 +18,13 @@ from kalfeat.methods import (
 from tests import ( 
     DATA_UNSAFE, 
     TEST_TEMP_DIR, 
+    ERP_DATA_DIR, 
     make_temp_dir ,
     DATA_VES 
     ) 
 from tests.methods.__init__ import reset_matplotlib, kalfeatlog, diff_files
+from kalfeat.tools.coreutils import erpSelector, iter_erp_lines 
+from kalfeat.exceptions import ERPError, FitError 
 
 class TestERP(unittest.TestCase):
     """
@@ -85,6 +89,123 @@ class TestERP(unittest.TestCase):
         self.assertIsInstance(rObj.conductive_zone_, np.ndarray)
         self.assertAlmostEqual(rObj.dipole, 30) 
 
+    def test_fit_many(self): 
+        """ Test the batch fitting of many ERP lines and the per-line error 
+        capture."""
+        files = [os.path.join(ERP_DATA_DIR, f) for f in (
+            'l10_gbalo.xlsx', 'l11_gbalo.xlsx', 'test_anomaly.xlsx')] 
+        table = ResistivityProfiling.fit_many(files, auto =True )
+        
+        self.assertEqual(list(table.index), 
+                         ['l10_gbalo.xlsx', 'l11_gbalo.xlsx','test_anomaly.xlsx'])
+        rObj = ResistivityProfiling(auto =True).fit(files[0])
+        self.assertEqual(table.loc['l10_gbalo.xlsx', 'station'], rObj.sves_) 
+        self.assertEqual(table.loc['l10_gbalo.xlsx', 'type'], rObj.type_) 
+        self.assertEqual(table.loc['l10_gbalo.xlsx', 'shape'], rObj.shape_) 
+        self.assertAlmostEqual(table.loc['l10_gbalo.xlsx', 'sfi'], 
+                               float(rObj.sfi_)) 
+        self.assertIsNone(table.loc['l10_gbalo.xlsx', 'error'])
+        # the bad line is reported instead of aborting the run
+        self.assertIsNotNone(table.loc['test_anomaly.xlsx', 'error'])
+        
+        ptable = ResistivityProfiling.fit_many(files, n_jobs =2, auto =True )
+        self.assertTrue(table.drop(columns ='error').equals(
+            ptable.drop(columns ='error')))
+        
+    def test_fit_zero_copy(self): 
+        """ Test the zero-copy fit mode against the default copy mode."""
+        f = os.path.join(ERP_DATA_DIR, 'l10_gbalo.xlsx')
+        rObj = ResistivityProfiling(auto =True).fit(f)
+        data = erpSelector(f)
+        cdata = data.copy()
+        ResistivityProfiling(auto =True).fit(data)
+        self.assertTrue(data.equals(cdata)) # the default mode copies 
+        
+        zObj = ResistivityProfiling(auto =True, copy =False).fit(data)
+        self.assertIs(zObj.data_, data)
+        for attr in ('sves_', 'power_', 'magnitude_', 'shape_', 'type_'): 
+            self.assertEqual(getattr(zObj, attr), getattr(rObj, attr))
+        self.assertAlmostEqual(float(zObj.sfi_), float(rObj.sfi_))
+        # components are views on the caller's frame 
+        for attr, col in (('resistivity_', 'resistivity'), 
+                          ('position_', 'station'), ('east_', 'easting'), 
+                          ('north_', 'northing'), ('lat_', 'latitude'), 
+                          ('lon_', 'longitude')): 
+            self.assertIsInstance(getattr(zObj, attr), np.ndarray)
+            self.assertTrue(np.shares_memory(getattr(zObj, attr), 
+                                             data[col].to_numpy()))
+        
+    def test_scan(self): 
+        """ Test the ranking of the drilling candidates of a fitted line."""
+        rObj = ResistivityProfiling(auto =True).fit(
+            os.path.join(ERP_DATA_DIR, 'l10_gbalo.xlsx'))
+        scan = rObj.scan(k = 3 )
+        self.assertIs(scan, rObj.candidates_)
+        self.assertEqual(len(scan), 3)
+        # the best candidate is the auto-detected station 
+        best = scan.loc[1]
+        self.assertEqual(best.station, rObj.sves_)
+        self.assertEqual(best.magnitude, rObj.magnitude_)
+        self.assertEqual(best.power, rObj.power_)
+        self.assertEqual(best['shape'], rObj.shape_)
+        self.assertAlmostEqual(best.sfi, float(rObj.sfi_))
+        self.assertRaises(FitError, ResistivityProfiling().scan)
+        
+    def test_fit_many_stream(self): 
+        """ Test the streaming of the lines of a whole campaign file."""
+        names = ('l10_gbalo', 'l11_gbalo', 'l2_gbalo')
+        files = [os.path.join(ERP_DATA_DIR, f'{n}.xlsx') for n in names ] 
+        campaign = pd.concat ([pd.read_excel(f).set_axis(
+            ['pk', 'x', 'y', 'rho'], axis =1 ).assign (line = n ) 
+            for n, f in zip (names, files )])
+        cfile = os.path.join(self._temp_dir, 'campaign.csv')
+        campaign.to_csv(cfile, index =False )
+        
+        lines = list(iter_erp_lines(cfile, chunksize = 7 ))
+        self.assertEqual([ l for l, _ in lines ], list(names))
+        for (_, data), f in zip (lines, files ): 
+            self.assertTrue(np.allclose(data, erpSelector(f)))
+            
+        table = ResistivityProfiling.fit_many(files, auto =True )
+        stable = ResistivityProfiling.fit_many(
+            iter_erp_lines(cfile, chunksize =7 ), auto =True )
+        self.assertListEqual(list(stable.index), list(names))
+        self.assertTrue(np.array_equal(table.drop(columns ='error').values, 
+                                       stable.drop(columns ='error').values))
+        ptable = ResistivityProfiling.fit_many(
+            iter_erp_lines(cfile, chunksize =7 ), n_jobs =2, auto =True )
+        self.assertTrue(stable.equals(ptable))
+        
+        # the rows of a line must be contiguous 
+        campaign.sample(frac =1, random_state =0).to_csv(cfile, index =False)
+        with self.assertRaises(ERPError): 
+            list(iter_erp_lines(cfile))
+        
+    def test_timings(self):
+        """ Test the opt-in stage timings of the fit pipelines."""
+        f = os.path.join(ERP_DATA_DIR, 'l10_gbalo.xlsx')
+        self.assertEqual(ResistivityProfiling(auto =True).fit(f).timings_, {})
+        rObj = ResistivityProfiling(auto =True, timings =True).fit(f)
+        self.assertEqual(list(rObj.timings_),
+                         ['read', 'coordinates', 'stations', 'zone', 'features'])
+        self.assertTrue(all(t >= 0 for t in rObj.timings_.values()))
+
+        files = [os.path.join(ERP_DATA_DIR, f) for f in (
+            'l10_gbalo.xlsx', 'l11_gbalo.xlsx', 'test_anomaly.xlsx')]
+        table = ResistivityProfiling.fit_many(files, auto =True, timings =True)
+        stages = table.attrs['timings']
+        self.assertListEqual(list(stages.index), list(rObj.timings_))
+        # the failed line is not aggregated
+        self.assertTrue((stages['count'] == 2).all())
+        self.assertAlmostEqual(stages.share.sum(), 1.)
+        self.assertNotIn('timings', ResistivityProfiling.fit_many(
+            files[:1], auto =True).attrs)
+
+        vobj = VerticalSounding(fromS= 45, timings =True).fit(DATA_VES)
+        self.assertEqual(list(vobj.timings_), ['read', 'ohmic_area', 'features'])
+        vobj.fit_all(DATA_VES)
+        self.assertEqual(list(vobj.timings_), ['read', 'ohmic_area'])
+
     def fit_ves(self):
         """
         Test geo-electricals features computations from VES
@@ -95,11 +216,11 @@ class TestERP(unittest.TestCase):
         >>> vobj = VerticalSounding(fromS= 45, vesorder= 3)
         >>> vobj.fit('data/ves/ves_gbalo.xlsx')
         >>> vobj.ohmic_area_ # in ohm.m^2
-        ... 349.6432550517697
+        ... 350.70152715374024
         >>> vobj.nareas_ # number of areas computed 
         ... 2
         >>> vobj.area1_, vobj.area2_ # value of each area in ohm.m^2 
-        ... (254.28891096053943, 95.35434409123027) 
+        ... (255.1124146458542, 95.58911250788606) 
         >>> vobj.roots_ # different boundaries in pairs 
         ... [array([45.        , 57.55255255]), array([ 96.91691692, 100.  ])]
         >>> data = vesSelector ('data/ves/ves_gbalo.csv', index_rhoa=3)
@@ -107,12 +228,12 @@ class TestERP(unittest.TestCase):
         >>> vobj.fractured_zone_ # AB/2 position from 45 to 100 m depth.
         ... array([ 45.,  50.,  55.,  60.,  70.,  80.,  90., 100.])
         >>> vobj.fractured_zone_resistivity_
-        ...array([57.67588974, 61.21142365, 64.74695755, 68.28249146, 75.35355927,
-               82.42462708, 89.4956949 , 96.56676271])
+        ...array([57.77169632, 61.30723023, 64.84276413, 68.37829804, 75.44936585,
+               82.52043366, 89.59150147, 96.66256929])
         >>> vobj.nareas_ 
         ... 2
         >>> vobj.ohmic_area_
-        ... 349.6432550517697
+        ... 350.70152715374024
 
         """
         vobj = VerticalSounding(fromS= 45, vesorder= 3)
@@ -125,6 +246,58 @@ class TestERP(unittest.TestCase):
         self.assertIsInstance(vobj.fractured_zone_resistivity_, np.ndarray)
         self.assertAlmostEqual(vobj.nareas_ , 2) 
         
+    def test_fit_all(self): 
+        """ Ohmic-area of all the soundings computed at once must match 
+        the fit of each sounding one by one. """
+        table = VerticalSounding(fromS= 45).fit_all(DATA_VES)
+        self.assertEqual(list(table.columns), ['ohmic_area', 'nareas', 'roots'])
+        self.assertEqual(len(table), 4)
+        for k, (_, row) in enumerate(table.iterrows()): 
+            vobj = VerticalSounding(fromS= 45, vesorder= k).fit(DATA_VES)
+            self.assertAlmostEqual(row.ohmic_area, vobj.ohmic_area_, places =6)
+            self.assertEqual(row.nareas, vobj.nareas_)
+            np.testing.assert_allclose(row.roots, vobj.roots_)
+        
+    def test_fit_memoized(self): 
+        """ Fitting the same sounding again from another `fromS` reuses 
+        the reduced and fitted curve. """
+        vobj = VerticalSounding(fromS= 45, vesorder= 2).fit(DATA_VES)
+        vc = vobj.computation_ 
+        computed = vc.computed.copy() 
+        area45 = vobj.ohmic_area_ 
+        vobj.fromS = 30 
+        vobj.fit(DATA_VES)
+        self.assertIs(vobj.computation_, vc )
+        self.assertEqual(vc.computed['fit'], computed['fit'])
+        self.assertEqual(vc.computed['basement'], computed['basement'] + 1 )
+        vobj.fromS = 45 
+        self.assertAlmostEqual(vobj.fit(DATA_VES).ohmic_area_, area45 )
+        
+    def test_invert(self): 
+        """ Test the inversion of one sounding and of all the soundings 
+        at once."""
+        vobj = VerticalSounding(fromS= 45, vesorder= 2).fit(DATA_VES)
+        vobj.invert(strategy ='LM', nlayers = 4 )
+        self.assertEqual(len(vobj.layer_resistivity_), 4 )
+        self.assertEqual(len(vobj.layer_thickness_), 3 )
+        self.assertEqual(len(vobj.iteration_times_), vobj.niter_)
+        self.assertAlmostEqual(vobj.rms_, vobj.misfits_[-1])
+        
+        table = VerticalSounding(strategy ='LM').invert_many(DATA_VES)
+        self.assertListEqual(list(table.index), ['SE1', 'SE2', 'SE3', 'SE4'])
+        self.assertTrue(table.error.isna().all())
+        np.testing.assert_allclose(table.loc['SE3', 'rho'], 
+                                   VerticalSounding(vesorder =2).invert(
+                                       DATA_VES, strategy ='LM').layer_resistivity_)
+        ptable = VerticalSounding(strategy ='LM').invert_many(
+            DATA_VES, n_jobs =2 )
+        self.assertTrue(np.allclose(table.rms, ptable.rms))
+        
+        vobj.invert(strategy ='HMCMC', nsamples = 50, nwarmup = 50, seed = 0)
+        self.assertEqual(vobj.layer_resistivity_quantiles_.shape, (3, 3))
+        self.assertEqual(vobj.layer_depth_quantiles_.shape, (3, 2))
+        self.assertEqual(vobj.samples_.shape, (4, 50, 5))
+        
 def compare_diff_files(refout, refexp):
     """
     Compare diff files like expected files and output files generated after 
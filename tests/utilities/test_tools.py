@@ -7,6 +7,7 @@
 import os
 # import datetime
 import  unittest 
+from unittest import mock 
 import pytest
 import numpy as np 
 import pandas as pd 
@@ -19,6 +20,7 @@ from tests import (
     DATA_SAFE, 
     DATA_SAFE_XLS,
     DATA_EXTRA ,
+    DATA_VES, 
     PREFIX
 )
 from tests.utilities.__init__ import (
@@ -33,11 +35,44 @@ from tests import make_temp_dir
 from tests.methods.__init__ import (reset_matplotlib,
                                  kalfeatlog, 
                                  diff_files)
-from kalfeat.tools.coreutils import erpSelector
-
+from kalfeat.tools.coreutils import (
+    erpSelector, 
+    fill_coordinates, 
+    vesSelector, 
+    defineConductiveZone, 
+    scanConductiveZones
+    )
+from kalfeat.tools.gistools import (
+    project_point_ll2utm, 
+    project_point_utm2ll, 
+    project_points_ll2utm, 
+    project_points_utm2ll, 
+    transformer_cache_info, 
+    clear_transformer_cache
+    )
+
+from kalfeat.tools import cacheutils 
+from kalfeat.property import P, _resolve_header 
 from kalfeat.tools.exmath import (
     power ,
     magnitude , 
+    shape, 
+    type_, 
+    batch_power, 
+    batch_magnitude, 
+    batch_shape, 
+    batch_type, 
+    batch_sfi, 
+    sfi, 
+    ohmicArea, 
+    vesDataOperator, 
+    ves_computation, 
+    forwardVES, 
+    invertVES, 
+    _resistivity_transform, 
+    find_run_bounds, 
+    find_bound_for_integration, 
+    find_limit_for_integration, 
     _find_cz_bound_indexes
                                 
 ) 
@@ -80,6 +115,445 @@ class TestUtils(unittest.TestCase):
     def test_assert_station_positions (self): 
         pass 
     
+    def test_batch_features (self): 
+        """ Test the array-native features against the scalar ones for a 
+        2-D batch and a ragged batch."""
+        rang = np.random.RandomState(0)
+        for n in (7, 10, 14, 20): 
+            erps = np.abs(rang.randn(50, n)) * 100 
+            self.assertListEqual(list(batch_shape(erps)),
+                                 [shape(erp) for erp in erps])
+            self.assertListEqual(list(batch_type(erps)), 
+                                 [type_(erp) for erp in erps ])
+            
+        lengths = rang.randint(3, 30, 40)
+        flat = np.abs(rang.randn(lengths.sum())) 
+        czs = np.split (flat, np.cumsum(lengths)[:-1])
+        self.assertListEqual(list(batch_shape(flat, lengths = lengths)),
+                             [shape(cz) for cz in czs])
+        np.testing.assert_array_equal(
+            batch_magnitude(flat, lengths = lengths),
+            [magnitude(cz) for cz in czs])
+        np.testing.assert_array_equal(
+            batch_power(flat, lengths = lengths), [power(cz) for cz in czs])
+        
+    def test_batch_sfi (self): 
+        """ Test the batch sfi against the scalar one for a 2-D batch and a 
+        ragged batch."""
+        def _sfi (cz, **kws): 
+            v = np.ravel(sfi(cz, **kws))
+            return v[0] if len(v) else np.nan 
+        
+        rang = np.random.RandomState(0)
+        for n in (3, 7, 10): 
+            czs = np.abs(rang.randn(200, n)) * 100 
+            np.testing.assert_allclose(batch_sfi(czs), 
+                                       [_sfi(cz) for cz in czs], rtol =1e-7)
+        ps = np.arange (7) * 20. + 50. 
+        np.testing.assert_allclose(
+            batch_sfi(czs[:, :7], np.tile(ps, (200, 1)), s = 2), 
+            [_sfi(cz[:7], p = ps, s = 2) for cz in czs ], rtol =1e-7)
+        
+        lengths = rang.randint(4, 12, 100)
+        flat = np.abs(rang.randn(lengths.sum())) * 100 
+        czs = np.split (flat, np.cumsum(lengths)[:-1])
+        np.testing.assert_allclose(batch_sfi(flat, lengths = lengths), 
+                                   [_sfi(cz) for cz in czs], rtol =1e-7)
+        
+    def test_batch_sfi_long_line (self): 
+        """ Test the batch index against the scalar index row by row on 
+        the station positions of a km-long line."""
+        rang = np.random.RandomState(7)
+        czs = np.abs(rang.randn(300, 7)) * 100 
+        for offset in (3000., 10000.): 
+            ps = offset + np.arange (7) * 10. + np.arange (300)[:, None] * 70.
+            values = batch_sfi(czs, ps )
+            expected = [np.ravel(sfi(cz, p = p)) for cz, p in zip(czs, ps)]
+            expected = np.array ([v[0] if len(v) else np.nan 
+                                  for v in expected])
+            np.testing.assert_array_equal(np.isnan(values), 
+                                          np.isnan(expected))
+            self.assertGreater((~np.isnan(expected)).sum(), 250)
+            np.testing.assert_allclose(values, expected, rtol =1e-7)
+        
+    def test_scan_conductive_zones (self): 
+        """ Test the ranked candidates of the scanner against the features 
+        of the zones framed by `defineConductiveZone`."""
+        erp = np.abs(np.random.RandomState(1).randn(300)) * 100 
+        p = np.arange(len(erp)) * 10.
+        scan = scanConductiveZones(erp, p, k = None )
+        # one candidate per local minimum, ends included 
+        self.assertTrue((np.diff(scan.resistivity) >= 0).all())
+        self.assertEqual(scan.station.iloc[0], f'S{erp.argmin():03}')
+        for row in scan.itertuples(): 
+            cz, pcz, ix, pos = defineConductiveZone(
+                erp, s = int(row.station[1:]), p = p, keepindex = True)
+            self.assertEqual(pos, int(row.station[1:]))
+            self.assertEqual(row.magnitude, magnitude(cz))
+            self.assertEqual(row.power, power(pcz))
+            self.assertEqual(row.shape, shape(cz, s = ix))
+            expected = np.ravel(sfi(cz, p = pcz, s = ix))
+            self.assertEqual(expected.shape, (1, ))
+            self.assertEqual(np.isnan(row.sfi), np.isnan(expected[0]))
+            np.testing.assert_allclose(row.sfi, expected, rtol = 1e-7)
+            
+        top = scanConductiveZones(erp, p, k = 3, rankby ='magnitude')
+        self.assertListEqual(list(top.magnitude), 
+                             sorted(scan.magnitude, reverse =True)[:3])
+        self.assertEqual(len(scanConductiveZones(erp, p, minima =False, 
+                                                 k = None)), len(erp))
+        self.assertRaises(ValueError, scanConductiveZones, erp, window =6)
+        
+    def test_fill_coordinates (self): 
+        """ Test the bulk projection of the coordinates against the 
+        projection point by point."""
+        lat = np.linspace (9.3, 9.4, 50 ) ; lon = np.linspace(-5.6, -5.5, 50)
+        data = pd.DataFrame (dict (station = np.arange(50) * 10., 
+                                   resistivity = 1., longitude =lon, 
+                                   latitude =lat, easting =0., northing =0.))
+        data, utm_zone = fill_coordinates(data)
+        expected = np.array ([project_point_ll2utm(la, lo)[:2] 
+                              for la, lo in zip(lat, lon)], dtype = float )
+        np.testing.assert_allclose (
+            data[['easting', 'northing']].values, expected)
+        self.assertEqual(utm_zone , '30P')
+        
+        data['longitude'] = 0. ; data['latitude'] =0. 
+        data, _ = fill_coordinates(data, utm_zone = utm_zone)
+        expected = np.array ([project_point_utm2ll(e, n, utm_zone)[:2] 
+                              for e, n in zip(data.easting, data.northing)], 
+                             dtype = float )
+        np.testing.assert_allclose (
+            data[['latitude', 'longitude']].values, expected)
+        np.testing.assert_allclose(data.latitude, lat, atol = 1e-6 )
+        
+    def test_transformer_cache (self): 
+        """ Test that the projections in the same zone reuse one transformer."""
+        clear_transformer_cache()
+        for la, lo in zip (np.linspace (9.3, 9.4, 10 ), 
+                           np.linspace(-5.6, -5.5, 10)): 
+            e, n, _ = project_point_ll2utm(la, lo)
+            project_point_utm2ll(e, n, '30N')
+        info = transformer_cache_info() 
+        self.assertEqual(info.misses, 2)
+        self.assertEqual(info.hits, 18)
+        self.assertEqual(info.currsize, 2)
+        
+    def test_numpy_projection_backend (self): 
+        """ Test the accuracy of the numpy UTM engine against pyproj."""
+        rang = np.random.RandomState(0)
+        for utm_zone, epsg, latr in (('30N', 32630, (0., 60.)), 
+                                     ('18H', 32718, (-60., -1.))): 
+            zn = int(utm_zone[:-1])
+            lat = rang.uniform(*latr, 500)
+            lon = rang.uniform(-3., 3., 500) + (zn - 1) * 6 - 177
+            for kws in (dict (utm_zone =utm_zone), 
+                        dict (utm_zone =None, epsg = epsg)): 
+                e, n, _ = project_points_ll2utm(lat, lon, **kws)
+                ne, nn, _ = project_points_ll2utm(lat, lon, backend ='numpy',
+                                                  **kws)
+                np.testing.assert_allclose(ne, e, atol= 1e-2 )
+                np.testing.assert_allclose(nn, n, atol= 1e-2 )
+                la, lo, _ = project_points_utm2ll(e, n, backend ='numpy', 
+                                                  **kws)
+                np.testing.assert_allclose(la, lat, atol= 1e-6 )
+                np.testing.assert_allclose(lo, lon, atol= 1e-6 )
+                
+        e, n, z = project_point_ll2utm(9.3, -5.6, backend = 'numpy')
+        self.assertEqual(z, '30P')
+        self.assertEqual(project_point_utm2ll(e, n, z, backend ='numpy')[:2], 
+                         (9.3, -5.6))
+        
+        data = pd.DataFrame (dict (longitude =[-5.6, -5.59], 
+                                   latitude = [9.3, 9.31], easting =0., 
+                                   northing =0.))
+        ndata, _ = fill_coordinates(data.copy(), backend ='numpy')
+        data, _ = fill_coordinates(data)
+        np.testing.assert_allclose(ndata[['easting', 'northing']], 
+                                   data[['easting', 'northing']], atol= 1e-2)
+        
+    def test_ohmic_area_integration (self): 
+        """ Test the exact integration of the pseudo-area against quad."""
+        for k in range (4): 
+            data = vesSelector(DATA_VES, index_rhoa = k )
+            (ohmS, err, roots), _ = ohmicArea(data, objective ='ohmS')
+            (qohmS, qerr, qroots), _ = ohmicArea(data, objective ='ohmS', 
+                                                 integration ='quad')
+            np.testing.assert_allclose(ohmS, qohmS, rtol = 1e-8 )
+            np.testing.assert_array_equal(roots, qroots)
+            self.assertFalse(err.any())
+            
+        self.assertRaises(ValueError, ohmicArea, data, integration ='simpson')
+        
+    def test_forward_ves (self): 
+        """ Test the filter forward model against the quadrature of the 
+        Hankel transform."""
+        from scipy import integrate, special 
+        from kalfeat.exceptions import VESError
+        def rhoa_quad (s, rho, h): 
+            rho, h = np.array([rho]), np.array([h])
+            f = lambda l: (_resistivity_transform(np.array([[l]]), rho, h
+                                                  )[0, 0, 0] - rho[0, 0]
+                           ) * special.j1(l * s) * l 
+            return rho[0, 0] + s**2 * integrate.quad(
+                f, 0, 25 / h[0, 0], limit = 1000)[0]
+        
+        AB = [1., 3., 10., 30., 100.]
+        models = (([100., 10., 1000.], [2., 10.]), ([10., 300.], [5.]), 
+                  ([1000., 50., 500., 5.], [3., 4., 30.]))
+        for rho, h in models: 
+            np.testing.assert_allclose(
+                forwardVES(AB, rho, h), [rhoa_quad(s, rho, h) for s in AB], 
+                rtol = 1e-5)
+        # a half-space is exact 
+        np.testing.assert_allclose(forwardVES(AB, [50.], []), 50.)
+        # a batch of models in small chunks 
+        rang = np.random.RandomState(0)
+        rho, h = rang.uniform(10, 1000, (50, 3)), rang.uniform(1, 20, (50, 2))
+        np.testing.assert_allclose(
+            forwardVES(AB, rho, h, chunksize = 7 ), 
+            [forwardVES(AB, r, t) for r, t in zip(rho, h)], rtol = 1e-12)
+        self.assertRaises(VESError, forwardVES, AB, rho, h[:, :1])
+        self.assertRaises(VESError, forwardVES, AB, -rho, h)
+        
+    def test_ves_data_operator (self): 
+        """ Test the reduction of the duplicated spacings. """
+        AB = np.array ([1, 2, 2, 3, 3, 3, 5, 4])
+        rhoa = np.array ([10, 20, 30, 1, 2, 9, 7, 8])
+        X, Y = vesDataOperator(AB, rhoa )
+        np.testing.assert_array_equal(X, [1, 2, 3, 4, 5])
+        # the means of integers are not truncated 
+        np.testing.assert_allclose(Y, [10, 25, 4, 8, 7])
+        X, Y = vesDataOperator(AB, rhoa, typeofop ='median')
+        np.testing.assert_allclose(Y, [10, 25, 2, 8, 7])
+        
+        X, Y = vesDataOperator(AB, rhoa, typeofop ='leaveOneOut', seed =0 )
+        np.testing.assert_array_equal(Y, vesDataOperator(
+            AB, rhoa, typeofop ='leaveOneOut', seed =0 )[1])
+        self.assertIn(Y[1], (20, 30 )); self.assertIn(Y[2], (1, 2, 9 ))
+        
+        # all the sounding curves at once 
+        data = vesSelector(DATA_VES, keep_all =True )
+        for op in ('mean', 'median'): 
+            X, Y = vesDataOperator(data.AB, data.iloc[:, 2:], typeofop = op )
+            self.assertEqual(Y.shape, (len(np.unique(data.AB)), 4))
+            for k, name in enumerate (data.columns[2:]): 
+                np.testing.assert_allclose(Y[:, k], vesDataOperator(
+                    data.AB, data[name], typeofop = op )[1])
+        df = vesDataOperator(data.AB, data.iloc[:, 2:], outdf =True )
+        self.assertListEqual(list(df.columns), ['AB'] + list(data.columns[2:]))
+        
+    def test_ves_computation (self): 
+        """ Test the memoized stages of the ohmic-area computation. """
+        data = vesSelector(DATA_VES, index_rhoa = 1 )
+        vc = ves_computation(data, typeofop ='median')
+        self.assertIs(vc, ves_computation(data.copy(), typeofop ='median'))
+        self.assertIsNot(vc, ves_computation(data ))
+        self.assertIsNot(vc, ves_computation(data, typeofop ='leaveOneOut'))
+        
+        computed = vc.computed.copy() 
+        r0 = ohmicArea(data, ohmSkey = 45, typeofop ='median', 
+                       objective ='coverall')
+        r1 = ohmicArea(data, ohmSkey = 45, typeofop ='median', objective ='view')
+        np.testing.assert_array_equal(r0[1][0], r1[1][0])
+        ohmicArea(data, ohmSkey = 30, typeofop ='median', intersection ='exact')
+        # only the stages downstream of `ohmSkey` run again 
+        self.assertLessEqual(vc.computed['curve'] - computed['curve'], 1 )
+        self.assertLessEqual(vc.computed['fit'] - computed['fit'], 1 )
+        self.assertEqual(vc.computed['basement'] - computed['basement'], 2 )
+        self.assertEqual(vc.computed['area'] - computed['area'], 2 )
+        self.assertFalse(vc.curve[1].flags.writeable)
+        
+        # the outputs can be modified without altering the cache 
+        r0[0][0][:] = 0 
+        self.assertGreater(ohmicArea(data, ohmSkey = 45, typeofop ='median', 
+                                     sum =True )[0][0], 0 )
+        # another curve has its own computation 
+        other = data.copy(); other['resistivity'] *= 2 
+        self.assertIsNot(vc, ves_computation(other, typeofop ='median'))
+        
+    def test_invert_ves (self): 
+        """ Test the damped least-squares inversions on a synthetic 
+        sounding."""
+        AB = np.geomspace(1, 200, 30 )
+        rho, h = np.array([300., 30., 1000.]), np.array([3., 15.])
+        noise = np.exp(.01 * np.random.RandomState(0).randn(len(AB)))
+        rhoa = forwardVES(AB, rho, h) * noise 
+        
+        r = invertVES(AB = AB, rhoa = rhoa, typeof ='LM')
+        self.assertTrue(r['converged'])
+        np.testing.assert_allclose(r['rho'], rho, rtol = .1 )
+        np.testing.assert_allclose(r['h'], h, rtol = .1 )
+        self.assertLess(r['rms'], .015 )
+        self.assertEqual(len(r['times']), r['niter'])
+        self.assertLessEqual(len(r['misfits']), r['niter'] + 1)
+        np.testing.assert_allclose(r['response'], forwardVES(AB, r['rho'], 
+                                                             r['h']))
+        # without a tolerance, the iterations stall before `maxiter` 
+        r = invertVES(AB = AB, rhoa = rhoa, typeof ='LM', tol = 0, 
+                      maxiter = 500 )
+        self.assertFalse(r['converged'])
+        self.assertLess(r['niter'], 500 )
+        r = invertVES(AB = AB, rhoa = rhoa, typeof ='LM', maxiter = 0 )
+        self.assertEqual((r['niter'], r['converged']), (0, False))
+        self.assertEqual(len(r['misfits']), 1 )
+        
+        r = invertVES(AB = AB, rhoa = rhoa, typeof ='occam', nlayers = 12 )
+        self.assertEqual(len(r['rho']), 12 )
+        self.assertLess(r['rms'], .05 )
+        self.assertLess(r['rms'], r['misfits'][0])
+        
+        self.assertRaises(NotImplementedError, invertVES, AB = AB, 
+                          rhoa = rhoa, typeof ='BNN')
+        self.assertRaises(ValueError, invertVES, AB = AB, rhoa = rhoa, 
+                          typeof ='gauss')
+        
+    def test_invert_ves_hmc (self): 
+        """ Test the Hamiltonian Monte Carlo inversion."""
+        AB = np.geomspace(1, 200, 30 )
+        rho, h = np.array([300., 30., 1000.]), np.array([3., 15.])
+        rhoa = forwardVES(AB, rho, h)
+        kws = dict (AB = AB, rhoa = rhoa, nchains = 3, nsamples = 150, 
+                    nwarmup = 100, seed = 0 )
+        
+        r = invertVES(**kws)
+        self.assertEqual(r['samples'].shape, (3, 150, 5))
+        self.assertEqual(r['rho_quantiles'].shape, (3, 3))
+        self.assertEqual(r['h_quantiles'].shape, (3, 2))
+        self.assertEqual(len(r['times']), r['niter'])
+        for q in ('rho_quantiles', 'h_quantiles', 'depth_quantiles'): 
+            self.assertTrue((np.diff(r[q], axis =0) >= 0).all())
+        np.testing.assert_allclose(r['rho'], rho, rtol = .05 )
+        np.testing.assert_allclose(r['h'], h, rtol = .05 )
+        self.assertTrue(((r['acceptance'] > .3) & (r['acceptance'] < 1)).all())
+        # each chain has its own stream: the samples do not depend on the 
+        # workers
+        np.testing.assert_array_equal(
+            r['samples'], invertVES(**kws, n_jobs = 2)['samples'])
+        self.assertFalse(np.array_equal(
+            r['samples'], invertVES(**dict (kws, seed =1 ))['samples']))
+        
+    def test_ohmic_area_intersection (self): 
+        """ Test the exact roots against the sampled bounds."""
+        for k in range (4): 
+            data = vesSelector(DATA_VES, index_rhoa = k )
+            (_, _, sroots), _ = ohmicArea(data, objective ='ohmS', 
+                                          sample = 10_000 )
+            (_, _, eroots), _ = ohmicArea(data, objective ='ohmS', 
+                                          intersection ='exact')
+            self.assertEqual(len(sroots), len(eroots))
+            # the sampled bounds lie inside the exact ranges, one step away
+            step = (eroots[-1] - eroots[0]) / 9999 
+            np.testing.assert_allclose(sroots, eroots, atol = step )
+            self.assertTrue((sroots[::2] >= eroots[::2] - 1e-9).all())
+            self.assertTrue((sroots[1::2] <= eroots[1::2] + 1e-9).all())
+        
+    def test_find_run_bounds (self): 
+        """ Test the run-length segmentation against the loop finder."""
+        rang = np.random.RandomState(0)
+        masks = rang.rand(50, 40) > .5 
+        bounds = find_run_bounds(masks)
+        self.assertEqual(len(bounds), len(masks))
+        for mask, b in zip (masks, bounds): 
+            ix, = np.where (mask )
+            if len(ix)==0: 
+                self.assertEqual(len(b), 0 ); continue 
+            self.assertListEqual(list(b), find_limit_for_integration(ix))
+            self.assertListEqual(list(b), list(find_run_bounds(mask)))
+            self.assertListEqual(list(b), list(find_run_bounds(ix)))
+        # no bounds leaked from a previous call 
+        self.assertListEqual(find_bound_for_integration(np.array([3, 4])), 
+                             [3, 4])
+        self.assertListEqual(find_bound_for_integration(np.array([3, 4])), 
+                             [3, 4])
+        
+    def test_excel_cache (self): 
+        """ Test the on-disk cache of the parsed workbooks."""
+        cache_dir = make_temp_dir('TestCache')
+        f = os.path.join(ERP_DATA_DIR, 'l10_gbalo.xlsx')
+        data = pd.read_excel(f)
+        for _ in range (2): 
+            cdata = cacheutils.cached_read(pd.read_excel, f, cache =True, 
+                                           cache_dir = cache_dir )
+            self.assertTrue(cdata.equals(data))
+        self.assertEqual(cacheutils.cache_info(cache_dir)['entries'], 1)
+        # other reader arguments are other entries 
+        cacheutils.cached_read(pd.read_excel, f, cache =True, 
+                               cache_dir = cache_dir, nrows =5 )
+        self.assertEqual(cacheutils.cache_info(cache_dir)['entries'], 2)
+        # no entry is written when the cache is disabled 
+        cacheutils.cached_read(pd.read_excel, f, cache =False, 
+                               cache_dir = cache_dir, nrows =3 )
+        self.assertEqual(cacheutils.cache_info(cache_dir)['entries'], 2)
+        
+        # the least recently used entries are evicted first 
+        files = cacheutils.warm_cache(ERP_DATA_DIR, cache_dir = cache_dir )
+        info = cacheutils.cache_info(cache_dir)
+        self.assertEqual(info['entries'], len(files) + 1 )
+        os.environ['KALFEAT_CACHE_MAXSIZE'] = str(
+            info['size'] / 2 / 1024 **2 )
+        try : 
+            cacheutils.cached_read(pd.read_excel, f, cache =True, 
+                                   cache_dir = cache_dir, nrows =1 )
+        finally: 
+            del os.environ['KALFEAT_CACHE_MAXSIZE']
+        self.assertLessEqual(cacheutils.cache_info(cache_dir)['size'], 
+                             info['size'] / 2 )
+        self.assertIsNotNone(cacheutils._lookup(cache_dir, cacheutils.cache_key(
+            f, reader = 'read_excel', nrows =1 )))
+        
+        self.assertGreater(cacheutils.clear_cache(cache_dir), 0 )
+        self.assertEqual(cacheutils.cache_info(cache_dir)['entries'], 0)
+        
+    def test_excel_cache_race (self): 
+        """ Test the reads through an entry evicted by another worker or 
+        that cannot be touched."""
+        cache_dir = make_temp_dir('TestCacheRace')
+        f = os.path.join(ERP_DATA_DIR, 'l10_gbalo.xlsx')
+        data = pd.read_excel(f)
+        cacheutils.cached_read(pd.read_excel, f, cache =True, 
+                               cache_dir = cache_dir )
+        lookup = cacheutils._lookup 
+        def evicted_lookup (*args ): 
+            path = lookup(*args )
+            os.remove(path )
+            return path 
+        
+        with mock.patch.object(cacheutils, '_lookup', evicted_lookup ): 
+            cdata = cacheutils.cached_read(pd.read_excel, f, cache =True, 
+                                           cache_dir = cache_dir )
+        self.assertTrue(cdata.equals(data))
+        self.assertEqual(cacheutils.cache_info(cache_dir)['entries'], 1)
+        # a read-only cache directory 
+        with mock.patch.object(cacheutils.os, 'utime', 
+                               side_effect = PermissionError ), \
+            mock.patch.object(cacheutils.os, 'remove', 
+                              side_effect = PermissionError ): 
+            cdata = cacheutils.cached_read(pd.read_excel, f, cache =True, 
+                                           cache_dir = cache_dir )
+            self.assertTrue(cdata.equals(data))
+            self.assertEqual(cacheutils.clear_cache(cache_dir), 0 )
+        self.assertEqual(cacheutils.clear_cache(cache_dir), 1 )
+        
+    def test_header_resolver (self): 
+        """ Test the compiled header resolver of the properties."""
+        hl = ['pos', 'easting', 'north', 'rhoa', 'lat', 'longitud', 'date']
+        self.assertEqual(P.resolve(hl), ('station', 'easting', 'northing', 
+                        'resistivity', 'latitude', 'longitude', None))
+        self.assertListEqual(P(hl)(), ['station', 'easting', 'northing', 
+                        'resistivity', 'latitude', 'longitude'])
+        # the first property with a matching prefix wins 
+        self.assertEqual(P()._check_header_item('xpos'), 'station')
+        self.assertListEqual(P()(['AB/2', 'MN/2', 'SE1'], kind ='ves'), 
+                             ['AB', 'MN', 'resistivity'])
+        self.assertIsNone(P()(['foo', 'bar']))
+        
+        hits = _resolve_header.cache_info().hits 
+        for _ in range (10): 
+            P.resolve(hl)
+        self.assertEqual(_resolve_header.cache_info().hits, hits + 10 )
+        self.assertIs(P._header_regex(), P._header_regex())
+        
     def test_sanitize_collected_data (self) :
         """ Test the capability of the  func to  read and fetch data 
         straigthly from `csv` and `xlsx` and sanitize data to fit the 